@@ -0,0 +1,125 @@
+"""
+비동기 추천 API 벤치마크
+고정 지연을 주는 가짜 LLM/검색 도구로 arun_restaurant_recommendation을 동시 실행 수별로 실행하여
+동시 요청 수에 따라 처리량(분당 요청 수)이 늘어나는지 확인합니다. (API 키 불필요, 캐시는 끔)
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+os.environ.setdefault("SERPER_API_KEY", "benchmark")
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from crewai.llms.base_llm import BaseLLM
+
+from src.advanced_restaurant_system import AdvancedRestaurantSystem
+
+CURATED_ANSWER = """Thought: 평가 완료
+Final Answer: ### 1. **깡장집 본점**
+- 평점: 4.2
+- 가격대: 9,000원
+- 추천 이유: 반찬이 다양하고 가격이 합리적임"""
+
+
+class LatencyLLM(BaseLLM):
+    """호출마다 고정 시간 동안 대기한 뒤 같은 답변을 반환하는 가짜 LLM (네트워크 대기 흉내)"""
+
+    latency: float = 0.3
+
+    def __init__(self, latency: float):
+        super().__init__(model="benchmark-llm")
+        self.latency = latency
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, **kwargs):
+        time.sleep(self.latency)
+        return CURATED_ANSWER
+
+    def supports_function_calling(self):
+        return False
+
+    def supports_stop_words(self):
+        return False
+
+    def get_context_window_size(self):
+        return 8192
+
+
+class LatencySearch:
+    """고정 시간 동안 대기한 뒤 검색 결과를 반환하는 가짜 Serper 도구"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def run(self, search_query=None, **kwargs):
+        time.sleep(self.latency)
+        return {"organic": [{"title": f"{search_query}", "snippet": "깡장집 본점 평점 4.2", "link": "https://example.com"}]}
+
+
+def build_system(args) -> AdvancedRestaurantSystem:
+    """측정용 추천 시스템 (가짜 결과가 cache/의 저장소에 기록되지 않도록 캐시/저장소는 모두 끔)"""
+    system = AdvancedRestaurantSystem()
+    system.recommendation_cache = None
+    system.semantic_cache = None
+    system.research_snapshots = None
+    system.area_rankings = None
+    system.catalog = None
+    system.catalog_tool = None
+    system.search_tool.store = None
+    system.field_memo = None
+    system.candidate_enricher.memo = None
+    system.distance_resolver = None
+    system.llm = LatencyLLM(args.llm_latency)
+    system.search_tool.search_tool = LatencySearch(args.search_latency)
+    system.setup_agents()
+    system.setup_tasks()
+    return system
+
+
+async def run_level(system, concurrency: int, requests: int) -> float:
+    slots = asyncio.Semaphore(concurrency)
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+
+    async def one(index: int):
+        async with slots:
+            await system.arun_restaurant_recommendation(f"광화문 한식 맛집 {index}번째 요청")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비동기 추천 API 동시 실행 처리량 측정")
+    parser.add_argument("--requests", type=int, default=8, help="동시 실행 수별 요청 수")
+    parser.add_argument("--levels", default="1,2,4,8", help="비교할 동시 실행 수 (쉼표 구분)")
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="LLM 호출당 지연(초)")
+    parser.add_argument("--search-latency", type=float, default=0.1, help="검색 호출당 지연(초)")
+    args = parser.parse_args()
+
+    system = build_system(args)
+    results = []
+    for level in (int(value) for value in args.levels.split(",")):
+        # 크루 실행 로그는 숨기고 측정 결과만 출력
+        with open(os.devnull, "w", encoding="utf-8") as devnull, redirect_stdout(devnull):
+            elapsed = asyncio.run(run_level(system, level, args.requests))
+        results.append((level, elapsed))
+        print(f"동시 {level:>2}개: {args.requests}건 {elapsed:.2f}초, 분당 {args.requests / elapsed * 60:.1f}건")
+
+    baseline = results[0][1]
+    print("처리량 배율: " + ", ".join(f"동시 {level}개 x{baseline / elapsed:.2f}" for level, elapsed in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+큐레이션 묶음 처리 벤치마크
+고정 호출 지연 + 토큰당 처리 시간 + 분당 호출 제한을 흉내 낸 가짜 LLM으로
+요청별 개별 큐레이션과 묶음 큐레이션의 처리량(분당 요청 수)을 비교합니다.
+"""
+
+import sys
+import time
+import argparse
+import threading
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.curation_packer import CurationPacker, build_packed_prompt
+
+# 큐레이션 작업의 공통 지시문 (평가 기준 설명) 분량을 흉내 낸 텍스트
+INSTRUCTIONS = "리서처가 수집한 맛집 정보를 평가 기준에 따라 점수화하고 상위 3-5개를 선별하세요.\n" * 20
+RESEARCH_TEXT = "[맛집] 테스트 식당 | 평점 4.3 | 가격 1-2만원 | 주소 서울 종로구 | 대표 메뉴 김치찌개\n" * 5
+
+
+class FakeLLM:
+    """호출마다 고정 지연과 토큰 비례 지연을 주고, 분당 호출 수를 제한하는 가짜 LLM"""
+
+    def __init__(self, call_latency: float, seconds_per_1k_chars: float, calls_per_minute: int):
+        self.call_latency = call_latency
+        self.seconds_per_1k_chars = seconds_per_1k_chars
+        self.min_interval = 60.0 / calls_per_minute
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def _wait_for_slot(self):
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+            self.calls += 1
+        time.sleep(max(0.0, slot - time.time()))
+
+    def call(self, prompt: str) -> str:
+        self._wait_for_slot()
+        count = prompt.count("=== 요청 ") or 1
+        answer = "\n".join(f"=== 결과 {n} ===\n**[1위] 테스트 식당**\n점수: 87\n추천 이유: 평점이 높음" for n in range(1, count + 1))
+        time.sleep(self.call_latency + (len(prompt) + len(answer)) / 1000 * self.seconds_per_1k_chars)
+        return answer if count > 1 else answer.split("\n", 1)[1]
+
+
+def run(packed: bool, args) -> dict:
+    llm = FakeLLM(args.call_latency, args.seconds_per_1k_chars, args.calls_per_minute)
+    packer = CurationPacker(llm.call, INSTRUCTIONS, max_batch=args.max_batch, window_seconds=args.window)
+
+    def curate(index: int):
+        user_request = f"요청 {index}: 종로 한식 맛집"
+        with packer.request():
+            # 리서치 단계 (이 동안 진행 중인 다른 요청이 있으면 큐레이션을 묶을 수 있음)
+            time.sleep(args.research_latency)
+            if packed and packer.submit(user_request, RESEARCH_TEXT) is not None:
+                return
+        llm.call(build_packed_prompt(INSTRUCTIONS, [SimpleNamespace(user_request=user_request, research_text=RESEARCH_TEXT)]))
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(curate, range(args.requests)))
+    elapsed = time.time() - start
+    return {"elapsed": elapsed, "calls": llm.calls, "per_minute": args.requests / elapsed * 60,
+            "stats": packer.get_stats()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="큐레이션 묶음 처리 처리량 비교")
+    parser.add_argument("--requests", type=int, default=24, help="요청 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 실행 수")
+    parser.add_argument("--max-batch", type=int, default=4, help="한 번에 묶을 최대 요청 수")
+    parser.add_argument("--window", type=float, default=0.2, help="묶음 대기 시간(초)")
+    parser.add_argument("--research-latency", type=float, default=0.3, help="큐레이션 전 리서치 단계 시간(초)")
+    parser.add_argument("--call-latency", type=float, default=0.5, help="호출당 고정 지연(초)")
+    parser.add_argument("--seconds-per-1k-chars", type=float, default=0.05, help="1000자당 처리 시간(초)")
+    parser.add_argument("--calls-per-minute", type=int, default=60, help="분당 호출 제한")
+    args = parser.parse_args()
+
+    for label, packed in (("개별 큐레이션", False), ("묶음 큐레이션", True)):
+        result = run(packed, args)
+        print(f"{label}: {result['elapsed']:.2f}초, LLM 호출 {result['calls']}회, "
+              f"분당 {result['per_minute']:.1f}건" + (f", {result['stats']}" if packed else ""))
+
+
+if __name__ == "__main__":
+    main()
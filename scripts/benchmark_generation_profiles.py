@@ -0,0 +1,96 @@
+"""
+에이전트별 생성 프로필 벤치마크
+프로필(config.json의 generation_settings.profiles)마다 각 에이전트의 대표 프롬프트를 LLM으로 실행하여
+응답 시간과 출력 토큰 수를 비교합니다. 출력 길이와 속도 사이에서 max_tokens를 조정하는 데 사용합니다.
+--fake 옵션은 API 호출 없이 '고정 지연 + 토큰당 생성 시간' 모델로 측정합니다.
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.config_manager import load_config
+from src.generation_profiles import GenerationProfiles, AGENT_NAMES
+from src.research_compactor import estimate_tokens
+
+# 에이전트별 대표 프롬프트 (실제 작업과 비슷한 분량의 출력을 요구)
+AGENT_PROMPTS = {
+    "researcher": "광화문 근처 3만원 이하 한식 맛집 5곳의 이름, 주소, 전화번호, 평점, 가격대, 대표 메뉴, 영업시간을 정리하세요.",
+    "research_synthesizer": "다음 검색 결과로 맛집 5곳의 정보를 정리하세요: 깡장집 본점 평점 4.2 가격 9,000원 서울 종로구 새문안로 35 / "
+                            "토속촌 평점 4.5 가격 20,000원 서울 종로구 자하문로5길 5 / 청진옥 평점 4.3 가격 12,000원",
+    "curator": "맛집 5곳(깡장집 본점 4.2점 9천원, 토속촌 4.5점 2만원, 청진옥 4.3점 1.2만원, 광화문 국밥 4.1점 1만원, "
+               "이문설농탕 4.4점 1.3만원)을 평점 40%, 가격 30%, 거리 20%, 리뷰 10% 기준으로 점수화하고 상위 3곳의 강점, 약점, 추천 이유를 쓰세요.",
+    "communicator": "큐레이터가 선별한 맛집 3곳(토속촌, 이문설농탕, 청진옥)을 사용자에게 친절한 추천 보고서로 작성하세요.",
+    "form_creator": "추천 맛집 3곳(토속촌, 이문설농탕, 청진옥)에 대한 만족도 설문 항목을 JSON 형식으로 설계하세요.",
+    "email_sender": "설문조사 링크 https://forms.gle/example 참여를 부탁하는 이메일 제목과 본문을 작성하세요.",
+    "data_analyst": "설문 응답 25건(토속촌 12표 4.2점, 이문설농탕 8표 3.8점, 청진옥 5표 4.0점)을 분석하고 인사이트를 정리하세요.",
+}
+
+# --fake: 제한이 없을 때 에이전트가 생성하는 토큰 수 (대략적인 관측치)
+NATURAL_OUTPUT_TOKENS = {
+    "researcher": 1400, "research_synthesizer": 1100, "curator": 1000, "communicator": 1300,
+    "form_creator": 900, "email_sender": 700, "data_analyst": 1200,
+}
+
+
+class FakeGenerationLLM:
+    """max_tokens까지만 생성하는 것으로 가정하고 '고정 지연 + 토큰당 시간'만큼 대기하는 가짜 LLM"""
+
+    def __init__(self, agent_name: str, settings: dict, call_latency: float, seconds_per_token: float):
+        self.tokens = min(NATURAL_OUTPUT_TOKENS[agent_name], settings.get("max_tokens") or 10 ** 6)
+        self.call_latency = call_latency
+        self.seconds_per_token = seconds_per_token
+
+    def call(self, messages):
+        time.sleep(self.call_latency + self.tokens * self.seconds_per_token)
+        return "가" * int(self.tokens * 1.5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="에이전트별 생성 프로필의 응답 시간 비교")
+    parser.add_argument("--profiles", default=None, help="비교할 프로필 (쉼표 구분, 기본: 설정된 모든 프로필)")
+    parser.add_argument("--agents", default=",".join(AGENT_NAMES), help="측정할 에이전트 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=1, help="에이전트별 반복 횟수")
+    parser.add_argument("--fake", action="store_true", help="API 호출 없이 가짜 LLM으로 측정")
+    parser.add_argument("--call-latency", type=float, default=0.3, help="--fake 호출당 고정 지연(초)")
+    parser.add_argument("--seconds-per-token", type=float, default=0.002, help="--fake 토큰당 생성 시간(초)")
+    args = parser.parse_args()
+
+    config = load_config()
+    if not config:
+        return
+    system_settings = config.get_system_settings()
+    if system_settings.get("llm_provider", "gemini") == "gemini":
+        model = f"gemini/{system_settings.get('llm_model', 'gemini-2.0-flash')}"
+    else:
+        model = system_settings.get("llm_model", "gpt-3.5-turbo")
+    profiles = GenerationProfiles.from_config(config.get("generation_settings", {}) or {}, system_settings)
+    profile_names = args.profiles.split(",") if args.profiles else list(profiles.profiles)
+
+    print(f"모델: {'가짜 LLM' if args.fake else model}")
+    print(f"{'프로필':<10} {'에이전트':<22} {'max_tokens':>10} {'temp':>5} {'응답 시간':>9} {'출력 토큰':>9}")
+    for profile in profile_names:
+        total = 0.0
+        for agent_name in args.agents.split(","):
+            settings = profiles.settings_for(agent_name, profile)
+            llm = (FakeGenerationLLM(agent_name, settings, args.call_latency, args.seconds_per_token) if args.fake
+                   else profiles.build_llm(model, agent_name, profile))
+            latencies, tokens = [], []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                output = llm.call([{"role": "user", "content": AGENT_PROMPTS[agent_name]}])
+                latencies.append(time.perf_counter() - start)
+                tokens.append(estimate_tokens(str(output)))
+            latency = sum(latencies) / len(latencies)
+            total += latency
+            print(f"{profile:<10} {agent_name:<22} {settings.get('max_tokens', '-'):>10} "
+                  f"{settings.get('temperature', '-'):>5} {latency:>8.2f}초 {sum(tokens) // len(tokens):>9}")
+        print(f"{profile:<10} {'합계':<22} {'':>10} {'':>5} {total:>8.2f}초")
+
+
+if __name__ == "__main__":
+    main()
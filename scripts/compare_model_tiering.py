@@ -0,0 +1,282 @@
+"""
+에이전트 모델 라우팅 계획 비교
+고정된 추천 요청 목록을 모델 라우팅 계획(config.json의 model_routing.plans)마다 실행하여
+응답 시간, 토큰 사용량, 기준 계획과의 결과 일치도를 비교합니다.
+- 추천 파이프라인: 요청별 응답 시간, 에이전트 토큰, 추천 맛집 목록의 일치도(자카드, 1위 일치)
+- 단순 작업 에이전트(보고서/설문/이메일): 대표 프롬프트의 응답 시간, 토큰, 기준 출력과의 텍스트 유사도
+결과가 계획 순서에 영향받지 않도록 추천/검색 캐시, 카탈로그, 필드 메모, 지오코딩, 웜 스타트는 끕니다.
+기본 보고서 작성 방식(template)에서는 커뮤니케이터 LLM이 호출되지 않아 계획 간 차이가 드러나지 않으므로,
+추천 파이프라인 비교는 커뮤니케이터 LLM이 보고서를 작성하는 llm 방식으로 실행합니다.
+--fake 옵션은 API 호출 없이 '기본 모델보다 가벼운 모델은 빠르다'는 가정의 가짜 LLM으로 실행합니다.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import difflib
+from contextlib import redirect_stdout
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.batch_runner import _percentile, load_batch_requests
+
+# 기본 비교 요청 (요청 유형별로 하나씩)
+DEFAULT_REQUESTS = [
+    "광화문 근처 3만원 이하 한식 맛집 추천해줘",
+    "강남역 회식하기 좋은 고기집",
+    "홍대 혼밥하기 좋은 일식집",
+    "여의도 점심 파스타 맛집, 1인 2만원 이하",
+    "성수동 분위기 좋은 카페 겸 브런치",
+]
+
+# 단순 작업 에이전트의 대표 프롬프트
+STAGE_PROMPTS = {
+    "communicator": "큐레이터가 선별한 맛집 3곳(토속촌 4.5점 2만원, 이문설농탕 4.4점 1.3만원, 청진옥 4.3점 1.2만원)을 "
+                    "사용자에게 친절한 추천 보고서로 작성하세요.",
+    "form_creator": "추천 맛집 3곳(토속촌, 이문설농탕, 청진옥)에 대한 만족도 설문 항목을 JSON 형식으로 설계하세요.",
+    "email_sender": "설문조사 링크 https://forms.gle/example 참여를 부탁하는 이메일 제목과 본문을 작성하세요.",
+}
+
+FAKE_ANSWER = """Thought: 평가 완료
+Final Answer: ### 1. **깡장집 본점**
+- 평점: 4.2
+- 가격대: 9,000원
+- 추천 이유: 반찬이 다양하고 가격이 합리적임"""
+
+# 커뮤니케이터의 구조화된 보고서 (RecommendationOutput 형식)
+FAKE_REPORT = "Thought: 보고서 작성 완료\nFinal Answer: " + json.dumps({
+    "summary": "요청하신 조건에 맞는 맛집을 추천합니다.",
+    "restaurants": [{"rank": 1, "name": "깡장집 본점", "rating": "4.2", "price": "9,000원",
+                     "reason": "반찬이 다양하고 가격이 합리적임"}]
+}, ensure_ascii=False)
+
+
+def _jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(set(a) & set(b)) / len(set(a) | set(b))
+
+
+def _agent_tokens(system):
+    """추천 시스템 에이전트들이 지금까지 사용한 토큰 수 합계"""
+    agents = [system.researcher, system.research_synthesizer, system.curator, system.communicator,
+              system.form_creator, system.email_sender, system.data_analyst]
+    return sum(agent._token_process.get_summary().total_tokens for agent in agents)
+
+
+def example_plans():
+    """config_example.json의 모델 라우팅 계획 (config.json에 model_routing.plans가 없을 때 사용)"""
+    with open(PROJECT_ROOT / "config" / "config_example.json", "r", encoding="utf-8") as f:
+        return (json.load(f).get("model_routing", {}) or {}).get("plans") or {}
+
+
+def build_system(args):
+    """비교용 추천 시스템 (결과가 이전 실행에 영향받는 캐시/저장소는 끔)"""
+    from src.advanced_restaurant_system import AdvancedRestaurantSystem, config
+    from src.model_routing import ModelRouter
+
+    system = AdvancedRestaurantSystem()
+    # 비교는 model_routing.enabled와 관계없이 수행 (config.json에 계획이 없으면 예시 설정의 계획 사용)
+    routing_settings = config.get("model_routing", {}) or {}
+    system.model_router = ModelRouter.from_config(
+        {"plans": routing_settings.get("plans") or example_plans()}, config.get_system_settings()
+    )
+    system.recommendation_cache = None
+    system.semantic_cache = None
+    system.research_snapshots = None
+    system.area_rankings = None
+    system.catalog = None
+    system.catalog_tool = None
+    system.search_tool.store = None
+    system.field_memo = None
+    system.candidate_enricher.memo = None
+    system.distance_resolver = None
+    # 단순 작업 에이전트인 커뮤니케이터가 계획의 모델로 보고서를 작성하도록 템플릿 렌더링을 끔
+    system.report_renderer = None
+    if args.fake:
+        system.search_tool.search_tool = FakeSearch(args.search_latency)
+        system._agent_llm = lambda agent_name: make_fake_llm(system, agent_name, args)
+    return system
+
+
+def make_fake_llm(system, agent_name, args):
+    """계획의 모델이 기본 모델과 다르면(가벼운 모델) 지연 시간에 fast_ratio를 곱하는 가짜 LLM"""
+    from crewai.llms.base_llm import BaseLLM
+    from src.research_compactor import estimate_tokens
+
+    model = system.model_router.model_for(agent_name)
+    latency = args.llm_latency * (1.0 if model == system.model_router.default_model else args.fast_ratio)
+    answer = FAKE_REPORT if agent_name == "communicator" else FAKE_ANSWER
+
+    class FakeTierLLM(BaseLLM):
+        def call(self, messages, tools=None, callbacks=None, available_functions=None,
+                 from_task=None, from_agent=None, **kwargs):
+            time.sleep(latency)
+            prompt = messages if isinstance(messages, str) else "\n".join(str(m.get("content", "")) for m in messages)
+            # 실제 LLM처럼 토큰 사용량을 에이전트 토큰 집계 콜백에 전달
+            for callback in callbacks or []:
+                process = getattr(callback, "token_cost_process", None)
+                if process:
+                    process.sum_prompt_tokens(estimate_tokens(prompt))
+                    process.sum_completion_tokens(estimate_tokens(answer))
+                    process.sum_successful_requests(1)
+            return answer
+
+        def supports_function_calling(self):
+            return False
+
+        def supports_stop_words(self):
+            return False
+
+        def get_context_window_size(self):
+            return 8192
+
+    return FakeTierLLM(model=model)
+
+
+class FakeSearch:
+    """고정 시간 동안 대기한 뒤 검색 결과를 반환하는 가짜 Serper 도구"""
+
+    def __init__(self, latency):
+        self.latency = latency
+
+    def run(self, search_query=None, **kwargs):
+        time.sleep(self.latency)
+        return {"organic": [{"title": f"{search_query}", "snippet": "깡장집 본점 평점 4.2", "link": "https://example.com"}]}
+
+
+def run_plan(system, plan, requests):
+    """계획 하나로 추천 요청들과 단순 작업 프롬프트를 실행하고 요청/에이전트별 측정값을 반환합니다."""
+    from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+    from crewai.utilities.token_counter_callback import TokenCalcHandler
+    from src.entity_resolution import canonical_name
+
+    system.model_router.select(plan)
+    system.setup_agents()
+    system.setup_tasks()
+
+    results = {"requests": {}, "stages": {}}
+    for item in requests:
+        before = _agent_tokens(system)
+        start = time.perf_counter()
+        try:
+            with open(os.devnull, "w", encoding="utf-8") as devnull, redirect_stdout(devnull):
+                system.run_restaurant_recommendation(item["request"])
+            error = None
+        except Exception as e:
+            error = str(e)
+        results["requests"][item["id"]] = {
+            "latency": time.perf_counter() - start,
+            "tokens": _agent_tokens(system) - before,
+            "names": [canonical_name(r.name) for r in system.recommended_restaurants] if not error else [],
+            "error": error,
+        }
+
+    for agent_name, prompt in STAGE_PROMPTS.items():
+        llm = getattr(system, agent_name).llm
+        process = TokenProcess()
+        start = time.perf_counter()
+        try:
+            output, error = str(llm.call([{"role": "user", "content": prompt}], callbacks=[TokenCalcHandler(process)])), None
+        except Exception as e:
+            output, error = "", str(e)
+        results["stages"][agent_name] = {
+            "model": system.model_router.model_for(agent_name),
+            "latency": time.perf_counter() - start,
+            "tokens": process.get_summary().total_tokens,
+            "output": output,
+            "error": error,
+        }
+    return results
+
+
+def summarize(plan, results, baseline):
+    """계획의 측정값을 기준 계획과 비교하여 요약합니다."""
+    requests = results["requests"]
+    latencies = [r["latency"] for r in requests.values() if not r["error"]]
+    compared = [(r["names"], baseline["requests"][key]["names"]) for key, r in requests.items()
+                if not r["error"] and not baseline["requests"][key]["error"]]
+    return {
+        "plan": plan,
+        "succeeded": len(latencies),
+        "failed": len(requests) - len(latencies),
+        "latency_mean_seconds": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        "latency_p95_seconds": round(_percentile(latencies, 0.95), 3),
+        "tokens": sum(r["tokens"] for r in requests.values()),
+        "agreement_jaccard": round(sum(_jaccard(a, b) for a, b in compared) / len(compared), 3) if compared else 0.0,
+        "agreement_top1": round(sum(bool(a) and a[:1] == b[:1] for a, b in compared) / len(compared), 3) if compared else 0.0,
+        "stages": {
+            agent_name: {
+                "model": stage["model"],
+                "latency_seconds": round(stage["latency"], 3),
+                "tokens": stage["tokens"],
+                "similarity": round(difflib.SequenceMatcher(
+                    None, stage["output"], baseline["stages"][agent_name]["output"]).ratio(), 3),
+                "error": stage["error"],
+            }
+            for agent_name, stage in results["stages"].items()
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="에이전트 모델 라우팅 계획별 응답 시간/토큰/결과 일치도 비교")
+    parser.add_argument("--plans", default=None, help="비교할 계획 (쉼표 구분, 첫 번째가 기준, 기본: 설정된 모든 계획)")
+    parser.add_argument("--requests", default=None, help="요청 JSONL 파일 (기본: 내장 요청 5개)")
+    parser.add_argument("--output", default=None, help="요약을 저장할 JSON 파일")
+    parser.add_argument("--fake", action="store_true", help="API 호출 없이 가짜 LLM/검색으로 실행")
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="--fake 기본 모델의 호출당 지연(초)")
+    parser.add_argument("--fast-ratio", type=float, default=0.4, help="--fake 가벼운 모델의 지연 비율")
+    parser.add_argument("--search-latency", type=float, default=0.1, help="--fake 검색 지연(초)")
+    args = parser.parse_args()
+
+    if args.fake:
+        for key in ("GEMINI_API_KEY", "OPENAI_API_KEY", "SERPER_API_KEY"):
+            os.environ.setdefault(key, "benchmark")
+        os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+        os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+    if args.requests:
+        requests = [item for item in load_batch_requests(args.requests) if not item.get("error")]
+    else:
+        requests = [{"id": f"request-{number}", "request": text} for number, text in enumerate(DEFAULT_REQUESTS, 1)]
+
+    system = build_system(args)
+    plans = args.plans.split(",") if args.plans else list(system.model_router.plans)
+    unknown = [plan for plan in plans if plan not in system.model_router.plans]
+    if unknown:
+        print(f"❌ 모델 라우팅 계획이 없습니다: {', '.join(unknown)} "
+              f"(사용 가능: {', '.join(system.model_router.plans)}, config.json의 model_routing.plans에 추가)")
+        return
+
+    runs = {}
+    for plan in plans:
+        print(f"▶️ {plan}: {len(requests)}개 요청 실행 중...")
+        runs[plan] = run_plan(system, plan, requests)
+    summaries = [summarize(plan, runs[plan], runs[plans[0]]) for plan in plans]
+
+    print(f"\n기준 계획: {plans[0]} (요청 {len(requests)}개, 보고서 작성: 커뮤니케이터 LLM)")
+    print(f"{'계획':<14} {'성공':>4} {'평균':>8} {'p95':>8} {'토큰':>8} {'자카드':>6} {'1위 일치':>8}")
+    for summary in summaries:
+        print(f"{summary['plan']:<14} {summary['succeeded']:>4} {summary['latency_mean_seconds']:>7.2f}초 "
+              f"{summary['latency_p95_seconds']:>7.2f}초 {summary['tokens']:>8} "
+              f"{summary['agreement_jaccard']:>6.2f} {summary['agreement_top1']:>8.2f}")
+    print(f"\n{'계획':<14} {'에이전트':<14} {'모델':<28} {'응답 시간':>9} {'토큰':>6} {'유사도':>6}")
+    for summary in summaries:
+        for agent_name, stage in summary["stages"].items():
+            status = f" ⚠️ {stage['error']}" if stage["error"] else ""
+            print(f"{summary['plan']:<14} {agent_name:<14} {stage['model']:<28} {stage['latency_seconds']:>8.2f}초 "
+                  f"{stage['tokens']:>6} {stage['similarity']:>6.2f}{status}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"baseline": plans[0], "requests": len(requests), "plans": summaries}, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 요약 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,18 +10,23 @@ import time
 import sys
 import io
 import re
+import math
+import copy
+import asyncio
 import smtplib
+import argparse
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from contextlib import redirect_stdout, redirect_stderr
+from contextlib import contextmanager, nullcontext, redirect_stdout, redirect_stderr
 
-from crewai import Agent, Task, Crew, Process
-from crewai_tools import SerperDevTool, CodeInterpreterTool
+from crewai import Agent, Task, Crew
+from crewai_tools import CodeInterpreterTool
 # WebsiteSearchTool은 OpenAI를 내부적으로 사용하므로 Gemini 환경에서는 제외
 from langchain_google_genai import ChatGoogleGenerativeAI
 
@@ -41,6 +46,32 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config_manager import load_config
 from src.logging_manager import get_logging_manager
+from src.recommendation_cache import RecommendationCache
+from src.semantic_cache import SemanticRecommendationCache
+from src.search_tools import CachedSerperDevTool, LocalCatalogSearchTool
+from src.restaurant_catalog import RestaurantCatalog
+from src.area_rankings import AreaRankingStore
+from src.geo_index import GeocodeCache, DistanceResolver
+from src.entity_resolution import EntityResolver
+from src.field_memo import FieldMemo
+from src.research_planner import ParallelSearchPlanner
+from src.research_pipeline import CandidateEnricher, parse_candidate_names
+from src.curator_scoring import CuratorScoringEngine
+from src.research_compactor import ResearchCompactor, CURATION_FIELDS
+from src.research_snapshots import ResearchSnapshotStore
+from src.report_renderer import ReportRenderer, CURATION_OUTPUT_FORMAT
+from src.recommendation_stream import StreamRelay, TokenStream
+from src.batch_runner import BatchRunner, load_batch_requests
+from src.curation_packer import CurationPacker
+from src.research_monitor import ResearchCompletenessMonitor
+from src.generation_profiles import GenerationProfiles
+from src.model_routing import ModelRouter, model_string
+from src.crew_registry import CrewRegistry, process_stats as crew_process_stats
+from src.request_intent import parse_request_intent, intent_cache_key
+from src.restaurant_models import (
+    Restaurant, RecommendationOutput, restaurants_from_output, parse_recommendation_markdown,
+    render_recommendations, summarize_restaurants
+)
 
 # 설정 로딩 (config_manager가 자동으로 환경 변수를 설정함)
 config = load_config()
@@ -59,8 +90,21 @@ class AdvancedRestaurantSystem:
             "features": ["restaurant_recommendation", "survey_creation", "email_sending", "data_analysis"]
         })
         
-        # 도구 설정
-        self.search_tool = SerperDevTool()
+        # 도구 설정 (검색 결과 캐시 및 후처리 적용)
+        self.search_tool = CachedSerperDevTool.from_config(
+            config.get("cache_settings.search", {}) or {},
+            config.get("search_filter_settings", {}) or {},
+            logger=self.logger
+        )
+        
+        # 로컬 맛집 카탈로그 (이전 추천 결과를 먼저 조회하고 없거나 오래된 정보만 웹 검색)
+        catalog_settings = config.get("catalog_settings", {}) or {}
+        if catalog_settings.get("enabled", True):
+            self.catalog = RestaurantCatalog.from_config(catalog_settings)
+            self.catalog_tool = LocalCatalogSearchTool(self.catalog, max_results=catalog_settings.get("max_results", 8))
+        else:
+            self.catalog = None
+            self.catalog_tool = None
         # WebsiteSearchTool은 OpenAI를 사용하므로 제거 (Gemini 사용 시)
         # self.web_search_tool = WebsiteSearchTool()
         
@@ -78,11 +122,136 @@ class AdvancedRestaurantSystem:
         
         if llm_provider == "gemini":
             # Gemini 사용 - LiteLLM 형식으로 설정
-            self.llm = f"gemini/{system_settings.get('llm_model', 'gemini-2.0-flash')}"
+            self.llm = model_string(llm_provider, system_settings.get("llm_model", "gemini-2.0-flash"))
         else:
             # OpenAI 사용
             self.llm = system_settings.get("llm_model", "gpt-3.5-turbo")
         
+        # 에이전트별 모델 라우팅 (단순 작업 에이전트는 가벼운 모델 사용)
+        model_routing_settings = config.get("model_routing", {}) or {}
+        if model_routing_settings.get("enabled", True):
+            self.model_router = ModelRouter.from_config(model_routing_settings, system_settings)
+            self.logger.logger.info(f"🧭 에이전트 모델 라우팅: {self.model_router.active_plan}")
+        else:
+            self.model_router = None
+        
+        # 에이전트별 생성 프로필 (최대 출력 토큰, temperature, stop 시퀀스)
+        generation_settings = config.get("generation_settings", {}) or {}
+        if generation_settings.get("enabled", True):
+            self.generation_profiles = GenerationProfiles.from_config(generation_settings, system_settings)
+            self.logger.logger.info(f"🎛️ 에이전트 생성 프로필: {self.generation_profiles.active_profile}")
+        else:
+            self.generation_profiles = None
+        
+        # 추천 결과 캐시 (정규화된 요청 기준)
+        cache_settings = config.get("cache_settings.recommendation", {}) or {}
+        if cache_settings.get("enabled", True):
+            self.recommendation_cache = RecommendationCache.from_config(cache_settings, key_fn=intent_cache_key)
+        else:
+            self.recommendation_cache = None
+        
+        # 유사 요청 캐시 (로컬 벡터 인덱스)
+        semantic_settings = config.get("cache_settings.semantic", {}) or {}
+        if semantic_settings.get("enabled", True):
+            self.semantic_cache = SemanticRecommendationCache.from_config(semantic_settings)
+        else:
+            self.semantic_cache = None
+        
+        # 리서치 방식 설정
+        # agent: LLM이 도구 호출, fanout: 검색 쿼리 동시 실행 후 한 번에 전달,
+        # two_phase: 후보 발굴 후 후보별 상세 정보 동시 수집
+        self.research_settings = config.get("research_settings", {}) or {}
+        self.search_planner = ParallelSearchPlanner.from_config(self.research_settings)
+        # 필드별 유효 기간 메모 (알고 있는 맛집은 만료된 필드만 다시 검색)
+        restaurant_settings = config.get_restaurant_settings()
+        if (restaurant_settings.get("field_memo", {}) or {}).get("enabled", True):
+            self.field_memo = FieldMemo.from_config(restaurant_settings)
+        else:
+            self.field_memo = None
+        self.candidate_enricher = CandidateEnricher.from_config(self.research_settings, memo=self.field_memo)
+        
+        # 큐레이션 방식 설정 (llm: 큐레이터 LLM이 순위 결정, local: 점수화 엔진이 순위 결정)
+        self.curation_settings = config.get("curation_settings", {}) or {}
+        self.scoring_engine = CuratorScoringEngine.from_config(config.get_restaurant_settings())
+        
+        # 지오코딩 캐시 + 거리 계산 (점수화 엔진의 거리 기준, 반경 조건)
+        geo_settings = config.get("geo_settings", {}) or {}
+        if geo_settings.get("enabled", True):
+            self.distance_resolver = DistanceResolver(GeocodeCache.from_config(geo_settings))
+        else:
+            self.distance_resolver = None
+        
+        # 지역별 순위 뷰 (카탈로그 기반, 일치하는 요청은 리서치/큐레이션 생략)
+        ranking_settings = config.get("ranking_settings", {}) or {}
+        if self.catalog and ranking_settings.get("enabled", True):
+            self.area_rankings = AreaRankingStore.from_config(
+                ranking_settings, self.catalog, self.scoring_engine, self.distance_resolver
+            )
+            self.area_rankings.refresh_all()
+        else:
+            self.area_rankings = None
+        
+        # 같은 맛집의 변형 표기 중복 제거 (후보 발굴, 상세 정보, 압축, 최종 목록)
+        resolution_settings = config.get("entity_resolution_settings", {}) or {}
+        if resolution_settings.get("enabled", True):
+            self.entity_resolver = EntityResolver.from_config(resolution_settings)
+        else:
+            self.entity_resolver = None
+        
+        # 에이전트 간 전달 텍스트 압축 설정
+        compaction_settings = config.get("compaction_settings", {}) or {}
+        if compaction_settings.get("enabled", True):
+            self.compactors = {
+                "research": ResearchCompactor.from_config(compaction_settings, stage="research",
+                                                          resolver=self.entity_resolver),
+                "curation": ResearchCompactor.from_config(compaction_settings, stage="curation",
+                                                          resolver=self.entity_resolver),
+            }
+        else:
+            self.compactors = {}
+        
+        # 리서처 조기 종료 (주소/평점/가격 등을 갖춘 후보가 목표 수에 도달하면 남은 검색 반복 생략)
+        early_termination_settings = self.research_settings.get("early_termination", {}) or {}
+        if early_termination_settings.get("enabled", True):
+            self.search_tool.monitor = ResearchCompletenessMonitor.from_config(
+                early_termination_settings,
+                ResearchCompactor.from_config(compaction_settings, stage="research", resolver=self.entity_resolver)
+            )
+        
+        # 추천 보고서 작성 방식 (template: 큐레이션 결과를 템플릿으로 렌더링, llm: 커뮤니케이터 LLM 작성)
+        report_settings = config.get("report_settings", {}) or {}
+        if report_settings.get("mode", "template") == "template":
+            self.report_renderer = ReportRenderer(
+                ResearchCompactor.from_config(compaction_settings, stage="curation", resolver=self.entity_resolver),
+                max_recommendations=self.scoring_engine.max_recommendations
+            )
+        else:
+            self.report_renderer = None
+        # 압축 전 큐레이션 결과 원문 (템플릿 렌더링에 사용)
+        self._last_curation_output = None
+        # 스트리밍 실행 중인 경우의 토큰 릴레이 (추천 마지막 단계 작업의 토큰 전달)
+        self._stream_relay = None
+        
+        # 일괄 추천 실행 설정 (동시 실행 수)
+        self.batch_settings = config.get("batch_settings", {}) or {}
+        # 동시 요청의 큐레이션 묶음 처리기 (curation_settings.packing, setup_tasks에서 생성하여 워커와 공유)
+        self.curation_packer = None
+        # 묶음 큐레이션 호출용 큐레이터 LLM (묶는 요청 수만큼 최대 출력 토큰을 늘림)
+        self._packed_curator_llm = None
+        
+        # 리서치 웜 스타트 (최근 조사한 지역은 알려진 후보를 주고 새 후보/변경 정보만 조사)
+        warm_start_settings = config.get("warm_start_settings", {}) or {}
+        if self.catalog and warm_start_settings.get("enabled", True):
+            self.research_snapshots = ResearchSnapshotStore.from_config(
+                warm_start_settings, self.catalog,
+                ResearchCompactor.from_config(compaction_settings, stage="research", resolver=self.entity_resolver)
+            )
+        else:
+            self.research_snapshots = None
+        # 현재 실행 중인 리서치의 요청 의도와 웜 스타트 후보 (리서치 작업 콜백에서 사용)
+        self._research_intent = None
+        self._warm_start_candidates = None
+        
         # Task ID 추적
         self.current_task_id = None
         self.task_start_time = None
@@ -90,11 +259,17 @@ class AdvancedRestaurantSystem:
         # CrewAI verbose 출력을 로그 파일로 리다이렉트하기 위한 핸들러 설정
         self._setup_crewai_logging()
         
+        # 비동기 API용 유휴 워커 (워커의 크루를 다음 호출에서 재사용)
+        self._idle_workers: List["AdvancedRestaurantSystem"] = []
+        self._worker_lock = threading.Lock()
+        
         self.setup_agents()
         self.setup_tasks()
-        self.setup_crew()
+        # 전체 에이전트 크루(setup_crew)는 사용되지 않으므로 시작 시 만들지 않음 (단계별 크루는 crew_registry에서 필요할 때 생성)
         self.survey_data = {}
         self.email_recipients = []
+        # 마지막 추천 결과 (설문 폼, 이메일, 분석 단계에 그대로 전달)
+        self.recommended_restaurants: List[Restaurant] = []
         
         # 에이전트 간 통신 추적을 위한 변수
         self.agent_communication_log = []
@@ -225,6 +400,59 @@ class AdvancedRestaurantSystem:
         self.logger.logger.info(f"   {output_data[:300]}...")
         self.logger.logger.info("🔧" + "=" * 58)
     
+    def _compact_text(self, stage: str, text: str) -> str:
+        """단계별 압축기로 다음 에이전트에게 전달할 텍스트를 압축하고 토큰 수를 기록합니다."""
+        compactor = self.compactors.get(stage)
+        if not compactor:
+            return text
+        compacted, stats = compactor.compact(text)
+        self.logger.log_compaction(stage, stats["input_tokens"], stats["output_tokens"], stats["candidates"])
+        return compacted
+    
+    def _compact_research_output(self, output):
+        """리서치 작업 콜백: 큐레이션 작업의 컨텍스트가 되는 출력을 압축합니다."""
+        if self.research_snapshots and self._research_intent:
+            # 다음 같은 지역 요청의 웜 스타트용 후보 집합 저장
+            self.research_snapshots.record_research(self._research_intent, output.raw)
+        output.raw = self._compact_text("research", output.raw)
+    
+    def _merge_research_delta(self, output):
+        """웜 스타트 리서치 작업 콜백: 새 후보/변경 정보를 알려진 후보에 병합하여 전체 후보를 큐레이터에게 전달합니다."""
+        merged, delta = self.research_snapshots.merge(
+            self._research_intent, self._warm_start_candidates, output.raw
+        )
+        self.logger.logger.info(
+            f"🔥 웜 스타트 병합: 알려진 후보 {len(self._warm_start_candidates)}개, "
+            f"새 후보 {len(delta['new'])}개, 변경 {len(delta['changed'])}개"
+        )
+        for name, fields in delta["changed"].items():
+            self.logger.logger.info(f"   - {name}: {', '.join(fields)}")
+        output.raw = self.research_snapshots.format_known(merged)
+    
+    def _call_curator_llm(self, prompt: str) -> str:
+        """큐레이터 에이전트의 역할 설명과 함께 LLM을 직접 호출합니다. (묶음 큐레이션용)"""
+        system_prompt = (f"You are {self.curator.role}. {self.curator.backstory}\n"
+                         f"Your personal goal is: {self.curator.goal}")
+        llm = self._packed_curator_llm or self.curator.llm
+        return str(llm.call([
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]))
+    
+    def _compact_curation_output(self, output):
+        """큐레이션 작업 콜백: 커뮤니케이션 작업의 컨텍스트가 되는 출력을 압축합니다."""
+        self._last_curation_output = output.raw
+        output.raw = self._compact_text("curation", output.raw)
+    
+    def _agent_llm(self, agent_name: str):
+        """에이전트별 모델과 생성 프로필을 적용한 LLM (모델 이름이 아닌 LLM 객체가 지정된 경우 그대로 사용)"""
+        if not isinstance(self.llm, str):
+            return self.llm
+        model = self.model_router.model_for(agent_name) if self.model_router else self.llm
+        if not self.generation_profiles:
+            return model
+        return self.generation_profiles.build_llm(model, agent_name)
+    
     def setup_agents(self):
         """6개의 전문 에이전트를 설정합니다."""
         
@@ -235,15 +463,33 @@ class AdvancedRestaurantSystem:
             backstory="""당신은 맛집 정보 수집의 전문가입니다. 
             웹 검색, 위치 정보, 맛집 API를 활용하여 사용자가 원하는 조건에 맞는 
             모든 관련 맛집 정보를 체계적으로 수집합니다.""",
-            tools=[self.search_tool],  # SerperDevTool만 사용 (Gemini 호환)
-            llm=self.llm,
+            tools=[self.catalog_tool, self.search_tool] if self.catalog_tool else [self.search_tool],
+            llm=self._agent_llm("researcher"),
             verbose=True,
             allow_delegation=False,
             max_iter=3  # 최대 반복 횟수 설정
         )
         self.logger.log_agent_creation("researcher", {
             "role": "맛집 정보 수집 전문가",
-            "tools": ["search_tool"]
+            "tools": ["catalog_tool", "search_tool"] if self.catalog_tool else ["search_tool"]
+        })
+        
+        # ①-b 리서치 정리 에이전트 - 미리 실행된 검색 결과만으로 한 번에 정리 (fanout 모드)
+        self.research_synthesizer = Agent(
+            role='맛집 정보 수집 전문가',
+            goal='미리 수집된 검색 결과를 바탕으로 맛집 정보를 정리하고 분석합니다',
+            backstory="""당신은 맛집 정보 수집의 전문가입니다. 
+            여러 검색 결과를 교차 확인하여 사용자가 원하는 조건에 맞는 
+            맛집 정보를 체계적으로 정리합니다.""",
+            tools=[],  # 검색은 시스템이 미리 동시 실행
+            llm=self._agent_llm("research_synthesizer"),
+            verbose=True,
+            allow_delegation=False,
+            max_iter=1
+        )
+        self.logger.log_agent_creation("research_synthesizer", {
+            "role": "맛집 정보 수집 전문가",
+            "tools": []
         })
         
         # ② 큐레이터 에이전트 (The Curator) - 기존
@@ -254,7 +500,7 @@ class AdvancedRestaurantSystem:
             사용자의 조건에 가장 적합한 식당을 선별하는 전문가입니다. 
             평점, 가격, 거리, 리뷰 품질 등을 종합적으로 평가하여 최적의 추천을 제공합니다.""",
             tools=[],  # 도구 없이 리서처의 정보만으로 분석 (Gemini 호환)
-            llm=self.llm,
+            llm=self._agent_llm("curator"),
             verbose=True,
             allow_delegation=False,
             max_iter=3
@@ -272,7 +518,7 @@ class AdvancedRestaurantSystem:
             커뮤니케이션 전문가입니다. 복잡한 정보를 간결하고 이해하기 쉽게 
             정리하여 사용자가 쉽게 결정할 수 있도록 도와줍니다.""",
             tools=[],
-            llm=self.llm,
+            llm=self._agent_llm("communicator"),
             verbose=True,
             allow_delegation=False,
             max_iter=3
@@ -296,7 +542,7 @@ class AdvancedRestaurantSystem:
             설문조사 항목을 설계합니다. 구글 폼 대신 간단한 설문조사 템플릿(HTML/JSON)을 생성합니다.
             실제 사용 가능한 설문 링크를 제공합니다.""",
             tools=form_creator_tools,
-            llm=self.llm,
+            llm=self._agent_llm("form_creator"),
             verbose=True,
             allow_delegation=False
         )
@@ -319,7 +565,7 @@ class AdvancedRestaurantSystem:
             이메일 제목, 본문, 서명 등을 포함한 완전한 이메일 템플릿을 제공합니다.
             실제 이메일 발송은 시스템에서 자동으로 처리됩니다.""",
             tools=email_sender_tools,
-            llm=self.llm,
+            llm=self._agent_llm("email_sender"),
             verbose=True,
             allow_delegation=False
         )
@@ -336,7 +582,7 @@ class AdvancedRestaurantSystem:
             설문조사 응답 데이터를 통계적으로 분석하고, 
             시각화를 통해 명확한 인사이트를 제공합니다.""",
             tools=[],
-            llm=self.llm,
+            llm=self._agent_llm("data_analyst"),
             verbose=True,
             allow_delegation=False
         )
@@ -348,12 +594,17 @@ class AdvancedRestaurantSystem:
     def setup_tasks(self):
         """각 에이전트의 작업을 정의합니다."""
         
+        # 카탈로그 도구가 있으면 먼저 조회하고 부족한 정보만 웹 검색하도록 안내
+        catalog_guide = """
+            - LocalCatalogSearchTool: 이전에 확인된 맛집 정보를 지역, 이름, 메뉴로 조회 (먼저 사용)
+            - 카탈로그에서 "오래됨" 또는 "정보 없음"으로 표시된 맛집/항목과 카탈로그에 없는 지역만 SerperDevTool로 검색하세요""" if self.catalog_tool else ""
+        
         # 기존 작업들 (리서처, 큐레이터, 커뮤니케이터)
         self.research_task = Task(
             description="""사용자 요청: {user_request}
             
             **사용 가능한 도구:**
-            - SerperDevTool: 웹 검색으로 맛집 정보, 리뷰, 평점, 메뉴, 가격, 영업시간 등을 검색
+            - SerperDevTool: 웹 검색으로 맛집 정보, 리뷰, 평점, 메뉴, 가격, 영업시간 등을 검색""" + catalog_guide + """
             
             **수집해야 할 정보:**
             1. 요청된 지역의 맛집 정보 (이름, 주소, 전화번호)
@@ -369,7 +620,67 @@ class AdvancedRestaurantSystem:
             
             수집된 정보를 구조화된 형태로 정리하여 다음 에이전트에게 전달하세요.""",
             agent=self.researcher,
-            expected_output="수집된 맛집 정보 (각 맛집당 이름, 주소, 전화번호, 평점, 가격대, 메뉴, 영업시간 포함)"
+            expected_output="수집된 맛집 정보 (각 맛집당 이름, 주소, 전화번호, 평점, 가격대, 메뉴, 영업시간 포함)",
+            callback=self._compact_research_output
+        )
+        
+        # 최근 조사한 지역: 알려진 후보를 제공하고 새 후보와 바뀐 정보만 조사 (warm_start_settings)
+        self.warm_research_task = Task(
+            description="""사용자 요청: {user_request}
+            
+            이 지역을 최근에 조사한 결과(이미 알고 있는 후보)입니다:
+            
+            {known_candidates}
+            
+            **작업:**
+            - 위 후보의 정보는 다시 수집하지 마세요
+            - SerperDevTool 검색은 한 번만 사용하여 위 목록에 없는 새 후보와 
+              정보(평점, 가격, 메뉴, 영업시간 등)가 바뀐 후보만 찾으세요
+            - 새 후보와 바뀐 후보만 "### 맛집명" 아래 "- 항목: 값" 형식으로 보고하세요
+            - 바뀐 후보는 바뀐 항목만 쓰고, 새로 찾은 정보가 없으면 "변경 없음"이라고만 답하세요""",
+            agent=self.researcher,
+            expected_output="새 후보와 바뀐 항목 목록 (없으면 \"변경 없음\")",
+            callback=self._merge_research_delta
+        )
+        
+        self.fanout_research_task = Task(
+            description="""사용자 요청: {user_request}
+            
+            시스템이 요청을 목적별 검색어(맛집 목록, 리뷰, 메뉴, 가격, 영업시간)로 나누어 
+            미리 동시에 검색한 결과입니다:
+            
+            {search_results}
+            
+            **수집해야 할 정보:**
+            1. 요청된 지역의 맛집 정보 (이름, 주소, 전화번호)
+            2. 각 맛집의 평점 및 리뷰 정보
+            3. 가격대 및 메뉴 정보 (대표 메뉴, 가격대)
+            4. 영업시간 및 특별 정보 (휴무일, 브레이크 타임 등)
+            
+            위 검색 결과만을 근거로 최소 3~5개의 맛집 정보를 정리하세요.
+            검색 결과에 없는 정보는 추측하지 말고 "정보 없음"으로 표시하세요.
+            
+            수집된 정보를 구조화된 형태로 정리하여 다음 에이전트에게 전달하세요.""",
+            agent=self.research_synthesizer,
+            expected_output="수집된 맛집 정보 (각 맛집당 이름, 주소, 전화번호, 평점, 가격대, 메뉴, 영업시간 포함)",
+            callback=self._compact_research_output
+        )
+        
+        self.discovery_task = Task(
+            description="""사용자 요청: {user_request}
+            
+            다음은 요청 지역의 맛집 목록 검색 결과입니다:
+            
+            {search_results}
+            
+            위 검색 결과에서 사용자 요청 조건에 맞는 후보 맛집의 이름만 골라 
+            최대 {max_candidates}개를 JSON 배열로 반환하세요.
+            
+            예시: ["깡장집 본점", "오빠닭 광화문점"]
+            
+            상세 정보(주소, 평점 등)는 다음 단계에서 수집하므로 이름만 반환하세요.""",
+            agent=self.research_synthesizer,
+            expected_output="후보 맛집 이름의 JSON 배열"
         )
         
         self.curation_task = Task(
@@ -387,29 +698,82 @@ class AdvancedRestaurantSystem:
             3. 각 맛집의 강점과 약점을 명시
             4. 왜 이 맛집을 추천하는지 구체적인 이유 작성
             
-            최종적으로 상위 3-5개의 맛집을 선별하고, 각각의 추천 이유를 명시하세요.""",
+            최종적으로 상위 3-5개의 맛집을 선별하고, 각각의 추천 이유를 명시하세요.
+            """ + CURATION_OUTPUT_FORMAT,
+            agent=self.curator,
+            expected_output="선별된 3-5개 맛집 리스트 (각 맛집당 점수, 강점, 약점, 추천 이유 포함)",
+            callback=self._compact_curation_output
+        )
+        
+        # 리서치 결과를 시스템이 직접 전달하는 경우의 큐레이션 작업 (two_phase 모드)
+        self.curation_with_research_task = Task(
+            description="""리서처가 수집한 맛집 정보:
+            
+            {research_results}
+            
+            """ + self.curation_task.description,
+            agent=self.curator,
+            expected_output=self.curation_task.expected_output,
+            callback=self._compact_curation_output
+        )
+        
+        # 동시에 들어온 two_phase 요청의 큐레이션을 LLM 한 번으로 묶어 처리 (평가 기준 설명은 한 번만 전송)
+        packing_settings = self.curation_settings.get("packing", {}) or {}
+        if packing_settings.get("enabled", False) and self.curation_packer is None:
+            curation_compactor = ResearchCompactor(fields=CURATION_FIELDS)
+            self.curation_packer = CurationPacker.from_config(
+                packing_settings,
+                call_fn=self._call_curator_llm,
+                instructions=self.curation_task.description,
+                validate=lambda text: bool(curation_compactor.extract_candidates(text))
+            )
+            curator_llm = self._agent_llm("curator")
+            if hasattr(curator_llm, "call"):
+                if getattr(curator_llm, "max_tokens", None):
+                    curator_llm.max_tokens *= self.curation_packer.max_batch
+                self._packed_curator_llm = curator_llm
+        
+        # 점수화 엔진이 정한 순위에 추천 이유만 작성하는 작업 (curation_settings.mode = local)
+        self.reason_task = Task(
+            description="""다음은 평가 기준 가중치(평점 40%, 가격 30%, 거리 20%, 리뷰 10%)에 따라 
+            점수화 엔진이 선별한 맛집 순위입니다:
+            
+            {scored_candidates}
+            
+            순위와 점수는 변경하지 말고, 각 맛집의 강점과 약점, 
+            왜 이 맛집을 추천하는지 구체적인 추천 이유만 작성하세요.
+            """ + CURATION_OUTPUT_FORMAT,
             agent=self.curator,
-            expected_output="선별된 3-5개 맛집 리스트 (각 맛집당 점수, 강점, 약점, 추천 이유 포함)"
+            expected_output="선별된 맛집 리스트 (각 맛집당 점수, 강점, 약점, 추천 이유 포함)",
+            callback=self._compact_curation_output
         )
         
         self.communication_task = Task(
             description="""큐레이터가 선별한 맛집 리스트를 사용자에게 친절하고 명확하게 전달하세요.
             
-            다음 형식으로 정리하세요:
-            🍽️ 추천 맛집 리스트
+            각 맛집마다 다음 정보를 정리하세요:
+            - 순위, 맛집명, 음식 종류
+            - 주소, 거리, 전화번호, 영업시간
+            - 평점, 가격대, 대표 메뉴
+            - 추천 이유: 왜 이 맛집을 추천하는지 간단한 설명
+            - 정보 출처 URL
             
-            [순위] [맛집명]
-            📍 주소: [주소]
-            💰 가격대: [가격대]
-            ⭐ 평점: [평점]
-            🕒 영업시간: [영업시간]
-            📞 전화번호: [전화번호]
+            확인되지 않은 정보는 빈 문자열로 두고, 사용자에게 전달할 한두 문장의 요약도 작성하세요.""",
+            agent=self.communicator,
+            expected_output="순위대로 정렬된 맛집 추천 결과 (맛집별 상세 정보와 추천 이유, 전체 요약 포함)",
+            output_pydantic=RecommendationOutput
+        )
+        
+        # 큐레이션 결과를 시스템이 직접 전달하는 경우의 커뮤니케이션 작업
+        self.communication_with_curation_task = Task(
+            description="""큐레이터가 선별한 맛집 리스트:
             
-            💡 추천 이유: [왜 이 맛집을 추천하는지 간단한 설명]
+            {curated_results}
             
-            각 맛집마다 위 형식으로 정리하여 최종 보고서를 작성하세요.""",
+            """ + self.communication_task.description,
             agent=self.communicator,
-            expected_output="사용자 친화적인 맛집 추천 보고서"
+            expected_output=self.communication_task.expected_output,
+            output_pydantic=RecommendationOutput
         )
         
         # 신규 작업들 (폼 생성, 이메일 발송, 데이터 분석)
@@ -476,7 +840,8 @@ class AdvancedRestaurantSystem:
             - 이메일은 친근하고 간결하게 작성하세요.
             
             의견 조사 링크: {survey_link}
-            이메일 수신자: {email_recipients}""",
+            이메일 수신자: {email_recipients}
+            선정된 장소: {restaurant_summary}""",
             agent=self.email_sender,
             expected_output="완전한 이메일 콘텐츠 (제목, 본문, 발송 정보 포함)"
         )
@@ -492,15 +857,21 @@ class AdvancedRestaurantSystem:
             5. 개선사항 키워드 분석
             
             분석 결과를 시각화(차트, 그래프)하고 인사이트를 도출하여 
-            최종 보고서를 작성하세요.""",
+            최종 보고서를 작성하세요.
+            
+            추천된 맛집: {recommended_restaurants}""",
             agent=self.data_analyst,
             expected_output="데이터 분석 결과 및 시각화 보고서"
         )
+        
+        # 단계별 크루는 처음 실행할 때 한 번 만들어 재사용 (에이전트/작업이 새로 만들어졌으므로 새 레지스트리)
+        self.crew_registry = CrewRegistry(logger=self.logger)
     
-    def setup_crew(self):
-        """에이전트들을 팀으로 구성합니다."""
-        self.crew = Crew(
-            agents=[
+    def setup_crew(self) -> Crew:
+        """에이전트들을 팀으로 구성합니다. (크루 레지스트리에 한 번만 생성)"""
+        self.crew = self.crew_registry.get(
+            "full",
+            [
                 self.researcher, 
                 self.curator, 
                 self.communicator,
@@ -508,61 +879,444 @@ class AdvancedRestaurantSystem:
                 self.email_sender,
                 self.data_analyst
             ],
-            tasks=[
+            [
                 self.research_task, 
                 self.curation_task, 
                 self.communication_task,
                 self.form_creation_task,
                 self.email_sending_task,
                 self.data_analysis_task
-            ],
-            process=Process.sequential,
-            verbose=True
+            ]
         )
+        return self.crew
     
     def set_email_recipients(self, recipients: List[str]):
         """이메일 수신자 목록을 설정합니다."""
         self.email_recipients = recipients
     
-    def run_restaurant_recommendation(self, user_request: str) -> str:
-        """맛집 추천을 실행합니다."""
+    def _run_search_fanout(self, user_request: str) -> str:
+        """요청을 검색 쿼리 묶음으로 나누어 동시에 검색하고, 결과를 프롬프트용 텍스트로 반환합니다."""
+        queries = self.search_planner.plan(user_request)
+        task_id = self.logger.log_task_start(
+            task_name="research_search_fanout",
+            agent_name="system",
+            input_data={"queries": [q["query"] for q in queries]}
+        )
+        start_time = time.time()
+        
+        results = self.search_planner.execute(
+            queries, lambda query: self.search_tool.run(search_query=query)
+        )
+        search_results = self.search_planner.format_results(results)
+        
+        execution_time = time.time() - start_time
+        sequential_time = sum(r.get("elapsed", 0) for r in results)
+        self.logger.log_task_response(task_id, search_results, {
+            "execution_time": execution_time,
+            "sequential_search_time": sequential_time,
+            "statuses": {r["query"]: r["status"] for r in results}
+        })
+        self.logger.log_task_completion(task_id, search_results, execution_time)
+        self.logger.logger.info(
+            f"⚡ 검색 {len(queries)}건 동시 실행 완료: {execution_time:.2f}초 (순차 실행 시 {sequential_time:.2f}초)"
+        )
+        return search_results
+    
+    def _run_two_phase_research(self, user_request: str):
+        """
+        후보 발굴(discovery) 후 후보별 상세 정보를 동시에 수집(enrichment)합니다.
+        후보 주소로 요청 위치로부터의 실제 거리를 계산하고,
+        요청 의도(예산, 거리, 음식 종류)에 맞지 않는 후보는 LLM에 전달하기 전에 제외하며,
+        (병합된 리서치 결과 텍스트, 점수화용 후보 목록)을 반환합니다.
+        """
+        search = lambda query: self.search_tool.run(search_query=query)
+        topic, _ = self.search_planner.extract_topic(user_request)
+        intent = parse_request_intent(user_request)
+        max_candidates = self.research_settings.get("max_candidates", 6)
+        origin = self.distance_resolver.origin(intent.area_alias) if self.distance_resolver else None
+        
+        # 1단계: 후보 발굴
+        discovery_id = self.logger.log_task_start(
+            task_name="research_discovery",
+            agent_name="research_synthesizer",
+            input_data={"user_request": user_request, "max_candidates": max_candidates}
+        )
+        start_time = time.time()
+        try:
+            if self.catalog and self.catalog.has_fresh_area(intent.area):
+                # 카탈로그에 최신 정보가 충분한 지역은 목록 검색 없이 카탈로그에서 후보를 고름
+                entries = self.catalog.area_entries(intent.area)
+                if origin and intent.radius_m:
+                    # 반경 조건은 카탈로그 좌표 인덱스로 바로 적용
+                    entries = self.distance_resolver.filter_entries(
+                        self.catalog, intent.area, entries, origin, intent.radius_m
+                    )
+                listing_text = self.catalog.format_entries(entries)
+                self.logger.logger.info(f"📒 카탈로그의 {intent.area} 맛집 목록으로 후보 발굴 (목록 검색 생략)")
+            else:
+                listing_results = self.search_planner.execute(
+                    self.search_planner.plan(user_request, purposes=["listing", "reviews"]), search
+                )
+                listing_text = self.search_planner.format_results(listing_results)
+            discovery_output = str(self.crew_registry.kickoff(
+                "discovery", [self.research_synthesizer], [self.discovery_task], {
+                    "user_request": user_request,
+                    "search_results": listing_text,
+                    "max_candidates": max_candidates
+                }
+            ))
+            candidates = parse_candidate_names(discovery_output, max_candidates)
+            if self.entity_resolver:
+                candidates = self.entity_resolver.dedupe_names(candidates)
+        except Exception as e:
+            self.logger.log_task_error(discovery_id, e, time.time() - start_time)
+            raise
+        discovery_time = time.time() - start_time
+        self.logger.log_task_response(discovery_id, discovery_output, {
+            "execution_time": discovery_time, "candidates": candidates
+        })
+        self.logger.log_task_completion(discovery_id, candidates, discovery_time)
+        self.logger.logger.info(f"🔎 후보 발굴 완료: {len(candidates)}개 ({discovery_time:.2f}초)")
+        
+        # 2단계: 후보별 상세 정보 동시 수집
+        enrichment_id = self.logger.log_task_start(
+            task_name="research_enrichment",
+            agent_name="system",
+            input_data={"candidates": candidates}
+        )
+        start_time = time.time()
+        # 카탈로그에 최신 정보가 모두 있는 후보는 웹 검색 없이 사용
+        from_catalog = {}
+        if self.catalog:
+            for name in candidates:
+                entry = self.catalog.find(name, intent.area)
+                if self.catalog.is_complete(entry):
+                    from_catalog[name] = self.catalog.to_enriched(entry)
+        searched = self.candidate_enricher.enrich(
+            [name for name in candidates if name not in from_catalog], search,
+            area=topic, memo_area=intent.area or ""
+        )
+        searched_by_name = {c["name"]: c for c in searched}
+        enriched = [from_catalog.get(name) or searched_by_name[name] for name in candidates]
+        if from_catalog:
+            self.logger.logger.info(f"📒 카탈로그 정보 재사용: {len(from_catalog)}/{len(candidates)}개 후보 (웹 검색 생략)")
+        memo_served = {c["name"]: c["memo_fields"] for c in searched if c.get("memo_fields")}
+        if memo_served:
+            searches_saved = sum(c.get("searches_saved", 0) for c in searched)
+            self.logger.logger.info(f"🧠 필드 메모 재사용: {len(memo_served)}개 후보, 검색 {searches_saved}회 생략")
+            for name, memo_fields in memo_served.items():
+                self.logger.logger.info(f"   - {name}: {', '.join(memo_fields)}")
+        if self.entity_resolver:
+            # 다른 이름으로 발굴됐지만 전화번호/주소가 같은 후보를 합침
+            merged = self.candidate_enricher.merge_duplicates(enriched, self.entity_resolver)
+            if len(merged) < len(enriched):
+                self.logger.logger.info(f"🔗 중복 후보 병합: {len(enriched)}개 → {len(merged)}개")
+            enriched = merged
+        
+        # 요청 조건에 맞지 않는 후보 사전 필터링
+        scoring_candidates = self.candidate_enricher.to_candidates(enriched)
+        too_far = []
+        if origin:
+            scoring_candidates, too_far = self.distance_resolver.annotate(scoring_candidates, origin, intent.radius_m)
+        rejected = set(too_far) | {c["name"] for c in scoring_candidates
+                                   if not intent.admits(c, self.scoring_engine.budget_tolerance)}
+        enriched = [c for c in enriched if c["name"] not in rejected]
+        scoring_candidates = [c for c in scoring_candidates if c["name"] not in rejected]
+        if origin:
+            located = [c for c in scoring_candidates if not math.isnan(c.get("distance", math.nan))]
+            self.logger.logger.info(f"📍 거리 정보: {len(located)}/{len(scoring_candidates)}개 후보 ({intent.area_alias} 기준)")
+        
+        research_results = self.candidate_enricher.format_results(enriched)
+        enrichment_time = time.time() - start_time
+        
+        self.logger.log_task_response(enrichment_id, research_results, {
+            "execution_time": enrichment_time,
+            "statuses": {c["name"]: f"{c['status']} ({c['elapsed']:.2f}초)" for c in enriched},
+            "from_catalog": sorted(from_catalog),
+            "from_memo": memo_served,
+            "rejected": sorted(rejected)
+        })
+        self.logger.log_task_completion(enrichment_id, research_results, enrichment_time)
+        self.logger.logger.info(f"📚 후보별 상세 정보 수집 완료 ({enrichment_time:.2f}초)")
+        if rejected:
+            self.logger.logger.info(f"🚫 요청 조건 불일치로 제외된 후보: {', '.join(sorted(rejected))}")
+        
+        return research_results, scoring_candidates
+    
+    def _run_local_curation(self, user_request: str, candidates: List[Dict[str, Any]]) -> str:
+        """점수화 엔진으로 후보 순위를 결정하고, 다음 단계 입력용 텍스트를 반환합니다."""
+        budget = parse_request_intent(user_request).budget
+        
+        task_id = self.logger.log_task_start(
+            task_name="local_curation",
+            agent_name="scoring_engine",
+            input_data={"candidates": len(candidates), "budget": budget}
+        )
+        start_time = time.time()
+        ranked = self.scoring_engine.score(candidates, budget=budget)
+        scored_text = self.scoring_engine.format_ranking(ranked)
+        execution_time = time.time() - start_time
+        
+        self.logger.log_task_response(task_id, scored_text, {
+            "execution_time": execution_time,
+            "ranking": [(r["name"], r["total_score"]) for r in ranked]
+        })
+        self.logger.log_task_completion(task_id, scored_text, execution_time)
+        self.logger.logger.info(f"🧮 점수화 엔진 순위 결정 완료: {len(candidates)}개 중 {len(ranked)}개 ({execution_time * 1000:.2f}ms)")
+        return scored_text
+    
+    def _prepare_two_phase_pipeline(self, user_request: str, inputs: Dict[str, Any], curation_mode: str):
+        """two_phase 리서치를 실행하고 큐레이션 방식(local / 묶음 / 개별 LLM)에 따른 (에이전트 목록, 작업 목록)을 반환합니다."""
+        research_results, candidates = self._run_two_phase_research(user_request)
+        
+        if curation_mode == "local":
+            scored_text = self._run_local_curation(user_request, candidates)
+            if self.curation_settings.get("llm_reasons", True):
+                # 큐레이터 LLM은 추천 이유 작성에만 사용
+                inputs["scored_candidates"] = scored_text
+                return [self.curator, self.communicator], [self.reason_task, self.communication_task]
+            inputs["curated_results"] = scored_text
+            return [self.communicator], [self.communication_with_curation_task]
+        
+        research_text = self._compact_text("research", research_results)
+        if self.curation_packer:
+            curated = self.curation_packer.submit(user_request, research_text)
+            if curated is not None:
+                self.logger.logger.info("📦 묶음 큐레이션 결과 사용 (동시 요청과 LLM 호출 공유)")
+                self._last_curation_output = curated
+                inputs["curated_results"] = self._compact_text("curation", curated)
+                return [self.communicator], [self.communication_with_curation_task]
+        inputs["research_results"] = research_text
+        return ([self.curator, self.communicator],
+                [self.curation_with_research_task, self.communication_task])
+    
+    def _prepare_recommendation_pipeline(self, user_request: str, inputs: Dict[str, Any]):
+        """
+        research_settings.mode와 curation_settings.mode에 따라 추천 파이프라인을 준비합니다.
+        시스템이 미리 처리한 단계의 결과는 inputs에 채워 넣고, 크루가 실행할 (에이전트 목록, 작업 목록)을 반환합니다.
+        """
+        research_mode = self.research_settings.get("mode", "agent")
+        curation_mode = self.curation_settings.get("mode", "llm")
+        intent = parse_request_intent(user_request)
+        self._research_intent = intent
+        self._warm_start_candidates = None
+        # 이번 요청에서 큐레이션 작업 콜백/묶음 큐레이션이 채운 경우에만 보고서 렌더링에 사용
+        self._last_curation_output = None
+        
+        # 미리 계산된 지역별 순위가 있으면 바로 커뮤니케이터로 전달
+        if self.area_rankings:
+            ranking = self.area_rankings.lookup(intent)
+            if ranking:
+                inputs["curated_results"] = self.area_rankings.format_ranking(ranking)
+                self.logger.logger.info(f"📊 지역별 순위 뷰 적중: {len(ranking)}개 (리서치/큐레이션 생략)")
+                return [self.communicator], [self.communication_with_curation_task]
+        
+        if curation_mode == "local" and research_mode != "two_phase":
+            self.logger.logger.warning("⚠️  local 큐레이션은 two_phase 리서치의 구조화된 후보가 필요합니다. LLM 큐레이션을 사용합니다.")
+        
+        if research_mode == "fanout":
+            inputs["search_results"] = self._run_search_fanout(user_request)
+            return ([self.research_synthesizer, self.curator, self.communicator],
+                    [self.fanout_research_task, self.curation_task, self.communication_task])
+        
+        if research_mode == "two_phase":
+            # 묶음 큐레이션: 리서치 중인 요청도 묶을 상대로 등록 (혼자인 요청은 대기 없이 개별 처리)
+            packing = self.curation_packer and curation_mode != "local"
+            with self.curation_packer.request() if packing else nullcontext():
+                return self._prepare_two_phase_pipeline(user_request, inputs, curation_mode)
+        
+        known = self.research_snapshots.load(intent) if self.research_snapshots else None
+        if known:
+            self._warm_start_candidates = known
+            inputs["known_candidates"] = self.research_snapshots.format_known(known)
+            self.logger.logger.info(f"🔥 리서치 웜 스타트: {intent.area} 알려진 후보 {len(known)}개 (새 후보/변경 정보만 조사)")
+            return ([self.researcher, self.curator, self.communicator],
+                    [self.warm_research_task, self.curation_task, self.communication_task])
+        
+        if self.search_tool.monitor:
+            # 리서처의 검색 결과마다 완성된 후보 수를 세어 목표에 도달하면 남은 반복 생략
+            self.search_tool.monitor.start(self.researcher.max_iter)
+        return ([self.researcher, self.curator, self.communicator],
+                [self.research_task, self.curation_task, self.communication_task])
+    
+    def _kickoff_recommendation_crew(self, agents: List[Agent], tasks: List[Task], inputs: Dict[str, Any]):
+        """파이프라인 구성별 추천 크루를 레지스트리에서 가져와 실행합니다."""
+        return self.crew_registry.kickoff(
+            "recommendation", agents, tasks, inputs,
+            verbose=True,  # verbose를 켜서 상세 로그 기록
+            memory=False,  # 메모리 비활성화 (OpenAI 사용 방지)
+            planning=False,  # 계획 수립 비활성화 (OpenAI 사용 방지)
+            step_callback=self._crew_step_callback  # 각 단계별 콜백 추가
+        )
+    
+    def _watch_stream(self, tasks: List[Task]):
+        """스트리밍 중이면 크루의 마지막 작업(추천 마지막 LLM 단계)의 토큰을 전달하도록 지정합니다. (빈 목록: 전달 안 함)"""
+        if self._stream_relay:
+            self._stream_relay.watch(tasks[-1:])
+    
+    def _stream_text(self, text: str):
+        """스트리밍 중이면 LLM을 거치지 않고 만든 최종 보고서를 그대로 전달합니다."""
+        if self._stream_relay:
+            self._stream_relay.push(text)
+    
+    @contextmanager
+    def _streaming(self, on_token: Optional[Callable[[str], None]]):
+        """on_token이 주어지면 큐레이터/커뮤니케이터 LLM을 스트리밍 모드로 전환하고 토큰을 전달합니다."""
+        if on_token is None:
+            yield
+            return
+        
+        started_at = time.time()
+        first_token = {}
+        
+        def push(text: str):
+            if not first_token:
+                first_token["elapsed"] = time.time() - started_at
+                self.logger.logger.info(f"⚡ 첫 토큰 출력: {first_token['elapsed']:.2f}초")
+            on_token(text)
+        
+        # crewai LLM 객체의 stream 속성만 실행 동안 켬 (문자열/사용자 정의 LLM은 그대로)
+        llms = [agent.llm for agent in (self.curator, self.communicator) if hasattr(agent.llm, "stream")]
+        previous = [llm.stream for llm in llms]
+        for llm in llms:
+            llm.stream = True
+        try:
+            with StreamRelay(push) as relay:
+                self._stream_relay = relay
+                yield
+        finally:
+            self._stream_relay = None
+            for llm, stream in zip(llms, previous):
+                llm.stream = stream
+    
+    def _kickoff_recommendation(self, agents: List[Agent], tasks: List[Task], inputs: Dict[str, Any], intent):
+        """
+        추천 크루를 실행하여 CrewOutput 또는 템플릿으로 만든 RecommendationOutput을 반환합니다.
+        템플릿 렌더러가 있으면 커뮤니케이션 작업 전까지만 실행하고 큐레이션 결과로 보고서를 만들며,
+        추천 이유가 없는 맛집이 있으면 커뮤니케이터 LLM으로 보고서를 작성합니다.
+        """
+        if not self.report_renderer or tasks[-1] not in (self.communication_task, self.communication_with_curation_task):
+            self._watch_stream(tasks)
+            return self._kickoff_recommendation_crew(agents, tasks, inputs)
+        
+        if len(tasks) > 1:
+            upstream = [agent for agent in agents if agent is not self.communicator]
+            # 큐레이션 결과(점수, 강점/약점)는 사용자용 보고서가 아니므로 스트림으로 전달하지 않음
+            self._watch_stream([])
+            curation_result = self._kickoff_recommendation_crew(upstream, tasks[:-1], inputs)
+            curated = curation_result.raw
+        else:
+            curated = inputs["curated_results"]
+        
+        rendered = self.report_renderer.to_output(self._last_curation_output or curated, intent)
+        if rendered:
+            self.logger.logger.info(f"🧾 템플릿 보고서 작성: {len(rendered.restaurants)}개 맛집 (커뮤니케이터 LLM 호출 생략)")
+            self._stream_text(render_recommendations(restaurants_from_output(rendered), rendered.summary))
+            return rendered
+        
+        self.logger.logger.info("💬 추천 이유가 없는 맛집이 있어 커뮤니케이터 LLM으로 보고서를 작성합니다")
+        inputs["curated_results"] = curated
+        self._watch_stream([self.communication_with_curation_task])
+        return self._kickoff_recommendation_crew([self.communicator], [self.communication_with_curation_task], inputs)
+    
+    def run_restaurant_recommendation(self, user_request: str,
+                                      on_token: Optional[Callable[[str], None]] = None) -> str:
+        """
+        맛집 추천을 실행합니다.
+        on_token이 주어지면 추천 마지막 LLM 단계의 최종 답변 토큰을 생성되는 대로 전달합니다.
+        """
         print(f"🔍 맛집 추천 시작")
         self.logger.logger.info("=" * 80)
         self.logger.logger.info(f"🔍 사용자 요청: {user_request}")
         self.logger.logger.info("=" * 80)
         
+        intent = parse_request_intent(user_request)
+        self.logger.logger.info(
+            f"🧭 요청 의도: 지역={intent.area or '-'}, 음식={','.join(intent.cuisines) or '-'}, "
+            f"예산={intent.budget_min or ''}~{intent.budget_max or ''}"
+        )
+        
         # Task 시작 로깅
         task_id = self.logger.log_task_start(
             task_name="restaurant_recommendation",
             agent_name="crew",
-            input_data={"user_request": user_request}
+            input_data={"user_request": user_request, "intent": intent.cache_key()}
         )
         
         start_time = time.time()
         
+        # 캐시 조회
+        if self.recommendation_cache:
+            cached_result = self.recommendation_cache.get(user_request)
+            cache_key = self.recommendation_cache.make_key(user_request)
+            self.logger.log_cache_event(
+                cache_name="recommendation",
+                event="hit" if cached_result is not None else "miss",
+                key=cache_key,
+                stats=self.recommendation_cache.get_stats()
+            )
+            
+            if cached_result is not None:
+                execution_time = time.time() - start_time
+                self.logger.log_task_response(
+                    task_id=task_id,
+                    response=cached_result,
+                    metadata={"execution_time": execution_time, "cache": "hit"}
+                )
+                self.logger.log_task_completion(task_id, cached_result, execution_time)
+                self.logger.logger.info(f"✅ 캐시된 맛집 추천 반환 (실행시간: {execution_time:.3f}초)")
+                print("⚡ 캐시된 추천 결과를 사용합니다")
+                self.recommended_restaurants = parse_recommendation_markdown(cached_result)
+                return cached_result
+        
+        # 유사 요청 캐시 조회
+        if self.semantic_cache:
+            match = self.semantic_cache.lookup(user_request)
+            self.logger.log_cache_event(
+                cache_name="semantic",
+                event=f"hit (유사도 {match['similarity']:.3f}, 원 요청: {match['request']})" if match else "miss",
+                key=user_request,
+                stats=self.semantic_cache.get_stats()
+            )
+            
+            if match:
+                cached_result = match["result"]
+                # 동일 표현의 재요청은 정확 일치 캐시에서 바로 처리되도록 저장
+                if self.recommendation_cache:
+                    self.recommendation_cache.put(user_request, cached_result)
+                
+                execution_time = time.time() - start_time
+                self.logger.log_task_response(
+                    task_id=task_id,
+                    response=cached_result,
+                    metadata={"execution_time": execution_time, "cache": "semantic_hit",
+                              "similarity": match["similarity"]}
+                )
+                self.logger.log_task_completion(task_id, cached_result, execution_time)
+                self.logger.logger.info(f"✅ 유사 요청 캐시 결과 반환 (실행시간: {execution_time:.3f}초)")
+                print(f"⚡ 유사한 요청의 추천 결과를 사용합니다: {match['request']}")
+                self.recommended_restaurants = parse_recommendation_markdown(cached_result)
+                return cached_result
+        
         try:
-            # 맛집 추천 크루 실행 (첫 3개 에이전트)
+            self.search_tool.begin_run(user_request)
+            
+            # 추천 파이프라인 구성 (리서치/큐레이션 방식에 따라 크루가 실행할 단계가 달라짐)
+            inputs = {"user_request": user_request}
+            pipeline_agents, pipeline_tasks = self._prepare_recommendation_pipeline(user_request, inputs)
+            
+            # 맛집 추천 크루 실행
             self.logger.log_crew_execution(
                 crew_name="recommendation_crew",
-                tasks=["research", "curation", "communication"],
+                tasks=[task.expected_output for task in pipeline_tasks],
                 process_type="sequential"
             )
             
-            recommendation_crew = Crew(
-                agents=[self.researcher, self.curator, self.communicator],
-                tasks=[self.research_task, self.curation_task, self.communication_task],
-                process=Process.sequential,
-                verbose=True,  # verbose를 켜서 상세 로그 기록
-                memory=False,  # 메모리 비활성화 (OpenAI 사용 방지)
-                planning=False,  # 계획 수립 비활성화 (OpenAI 사용 방지)
-                step_callback=self._crew_step_callback  # 각 단계별 콜백 추가
-            )
-            
             # Crew 실행 전 프롬프트 로깅
             self.logger.log_task_prompt(
                 task_id=task_id,
                 prompt=f"맛집 추천 요청: {user_request}",
-                context={"crew": "recommendation_crew", "agents": 3}
+                context={"crew": "recommendation_crew", "agents": len(pipeline_agents)}
             )
             
             # Crew 실행
@@ -612,25 +1366,80 @@ class AdvancedRestaurantSystem:
                 output_data="최종 맛집 추천 보고서"
             )
             
-            result = recommendation_crew.kickoff(inputs={"user_request": user_request})
+            with self._streaming(on_token):
+                result = self._kickoff_recommendation(pipeline_agents, pipeline_tasks, inputs, intent)
             
             self.logger.logger.info("-" * 80)
             self.logger.logger.info("✅ Crew 실행 완료")
             
-            # CrewOutput을 문자열로 변환
-            result_str = str(result)
+            early_termination = self.search_tool.monitor.finish() if self.search_tool.monitor else None
+            if early_termination and early_termination["stopped_early"]:
+                self.logger.logger.info(
+                    f"⏹️ 리서치 조기 종료: 필요한 정보를 갖춘 후보 {early_termination['complete_candidates']}개 확보 "
+                    f"(검색 {early_termination['iterations_used']}회, 반복 {early_termination['iterations_skipped']}회 생략, "
+                    f"안내 후 요청된 검색 {early_termination['searches_skipped']}회 미실행)"
+                )
+            
+            search_stats = self.search_tool.get_stats()
+            if search_stats:
+                self.logger.log_cache_event(
+                    cache_name="search",
+                    event=f"run 완료 (적중률 {search_stats['hit_rate']:.0%}, 절약 {search_stats['bytes_saved']:,} bytes)",
+                    key=user_request,
+                    stats=search_stats
+                )
+            
+            # 스키마 검증된 구조화 출력을 Restaurant 목록과 사용자용 보고서로 변환
+            structured = result if isinstance(result, RecommendationOutput) else result.pydantic
+            restaurants = restaurants_from_output(result)
+            if self.entity_resolver and restaurants:
+                restaurants = self.entity_resolver.dedupe_restaurants(restaurants)
+            self.recommended_restaurants = restaurants
+            if self.catalog and restaurants:
+                # 이번 실행의 웹 검색 결과에 나온 맛집만 마지막 확인 시각 갱신 (카탈로그/순위 뷰 결과 제외)
+                verified = self.search_tool.verified_names([r.name for r in restaurants])
+                recorded = self.catalog.record(restaurants, area=intent.area or "", verified=verified)
+                self.logger.logger.info(f"📒 카탈로그 저장: {recorded}개 (전체 {self.catalog.get_stats()['entries']}개)")
+                # 지역 정보가 바뀐 경우에만 해당 지역 순위 뷰를 다시 계산
+                if self.area_rankings and intent.area in self.area_rankings.areas:
+                    if self.area_rankings.refresh(intent.area):
+                        self.logger.logger.info(f"📊 {intent.area} 지역별 순위 뷰 재계산")
+            if restaurants:
+                summary = structured.summary if isinstance(structured, RecommendationOutput) else ""
+                result_str = render_recommendations(restaurants, summary)
+            else:
+                self.logger.logger.warning("⚠️  추천 결과에서 맛집 목록을 추출하지 못했습니다. 원문을 그대로 사용합니다.")
+                result_str = str(result)
             
             # 응답 로깅
             execution_time = time.time() - start_time
             self.logger.log_task_response(
                 task_id=task_id,
                 response=result_str,
-                metadata={"execution_time": execution_time}
+                metadata={
+                    "execution_time": execution_time,
+                    "structured_output": structured is not None,
+                    "report": "template" if isinstance(result, RecommendationOutput) else "llm",
+                    "restaurants": len(restaurants),
+                    "research_early_termination": early_termination
+                }
             )
             
             self.logger.log_task_completion(task_id, result_str, execution_time)
             self.logger.logger.info(f"✅ 맛집 추천 완료 (실행시간: {execution_time:.2f}초)")
             
+            # 추천 결과 캐시 저장
+            if self.recommendation_cache:
+                self.recommendation_cache.put(user_request, result_str)
+                self.logger.log_cache_event(
+                    cache_name="recommendation",
+                    event="store",
+                    key=self.recommendation_cache.make_key(user_request),
+                    stats=self.recommendation_cache.get_stats()
+                )
+            if self.semantic_cache:
+                self.semantic_cache.put(user_request, result_str)
+            
             # 에이전트 간 통신 로그를 JSON 파일로 저장
             self._save_agent_communication_log()
             
@@ -641,7 +1450,7 @@ class AdvancedRestaurantSystem:
             self.logger.log_task_error(task_id, e, execution_time)
             raise
     
-    def _create_google_form_alternative(self, restaurant_recommendations: str) -> str:
+    def _create_google_form_alternative(self, restaurants: List[Restaurant]) -> str:
         """Google Sheets를 사용하여 설문조사 응답 수집 시트를 생성합니다."""
         try:
             # Google 서비스 계정 인증
@@ -682,14 +1491,6 @@ class AdvancedRestaurantSystem:
                 self.logger.logger.error(f"❌ Google API 서비스 생성 실패: {service_error}")
                 return None
             
-            # 맛집 목록 파싱
-            restaurants = []
-            for line in restaurant_recommendations.split('\n'):
-                if line.strip().startswith('**[') and '위]':
-                    match = re.search(r'\*\*\[.*?\]\s*(.*?)\*\*', line)
-                    if match:
-                        restaurants.append(match.group(1).strip())
-            
             # Google Sheets 생성
             spreadsheet = {
                 'properties': {
@@ -721,7 +1522,7 @@ class AdvancedRestaurantSystem:
             # 헤더 행 생성
             headers = ['타임스탬프', '이름', '이메일', '가장 선호하는 맛집']
             for restaurant in restaurants:
-                headers.append(f'{restaurant} - 만족도 (1-5)')
+                headers.append(f'{restaurant.name} - 만족도 (1-5)')
             headers.append('가격 적정성 (1-5)')
             headers.append('추가 의견')
             
@@ -820,7 +1621,7 @@ class AdvancedRestaurantSystem:
         
         return creds
     
-    def _create_google_form(self, restaurant_recommendations: str) -> str:
+    def _create_google_form(self, restaurants: List[Restaurant]) -> str:
         """Google Forms API를 사용하여 실제 설문조사를 생성합니다."""
         try:
             # OAuth 2.0 인증
@@ -839,76 +1640,12 @@ class AdvancedRestaurantSystem:
                 self.logger.logger.error(f"❌ Google Forms API 서비스 생성 실패: {service_error}")
                 return None
             
-            # 맛집 목록 파싱 (상세 정보 포함)
-            restaurants = []
-            current_restaurant = None
-            
-            lines = restaurant_recommendations.split('\n')
-            for i, line in enumerate(lines):
-                line = line.strip()
-                
-                # 맛집 제목 파싱: **[1위] 맛집 이름**
-                if line.startswith('**[') and '위]' in line:
-                    if current_restaurant:
-                        restaurants.append(current_restaurant)
-                    
-                    # 맛집 이름 추출
-                    match = re.search(r'\*\*\[(\d+)위\]\s*(.*?)\*\*', line)
-                    if match:
-                        rank = match.group(1)
-                        name = match.group(2).strip()
-                        current_restaurant = {
-                            'rank': rank,
-                            'name': name,
-                            'address': '',
-                            'phone': '',
-                            'rating': '',
-                            'price': '',
-                            'reason': '',
-                            'menu': '',
-                            'hours': '',
-                            'url': '',
-                            'category': '',
-                            'distance': ''
-                        }
-                
-                # 상세 정보 파싱
-                elif current_restaurant:
-                    if '📍 주소:' in line or '📍 위치:' in line:
-                        current_restaurant['address'] = line.split(':', 1)[1].strip() if ':' in line else ''
-                    elif '📞 전화:' in line or '☎️' in line:
-                        current_restaurant['phone'] = line.split(':', 1)[1].strip() if ':' in line else ''
-                    elif '⭐ 평점:' in line or '평점:' in line:
-                        current_restaurant['rating'] = line.split(':', 1)[1].strip() if ':' in line else ''
-                    elif '💰 가격대:' in line or '가격대:' in line:
-                        current_restaurant['price'] = line.split(':', 1)[1].strip() if ':' in line else ''
-                    elif '💡 추천 이유:' in line or '추천 이유:' in line:
-                        current_restaurant['reason'] = line.split(':', 1)[1].strip() if ':' in line else ''
-                    elif '🍽️ 메뉴:' in line or '대표 메뉴:' in line:
-                        current_restaurant['menu'] = line.split(':', 1)[1].strip() if ':' in line else ''
-                    elif '🕐 영업시간:' in line or '영업시간:' in line:
-                        current_restaurant['hours'] = line.split(':', 1)[1].strip() if ':' in line else ''
-                    elif '🔗 URL:' in line or '링크:' in line or 'URL:' in line:
-                        url_text = line.split(':', 1)[1].strip() if ':' in line else ''
-                        # URL 추출 (마크다운 링크 형식 또는 일반 URL)
-                        url_match = re.search(r'https?://[^\s\)]+', url_text)
-                        if url_match:
-                            current_restaurant['url'] = url_match.group(0)
-                    elif '🏷️ 카테고리:' in line or '분류:' in line or '음식 종류:' in line:
-                        current_restaurant['category'] = line.split(':', 1)[1].strip() if ':' in line else ''
-                    elif '📏 거리:' in line or '거리:' in line:
-                        current_restaurant['distance'] = line.split(':', 1)[1].strip() if ':' in line else ''
-            
-            # 마지막 맛집 추가
-            if current_restaurant:
-                restaurants.append(current_restaurant)
-            
-            # 파싱 결과 로깅
-            self.logger.logger.info(f"📊 파싱된 맛집 정보: {len(restaurants)}개")
+            # 전달받은 맛집 정보 로깅
+            self.logger.logger.info(f"📊 추천 맛집 정보: {len(restaurants)}개")
             for r in restaurants:
-                self.logger.logger.info(f"   {r['rank']}위: {r['name']}")
-                if r['reason']:
-                    self.logger.logger.info(f"        추천 이유: {r['reason'][:50]}...")
+                self.logger.logger.info(f"   {r.rank}위: {r.name}")
+                if r.reason:
+                    self.logger.logger.info(f"        추천 이유: {r.reason[:50]}...")
             
             # Google Form 생성
             form = {
@@ -937,7 +1674,7 @@ class AdvancedRestaurantSystem:
                 # 선택지 구성 (간단하게)
                 choice_options = []
                 for r in restaurants:
-                    choice_label = f"[{r['rank']}위] {r['name']}"
+                    choice_label = r.label
                     choice_options.append({"value": choice_label})
                 
                 # 질문 설명에 전체 상세 정보 추가
@@ -946,36 +1683,36 @@ class AdvancedRestaurantSystem:
                 description += "=" * 50 + "\n\n"
                 
                 for r in restaurants:
-                    description += f"【 {r['rank']}위 】 {r['name']}\n"
+                    description += f"【 {r.rank}위 】 {r.name}\n"
                     description += "-" * 40 + "\n"
                     
                     # 기본 정보
-                    if r['category']:
-                        description += f"🏷️  카테고리: {r['category']}\n"
-                    if r['address']:
-                        description += f"📍 주소: {r['address']}\n"
-                    if r['distance']:
-                        description += f"📏 거리: {r['distance']}\n"
-                    if r['phone']:
-                        description += f"📞 전화: {r['phone']}\n"
-                    if r['hours']:
-                        description += f"🕐 영업시간: {r['hours']}\n"
+                    if r.category:
+                        description += f"🏷️  카테고리: {r.category}\n"
+                    if r.address:
+                        description += f"📍 주소: {r.address}\n"
+                    if r.distance:
+                        description += f"📏 거리: {r.distance}\n"
+                    if r.phone:
+                        description += f"📞 전화: {r.phone}\n"
+                    if r.hours:
+                        description += f"🕐 영업시간: {r.hours}\n"
                     
                     # 평가 정보
-                    if r['rating']:
-                        description += f"⭐ 평점: {r['rating']}\n"
-                    if r['price']:
-                        description += f"💰 가격대: {r['price']}\n"
-                    if r['menu']:
-                        description += f"🍽️  대표메뉴: {r['menu']}\n"
+                    if r.rating:
+                        description += f"⭐ 평점: {r.rating}\n"
+                    if r.price:
+                        description += f"💰 가격대: {r.price}\n"
+                    if r.menu:
+                        description += f"🍽️  대표메뉴: {r.menu}\n"
                     
                     # AI 분석
-                    if r['reason']:
-                        description += f"\n💡 AI 추천 이유:\n{r['reason']}\n"
+                    if r.reason:
+                        description += f"\n💡 AI 추천 이유:\n{r.reason}\n"
                     
                     # 정보 출처 URL
-                    if r['url']:
-                        description += f"\n🔗 상세정보: {r['url']}\n"
+                    if r.url:
+                        description += f"\n🔗 상세정보: {r.url}\n"
                     
                     description += "\n" + "=" * 50 + "\n\n"
                 
@@ -1057,18 +1794,29 @@ class AdvancedRestaurantSystem:
             self.logger.logger.error(f"❌ 설문조사 생성 중 오류: {e}")
             return None
     
-    def create_survey_form(self, restaurant_recommendations: str) -> str:
-        """설문조사 폼을 생성합니다."""
+    def create_survey_form(self, restaurant_recommendations: str,
+                           restaurants: List[Restaurant] = None) -> str:
+        """
+        설문조사 폼을 생성합니다.
+        restaurants가 주어지지 않으면 추천 보고서에서 맛집 목록을 추출합니다.
+        """
         print("📝 설문조사 폼 생성")
         self.logger.logger.info("📝 설문조사 폼 생성 시작")
         
         # 문자열로 변환 (이미 str이지만 확실하게)
         recommendations_str = str(restaurant_recommendations)
+        if restaurants is None:
+            restaurants = parse_recommendation_markdown(recommendations_str)
+        if self.entity_resolver and restaurants:
+            # 설문 선택지에 같은 맛집이 두 번 나오지 않도록 합침
+            restaurants = self.entity_resolver.dedupe_restaurants(restaurants)
+        if not restaurants:
+            self.logger.logger.warning("⚠️  설문 선택지로 사용할 맛집 정보가 없습니다.")
         
         task_id = self.logger.log_task_start(
             task_name="survey_form_creation",
             agent_name="form_creator",
-            input_data={"recommendations_length": len(recommendations_str)}
+            input_data={"recommendations_length": len(recommendations_str), "restaurants": len(restaurants)}
         )
         
         start_time = time.time()
@@ -1076,7 +1824,7 @@ class AdvancedRestaurantSystem:
         try:
             # 실제 Google Form 생성 시도
             self.logger.logger.info("\n🔧 Google Forms API를 사용하여 실제 설문조사를 생성합니다...")
-            google_form_url = self._create_google_form(recommendations_str)
+            google_form_url = self._create_google_form(restaurants)
             
             if google_form_url:
                 # Google Form이 성공적으로 생성된 경우
@@ -1104,14 +1852,6 @@ class AdvancedRestaurantSystem:
                 # Google Form 생성 실패 시 AI 에이전트로 폴백
                 self.logger.logger.warning("⚠️  Google Form 생성 실패. AI 에이전트로 대체합니다...")
                 
-                # 폼 생성 에이전트 실행
-                form_crew = Crew(
-                    agents=[self.form_creator],
-                    tasks=[self.form_creation_task],
-                    process=Process.sequential,
-                    verbose=True
-                )
-                
                 self.logger.log_task_prompt(
                     task_id=task_id,
                     prompt="설문조사 폼 생성 요청",
@@ -1121,7 +1861,9 @@ class AdvancedRestaurantSystem:
                 self.logger.logger.info("🚀 폼 생성 Crew 실행 시작...")
                 self.logger.logger.info("-" * 80)
                 
-                result = form_crew.kickoff(inputs={"restaurant_recommendations": recommendations_str})
+                # 폼 생성 에이전트 실행
+                result = self.crew_registry.kickoff("form_creation", [self.form_creator], [self.form_creation_task],
+                                                    {"restaurant_recommendations": recommendations_str})
                 
                 self.logger.logger.info("-" * 80)
                 self.logger.logger.info("✅ 폼 생성 Crew 실행 완료")
@@ -1255,8 +1997,12 @@ class AdvancedRestaurantSystem:
             self.logger.logger.error(f"   예상치 못한 오류가 발생했습니다.")
             return False
     
-    def send_survey_emails(self, survey_link: str) -> str:
-        """설문조사 이메일을 발송합니다."""
+    def send_survey_emails(self, survey_link: str, restaurants: List[Restaurant] = None,
+                           confirm_send: Optional[bool] = None) -> str:
+        """
+        설문조사 이메일을 발송합니다. (restaurants: 이메일 본문 요약에 사용할 추천 맛집)
+        confirm_send가 None이면 발송 전에 사용자에게 확인을 받고, True/False면 묻지 않고 그대로 따릅니다.
+        """
         print("📧 이메일 발송")
         self.logger.logger.info(f"📧 이메일 발송 시작 (수신자: {len(self.email_recipients)}명)")
         
@@ -1279,14 +2025,6 @@ class AdvancedRestaurantSystem:
         start_time = time.time()
         
         try:
-            # 이메일 발송 에이전트 실행 (콘텐츠 생성)
-            email_crew = Crew(
-                agents=[self.email_sender],
-                tasks=[self.email_sending_task],
-                process=Process.sequential,
-                verbose=True
-            )
-            
             self.logger.log_task_prompt(
                 task_id=task_id,
                 prompt=f"이메일 발송 요청: {len(self.email_recipients)}명",
@@ -1296,9 +2034,11 @@ class AdvancedRestaurantSystem:
             self.logger.logger.info("🚀 이메일 콘텐츠 생성 Crew 실행 시작...")
             self.logger.logger.info("-" * 80)
             
-            result = email_crew.kickoff(inputs={
+            # 이메일 발송 에이전트 실행 (콘텐츠 생성)
+            result = self.crew_registry.kickoff("email_sending", [self.email_sender], [self.email_sending_task], {
                 "survey_link": extracted_link,
-                "email_recipients": self.email_recipients
+                "email_recipients": self.email_recipients,
+                "restaurant_summary": summarize_restaurants(restaurants or [])
             })
             
             self.logger.logger.info("-" * 80)
@@ -1323,9 +2063,11 @@ class AdvancedRestaurantSystem:
             print(f"   설문조사 링크: {extracted_link}")
             print("="*80)
             
-            response = input("\n이메일을 발송하시겠습니까? (y/n): ").strip().lower()
+            if confirm_send is None:
+                response = input("\n이메일을 발송하시겠습니까? (y/n): ").strip().lower()
+                confirm_send = response == 'y' or response == 'yes'
             
-            if response == 'y' or response == 'yes':
+            if confirm_send:
                 # 실제 이메일 발송
                 self.logger.logger.info("\n📬 이메일 발송 시작:")
                 print("\n📬 이메일 발송 중...")
@@ -1362,8 +2104,8 @@ class AdvancedRestaurantSystem:
             self.logger.log_task_error(task_id, e, execution_time)
             raise
     
-    def analyze_survey_data(self, survey_responses: Dict) -> str:
-        """설문조사 데이터를 분석합니다."""
+    def analyze_survey_data(self, survey_responses: Dict, restaurants: List[Restaurant] = None) -> str:
+        """설문조사 데이터를 분석합니다. (restaurants: 응답과 대조할 추천 맛집)"""
         print("📊 데이터 분석")
         self.logger.logger.info("📊 데이터 분석 시작")
         
@@ -1389,14 +2131,6 @@ class AdvancedRestaurantSystem:
                 insights=["설문조사 응답 데이터 분석 시작"]
             )
             
-            # 데이터 분석 에이전트 실행
-            analysis_crew = Crew(
-                agents=[self.data_analyst],
-                tasks=[self.data_analysis_task],
-                process=Process.sequential,
-                verbose=True
-            )
-            
             self.logger.log_task_prompt(
                 task_id=task_id,
                 prompt="설문조사 데이터 분석 요청",
@@ -1406,7 +2140,11 @@ class AdvancedRestaurantSystem:
             self.logger.logger.info("🚀 데이터 분석 Crew 실행 시작...")
             self.logger.logger.info("-" * 80)
             
-            result = analysis_crew.kickoff(inputs={"survey_responses": survey_responses})
+            # 데이터 분석 에이전트 실행
+            result = self.crew_registry.kickoff("data_analysis", [self.data_analyst], [self.data_analysis_task], {
+                "survey_responses": survey_responses,
+                "recommended_restaurants": summarize_restaurants(restaurants or [])
+            })
             
             self.logger.logger.info("-" * 80)
             self.logger.logger.info("✅ 데이터 분석 Crew 실행 완료")
@@ -1426,8 +2164,76 @@ class AdvancedRestaurantSystem:
             self.logger.log_task_error(task_id, e, execution_time)
             raise
     
-    def run_complete_workflow(self, user_request: str, email_recipients: List[str]) -> Dict[str, Any]:
-        """전체 워크플로우를 실행합니다."""
+    def create_worker(self) -> "AdvancedRestaurantSystem":
+        """
+        동시 실행용 워커를 만듭니다.
+        캐시, 카탈로그, 메모 등 스레드 안전한 저장소는 공유하고, 실행 단위 상태를 가진
+        검색 도구(요청 문맥)와 에이전트/작업은 워커마다 새로 만듭니다.
+        """
+        worker = copy.copy(self)
+        worker.search_tool = CachedSerperDevTool(
+            search_tool=self.search_tool.search_tool,
+            store=self.search_tool.store,
+            result_filter=self.search_tool.result_filter,
+            logger=self.logger,
+            monitor=self.search_tool.monitor.fresh() if self.search_tool.monitor else None
+        )
+        worker._research_intent = None
+        worker._warm_start_candidates = None
+        worker._last_curation_output = None
+        worker._stream_relay = None
+        worker.recommended_restaurants = []
+        worker._idle_workers = []
+        worker._worker_lock = threading.Lock()
+        worker.setup_agents()
+        worker.setup_tasks()
+        return worker
+    
+    def run_recommendations_batch(self, requests: List[Dict[str, Any]], output_file: Optional[str] = None,
+                                  max_concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """
+        여러 추천 요청을 동시 실행 수를 제한하여 처리합니다. (requests: load_batch_requests 형식)
+        결과는 끝나는 순서대로 output_file(JSONL)에 기록되며, 실패한 요청은 기록 후 건너뜁니다.
+        """
+        max_concurrency = max_concurrency or self.batch_settings.get("max_concurrency", 3)
+        self.logger.logger.info(f"📦 일괄 추천 시작: {len(requests)}건 (동시 실행 {max_concurrency})")
+        summary = BatchRunner(self.create_worker, max_concurrency, logger=self.logger).run(requests, output_file)
+        self.logger.logger.info(
+            f"📦 일괄 추천 완료: 성공 {summary['succeeded']}건, 실패 {summary['failed']}건, "
+            f"총 {summary['wall_time_seconds']:.2f}초 (p50 {summary['latency_p50_seconds']:.2f}초, "
+            f"p95 {summary['latency_p95_seconds']:.2f}초)"
+        )
+        crew_stats = crew_process_stats()
+        self.logger.logger.info(
+            f"🏗️ 크루 생성 {crew_stats['builds']}회 ({crew_stats['build_seconds']:.3f}초), "
+            f"재사용 {crew_stats['reuses']}회 (절약 약 {crew_stats['saved_seconds']:.3f}초, 프로세스 누적)"
+        )
+        return summary
+    
+    def stream_restaurant_recommendation(self, user_request: str,
+                                         on_token: Optional[Callable[[str], None]] = None) -> TokenStream:
+        """
+        맛집 추천을 백그라운드 스레드에서 실행하고, 추천 마지막 LLM 단계의 토큰을 반복자로 읽을 수 있는 스트림을 반환합니다.
+        반복이 끝나면 stream.result에 최종 추천 보고서가 담깁니다. (실행 오류는 반복 끝에서 다시 발생)
+        """
+        stream = TokenStream(on_token)
+        
+        def worker():
+            try:
+                stream.close(result=self.run_restaurant_recommendation(user_request, on_token=stream.push))
+            except Exception as e:
+                stream.close(error=e)
+        
+        threading.Thread(target=worker, name="recommendation-stream", daemon=True).start()
+        return stream
+    
+    def run_complete_workflow(self, user_request: str, email_recipients: List[str],
+                              on_token: Optional[Callable[[str], None]] = None,
+                              confirm_send: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        전체 워크플로우를 실행합니다.
+        on_token: 맛집 추천 단계의 토큰 스트리밍 콜백, confirm_send: 이메일 발송 확인 (None이면 사용자에게 질문)
+        """
         print("\n" + "=" * 50)
         print("🚀 전체 워크플로우 시작")
         print("=" * 50)
@@ -1442,20 +2248,21 @@ class AdvancedRestaurantSystem:
             print("\n1️⃣ 맛집 추천 단계")
             self.logger.logger.info("" * 80)
             self.logger.logger.info("1️⃣ 맛집 추천 단계 시작")
-            recommendations = self.run_restaurant_recommendation(user_request)
+            recommendations = self.run_restaurant_recommendation(user_request, on_token=on_token)
             
             # 2. 설문조사 폼 생성
             print("\n2️⃣ 설문조사 폼 생성 단계")
             self.logger.logger.info("" * 80)
             self.logger.logger.info("2️⃣ 설문조사 폼 생성 단계 시작")
-            survey_form = self.create_survey_form(recommendations)
+            restaurants = self.recommended_restaurants
+            survey_form = self.create_survey_form(recommendations, restaurants)
             
             # 3. 이메일 발송
             print("\n3️⃣ 이메일 발송 단계")
             self.logger.logger.info("=" * 80)
             self.logger.logger.info("3️⃣ 이메일 발송 단계 시작")
             self.set_email_recipients(email_recipients)
-            email_result = self.send_survey_emails(survey_form)
+            email_result = self.send_survey_emails(survey_form, restaurants, confirm_send=confirm_send)
             
             # 4. 응답 수집 안내
             print("\n" + "=" * 80)
@@ -1484,6 +2291,7 @@ class AdvancedRestaurantSystem:
             
             return {
                 "recommendations": recommendations,
+                "restaurants": [r.to_dict() for r in restaurants],
                 "survey_form": survey_form,
                 "email_result": email_result,
                 "survey_link": survey_link,
@@ -1496,6 +2304,53 @@ class AdvancedRestaurantSystem:
             self.logger.logger.error(f"실행시간: {workflow_time:.2f}초")
             raise
     
+    async def _run_on_worker(self, method_name: str, *args, **kwargs):
+        """
+        유휴 워커(없으면 새 워커)에서 동기 단계를 스레드로 실행합니다.
+        crewai의 Crew.kickoff_async와 같은 방식(asyncio.to_thread)이며, 크루 실행뿐 아니라 검색/DB/Google API/SMTP
+        입출력도 함께 스레드에서 처리하므로 이벤트 루프는 막히지 않습니다. 실행 단위 상태는 워커마다 분리됩니다.
+        """
+        def run():
+            # 유휴 워커가 있으면 재사용 (워커의 단계별 크루도 함께 재사용됨)
+            with self._worker_lock:
+                worker = self._idle_workers.pop() if self._idle_workers else None
+            worker = worker or self.create_worker()
+            try:
+                return getattr(worker, method_name)(*args, **kwargs)
+            finally:
+                with self._worker_lock:
+                    self._idle_workers.append(worker)
+        return await asyncio.to_thread(run)
+    
+    async def arun_restaurant_recommendation(self, user_request: str,
+                                             on_token: Optional[Callable[[str], None]] = None) -> str:
+        """run_restaurant_recommendation의 비동기 버전 (on_token은 작업 스레드에서 호출됨)"""
+        return await self._run_on_worker("run_restaurant_recommendation", user_request, on_token=on_token)
+    
+    async def acreate_survey_form(self, restaurant_recommendations: str,
+                                  restaurants: List[Restaurant] = None) -> str:
+        """create_survey_form의 비동기 버전"""
+        return await self._run_on_worker("create_survey_form", restaurant_recommendations, restaurants)
+    
+    async def asend_survey_emails(self, survey_link: str, restaurants: List[Restaurant] = None,
+                                  confirm_send: Optional[bool] = None) -> str:
+        """send_survey_emails의 비동기 버전 (동시 실행 시 confirm_send를 지정하면 입력 대기 없이 진행)"""
+        return await self._run_on_worker("send_survey_emails", survey_link, restaurants, confirm_send=confirm_send)
+    
+    async def aanalyze_survey_data(self, survey_responses: Dict, restaurants: List[Restaurant] = None) -> str:
+        """analyze_survey_data의 비동기 버전"""
+        return await self._run_on_worker("analyze_survey_data", survey_responses, restaurants)
+    
+    async def arun_complete_workflow(self, user_request: str, email_recipients: List[str],
+                                     on_token: Optional[Callable[[str], None]] = None,
+                                     confirm_send: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        run_complete_workflow의 비동기 버전
+        하나의 이벤트 루프에서 여러 워크플로우를 asyncio.gather 등으로 동시에 실행할 수 있습니다.
+        """
+        return await self._run_on_worker("run_complete_workflow", user_request, email_recipients,
+                                         on_token=on_token, confirm_send=confirm_send)
+    
     def _generate_mock_survey_data(self) -> Dict:
         """테스트용 모의 설문조사 데이터를 생성합니다."""
         return {
@@ -1523,8 +2378,40 @@ class AdvancedRestaurantSystem:
             ]
         }
 
+def run_batch_cli(requests_file: str, output_file: str, max_concurrency: Optional[int] = None):
+    """--batch 옵션: JSONL 요청 파일을 일괄 추천하고 요약을 출력합니다."""
+    requests = load_batch_requests(requests_file)
+    print(f"📦 일괄 추천: {len(requests)}건 → {output_file}")
+    system = AdvancedRestaurantSystem()
+    summary = system.run_recommendations_batch(requests, output_file, max_concurrency)
+    
+    print(f"\n📋 일괄 추천 결과: 성공 {summary['succeeded']}건 / 실패 {summary['failed']}건")
+    print(f"   ⏱️  총 실행시간: {summary['wall_time_seconds']:.2f}초 "
+          f"(요청별 p50 {summary['latency_p50_seconds']:.2f}초, p95 {summary['latency_p95_seconds']:.2f}초)")
+    for request_id, error in summary["failures"].items():
+        print(f"   ❌ {request_id}: {error}")
+    system.logger.log_session_end({"status": "success", "batch": summary})
+
+
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="CrewAI 고급 맛집 추천 및 설문조사 시스템")
+    parser.add_argument("--stream", action="store_true",
+                        help="추천 마지막 단계의 LLM 출력을 생성되는 대로 콘솔에 출력")
+    parser.add_argument("--batch", metavar="REQUESTS_JSONL",
+                        help="JSONL 파일의 요청들을 일괄 추천 (설문/이메일 단계 제외)")
+    parser.add_argument("--output", metavar="RESULTS_JSONL", default=None,
+                        help="일괄 추천 결과 JSONL 파일 (기본: 요청 파일 옆의 <이름>_results.jsonl)")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="일괄 추천 동시 실행 수 (기본: batch_settings.max_concurrency)")
+    args = parser.parse_args()
+    
+    if args.batch:
+        batch_file = Path(args.batch)
+        output_file = args.output or str(batch_file.with_name(f"{batch_file.stem}_results.jsonl"))
+        run_batch_cli(args.batch, output_file, args.concurrency)
+        return
+    
     print("\n" + "=" * 60)
     print("🍽️ CrewAI 고급 맛집 추천 및 설문조사 시스템")
     print("=" * 60 + "\n")
@@ -1551,7 +2438,8 @@ def main():
     
     try:
         # 전체 워크플로우 실행
-        results = system.run_complete_workflow(user_request, email_recipients)
+        on_token = (lambda text: print(text, end="", flush=True)) if args.stream else None
+        results = system.run_complete_workflow(user_request, email_recipients, on_token=on_token)
         
         print("\n" + "=" * 60)
         print("🎉 전체 워크플로우 완료!")
@@ -1581,6 +2469,8 @@ def main():
         print(f"   ✅ 완료: {summary['completed_tasks']}개")
         print(f"   ❌ 오류: {summary['error_tasks']}개")
         print(f"   ⏱️  총 Task 실행시간: {summary['total_execution_time']:.2f}초")
+        for cache_name, stats in summary.get('cache_stats', {}).items():
+            print(f"   🗄️  캐시({cache_name}): 적중 {stats.get('hits', 0)}회 / 미적중 {stats.get('misses', 0)}회")
         print("\n💡 상세 로그는 위 로그 파일을 확인하세요.\n")
         
     except Exception as e:
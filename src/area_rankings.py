@@ -0,0 +1,173 @@
+"""
+지역별 순위 뷰 모듈
+자주 요청되는 지역의 (음식 종류, 예산 구간)별 상위 N개 순위를 카탈로그 DB에 미리 계산해 둡니다.
+지역 맛집 정보가 바뀐 경우(카탈로그 revision 증가)에만 해당 지역을 다시 계산하며,
+뷰와 일치하는 요청은 리서치와 큐레이션 없이 바로 커뮤니케이터에 전달됩니다.
+"""
+
+import json
+import math
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from src.curator_scoring import CuratorScoringEngine
+from src.geo_index import DistanceResolver
+from src.request_intent import CUISINE_KEYWORDS, RequestIntent, detect_cuisines
+from src.research_pipeline import CandidateEnricher
+from src.restaurant_catalog import RestaurantCatalog
+
+# 기본 대상 지역 (restaurant_finder의 예시 요청 지역)
+DEFAULT_AREAS = ("광화문", "강남역", "홍대")
+# 기본 예산 구간 (0은 예산 조건 없음)
+DEFAULT_BUDGET_BANDS = (10000, 20000, 30000, 50000)
+
+
+class AreaRankingStore:
+    """카탈로그 기반 지역별 상위 N개 순위 뷰"""
+
+    def __init__(self, catalog: RestaurantCatalog, scoring_engine: CuratorScoringEngine,
+                 areas: Tuple[str, ...] = DEFAULT_AREAS, budget_bands: Tuple[int, ...] = DEFAULT_BUDGET_BANDS,
+                 top_n: int = 5, min_results: int = 3, distance_resolver: Optional[DistanceResolver] = None):
+        self.catalog = catalog
+        self.scoring_engine = scoring_engine
+        # 지정되면 지역 중심(역)으로부터의 실제 거리로 거리 기준을 계산
+        self.distance_resolver = distance_resolver
+        self.areas = tuple(areas)
+        self.budget_bands = tuple(budget_bands)
+        self.top_n = top_n
+        self.min_results = min_results
+        self.stats = {"hits": 0, "misses": 0, "refreshed_areas": 0, "skipped_areas": 0}
+        self._init_db()
+
+    @classmethod
+    def from_config(cls, ranking_settings: Dict[str, Any], catalog: RestaurantCatalog,
+                    scoring_engine: CuratorScoringEngine,
+                    distance_resolver: Optional[DistanceResolver] = None) -> "AreaRankingStore":
+        """config.json의 ranking_settings 섹션으로 생성합니다."""
+        return cls(
+            catalog=catalog,
+            scoring_engine=scoring_engine,
+            areas=tuple(ranking_settings.get("areas", DEFAULT_AREAS)),
+            budget_bands=tuple(ranking_settings.get("budget_bands", DEFAULT_BUDGET_BANDS)),
+            top_n=ranking_settings.get("top_n", scoring_engine.max_recommendations),
+            min_results=ranking_settings.get("min_results", 3),
+            distance_resolver=distance_resolver
+        )
+
+    def _init_db(self):
+        self.catalog.execute("""
+            CREATE TABLE IF NOT EXISTS area_rankings (
+                area TEXT NOT NULL,
+                cuisine TEXT NOT NULL,
+                budget INTEGER NOT NULL,
+                revision INTEGER NOT NULL,
+                oldest_seen REAL NOT NULL,
+                ranking TEXT NOT NULL,
+                computed_at REAL NOT NULL,
+                PRIMARY KEY (area, cuisine, budget)
+            )
+        """)
+
+    def view_key(self, intent: RequestIntent) -> Optional[Tuple[str, str, int]]:
+        """
+        요청 의도에 해당하는 뷰 키 (지역, 음식 종류, 예산 구간)를 반환합니다.
+        대상 지역이 아니거나 특정 메뉴, 최소 예산, 구간에 없는 예산, 거리 조건 등 뷰로 표현할 수 없는 조건이 있으면 None.
+        """
+        if intent.area not in self.areas or intent.keywords or intent.budget_min or intent.radius_m:
+            return None
+        if len(intent.cuisines) > 1:
+            return None
+        budget = intent.budget_max or 0
+        if budget and budget not in self.budget_bands:
+            return None
+        return intent.area, (intent.cuisines[0] if intent.cuisines else ""), budget
+
+    def refresh(self, area: str, force: bool = False) -> bool:
+        """
+        지역 정보가 바뀌었거나 뷰에 오래된 맛집이 포함된 경우에만 지역의 모든 뷰를 다시 계산합니다.
+        다시 계산했으면 True.
+        """
+        revision = self.catalog.area_revision(area)
+        computed_revision, oldest_seen = self.catalog.execute(
+            "SELECT MIN(revision), MIN(oldest_seen) FROM area_rankings WHERE area = ?", (area,)
+        )[0]
+        up_to_date = (computed_revision == revision
+                      and time.time() - oldest_seen <= self.catalog.stale_after_seconds)
+        if not force and up_to_date:
+            self.stats["skipped_areas"] += 1
+            return False
+
+        entries = [e for e in self.catalog.area_entries(area, limit=1000) if not e["stale"]]
+        cuisines_by_name = {
+            e["name"]: detect_cuisines(f"{e['category']} {e['name']} {e['menu']}") for e in entries
+        }
+        entry_by_name = {e["name"]: e for e in entries}
+        candidates = [
+            {**c, "address": entry_by_name[c["name"]]["address"]}
+            for c in CandidateEnricher.to_candidates([RestaurantCatalog.to_enriched(e) for e in entries])
+        ]
+        origin = self.distance_resolver.origin(area) if self.distance_resolver else None
+        if origin:
+            candidates, _ = self.distance_resolver.annotate(candidates, origin)
+
+        now = time.time()
+        views = []
+        for cuisine in ("",) + tuple(CUISINE_KEYWORDS):
+            pool = [c for c in candidates if not cuisine or cuisine in cuisines_by_name[c["name"]]]
+            if cuisine and not pool:
+                continue
+            for budget in (0,) + self.budget_bands:
+                ranked = self.scoring_engine.score(pool, budget=budget or None, top_k=self.top_n)
+                ranking = [{**item, "catalog": entry_by_name[item["name"]]} for item in ranked]
+                oldest = min((entry_by_name[item["name"]]["last_seen"] for item in ranked), default=now)
+                views.append((area, cuisine, budget, revision, oldest, json.dumps(ranking, ensure_ascii=False), now))
+
+        self.catalog.execute("DELETE FROM area_rankings WHERE area = ?", (area,))
+        for view in views:
+            self.catalog.execute("INSERT INTO area_rankings VALUES (?, ?, ?, ?, ?, ?, ?)", view)
+        self.stats["refreshed_areas"] += 1
+        return True
+
+    def refresh_all(self) -> List[str]:
+        """대상 지역 중 정보가 바뀐 지역만 다시 계산하고, 다시 계산한 지역 목록을 반환합니다."""
+        return [area for area in self.areas if self.refresh(area)]
+
+    def lookup(self, intent: RequestIntent) -> Optional[List[Dict[str, Any]]]:
+        """
+        요청과 일치하는 최신 뷰의 순위 목록을 반환합니다.
+        뷰가 없거나, 지역 정보가 바뀐 뒤 다시 계산되지 않았거나, 오래된 맛집이 포함되었거나,
+        결과가 min_results개 미만이면 None.
+        """
+        key = self.view_key(intent)
+        rows = self.catalog.execute(
+            "SELECT revision, oldest_seen, ranking FROM area_rankings WHERE area = ? AND cuisine = ? AND budget = ?",
+            key
+        ) if key else []
+        if rows:
+            revision, oldest_seen, ranking = rows[0]
+            ranking = json.loads(ranking)
+            fresh = (revision == self.catalog.area_revision(key[0])
+                     and time.time() - oldest_seen <= self.catalog.stale_after_seconds)
+            if fresh and len(ranking) >= self.min_results:
+                self.stats["hits"] += 1
+                return ranking
+        self.stats["misses"] += 1
+        return None
+
+    @staticmethod
+    def format_ranking(ranking: List[Dict[str, Any]]) -> str:
+        """뷰의 순위 목록을 커뮤니케이터 입력용 텍스트로 변환합니다. (점수화 결과 + 카탈로그 정보)"""
+        sections = []
+        for item in ranking:
+            # 순위/점수 줄 + 카탈로그 항목 줄 (제목 줄 제외)
+            header = CuratorScoringEngine.format_ranking([item]).split("\n")[0]
+            distance = item.get("distance")
+            entry = {**item["catalog"], "distance": None if distance is None or math.isnan(distance) else distance}
+            details = RestaurantCatalog.format_entries([entry]).split("\n")[1:]
+            sections.append("\n".join([header] + details))
+        return "\n\n".join(sections)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """뷰 적중 및 재계산 통계를 반환합니다."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {**self.stats, "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0}
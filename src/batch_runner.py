@@ -0,0 +1,127 @@
+"""
+일괄 추천 실행 모듈
+JSONL 파일의 추천 요청들을 동시 실행 수를 제한하여 처리하고, 끝나는 순서대로 결과를 JSONL로 기록합니다.
+요청 하나의 실패는 기록만 하고 나머지 요청은 계속 처리합니다.
+"""
+
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Any, Callable, List, Optional
+
+
+def load_batch_requests(path: str) -> List[Dict[str, Any]]:
+    """
+    JSONL 파일에서 요청 목록을 읽습니다.
+    각 줄은 {"id": ..., "request": "..."} 객체 또는 요청 문자열이며, 해석할 수 없는 줄은 error 항목으로 남깁니다.
+    """
+    requests = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                requests.append({"id": f"line-{line_no}", "request": "", "error": f"JSON 해석 실패: {e}"})
+                continue
+            if isinstance(item, str):
+                item = {"request": item}
+            if not isinstance(item, dict) or not str(item.get("request", "")).strip():
+                requests.append({"id": f"line-{line_no}", "request": "", "error": "request 항목이 없습니다"})
+                continue
+            requests.append({**item, "id": str(item.get("id", f"line-{line_no}"))})
+    return requests
+
+
+def _percentile(values: List[float], ratio: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))]
+
+
+class BatchRunner:
+    """
+    요청별로 워커(추천 시스템 인스턴스)를 사용해 동시에 추천을 실행하는 클래스
+    make_worker는 스레드마다 한 번 호출되어 run_restaurant_recommendation(request)와
+    recommended_restaurants를 가진 워커를 반환해야 합니다.
+    """
+
+    def __init__(self, make_worker: Callable[[], Any], max_concurrency: int = 3, logger: Any = None):
+        self.make_worker = make_worker
+        self.max_concurrency = max(1, max_concurrency)
+        self.logger = logger
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+    def _worker(self) -> Any:
+        if not hasattr(self._local, "worker"):
+            self._local.worker = self.make_worker()
+        return self._local.worker
+
+    def _run_one(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        record = {"id": item["id"], "request": item.get("request", "")}
+        if item.get("error"):
+            return {**record, "status": "error", "error": item["error"], "latency_seconds": 0.0}
+
+        start_time = time.time()
+        try:
+            worker = self._worker()
+            result = worker.run_restaurant_recommendation(item["request"])
+            restaurants = [r.to_dict() for r in (getattr(worker, "recommended_restaurants", None) or [])]
+            return {**record, "status": "ok", "latency_seconds": round(time.time() - start_time, 3),
+                    "restaurants": restaurants, "result": result}
+        except Exception as e:
+            return {**record, "status": "error", "error": f"{type(e).__name__}: {e}",
+                    "latency_seconds": round(time.time() - start_time, 3)}
+
+    def run(self, requests: List[Dict[str, Any]], output_file: Optional[str] = None,
+            on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        요청들을 실행하고 요약(성공/실패 수, 지연 시간 통계, 실패 목록)을 반환합니다.
+        output_file이 주어지면 결과가 끝나는 순서대로 한 줄씩 기록됩니다.
+        """
+        start_time = time.time()
+        output = None
+        if output_file:
+            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+            output = open(output_file, "w", encoding="utf-8")
+
+        records = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="batch") as executor:
+                futures = [executor.submit(self._run_one, item) for item in requests]
+                for future in as_completed(futures):
+                    record = future.result()
+                    records.append(record)
+                    with self._write_lock:
+                        if output:
+                            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                            output.flush()
+                    if self.logger:
+                        status = "✅" if record["status"] == "ok" else "❌"
+                        self.logger.logger.info(
+                            f"📦 일괄 추천 {len(records)}/{len(requests)} {status} {record['id']} "
+                            f"({record['latency_seconds']:.2f}초)" + (f" - {record['error']}" if record.get("error") else "")
+                        )
+                    if on_result:
+                        on_result(record)
+        finally:
+            if output:
+                output.close()
+
+        latencies = [r["latency_seconds"] for r in records if r["status"] == "ok"]
+        return {
+            "total": len(records),
+            "succeeded": len(latencies),
+            "failed": len(records) - len(latencies),
+            "failures": {r["id"]: r["error"] for r in records if r["status"] != "ok"},
+            "wall_time_seconds": round(time.time() - start_time, 3),
+            "latency_p50_seconds": _percentile(latencies, 0.5),
+            "latency_p95_seconds": _percentile(latencies, 0.95),
+            "latency_max_seconds": max(latencies, default=0.0),
+        }
@@ -0,0 +1,102 @@
+"""
+크루 레지스트리 모듈
+단계별 Crew 객체를 처음 필요할 때 한 번만 만들고, 이후 호출에서는 같은 크루를 재사용합니다.
+crewai는 kickoff마다 작업 설명을 원본 템플릿에서 다시 채우므로 호출별 입력은 섞이지 않으며,
+같은 크루의 동시 kickoff는 크루별 잠금으로 순서대로 실행합니다.
+"""
+
+import time
+import threading
+from typing import Any, Dict, List, Optional
+
+from crewai import Agent, Crew, Process, Task
+
+# 프로세스 전체(모든 워커의 레지스트리)의 크루 생성/재사용 통계
+_process_stats = {"builds": 0, "reuses": 0, "build_seconds": 0.0}
+_process_lock = threading.Lock()
+
+
+def _record(stats: Dict[str, Any], built: bool, seconds: float):
+    stats["builds" if built else "reuses"] += 1
+    stats["build_seconds"] += seconds
+
+
+def _summarize(stats: Dict[str, Any]) -> Dict[str, Any]:
+    builds, reuses = stats["builds"], stats["reuses"]
+    average = stats["build_seconds"] / builds if builds else 0.0
+    return {
+        "builds": builds,
+        "reuses": reuses,
+        "build_seconds": round(stats["build_seconds"], 4),
+        "avg_build_ms": round(average * 1000, 2),
+        # 재사용하지 않았다면 매 호출마다 들었을 생성 시간
+        "saved_seconds": round(average * reuses, 4),
+    }
+
+
+def process_stats() -> Dict[str, Any]:
+    """프로세스 전체의 크루 생성 횟수/시간과 재사용으로 절약한 시간을 반환합니다."""
+    with _process_lock:
+        return _summarize(_process_stats)
+
+
+class _Entry:
+    def __init__(self, crew: Crew):
+        self.crew = crew
+        self.lock = threading.Lock()
+
+
+class CrewRegistry:
+    """
+    (단계 이름, 작업 구성)별로 Crew를 한 번 만들어 재사용하는 클래스
+    에이전트/작업 객체가 바뀌면(setup_agents/setup_tasks 재실행) 새 레지스트리를 사용해야 합니다.
+    """
+
+    def __init__(self, logger: Any = None, **default_options):
+        self.logger = logger
+        # 크루 생성 시 기본 옵션 (단계별 옵션이 우선)
+        self.default_options = {"process": Process.sequential, "verbose": True, **default_options}
+        self.stats = {"builds": 0, "reuses": 0, "build_seconds": 0.0}
+        self.last_build_seconds = 0.0
+
+        self._lock = threading.Lock()
+        self._entries: Dict[tuple, _Entry] = {}
+
+    @staticmethod
+    def _key(name: str, agents: List[Agent], tasks: List[Task]) -> tuple:
+        # 크루가 에이전트/작업을 참조하므로 등록된 동안에는 id가 재사용되지 않음
+        return (name, tuple(id(agent) for agent in agents), tuple(id(task) for task in tasks))
+
+    def _entry(self, name: str, agents: List[Agent], tasks: List[Task], options: Dict[str, Any]) -> _Entry:
+        key = self._key(name, agents, tasks)
+        with self._lock:
+            entry = self._entries.get(key)
+            built, seconds = entry is None, 0.0
+            if built:
+                start = time.perf_counter()
+                entry = _Entry(Crew(agents=list(agents), tasks=list(tasks), **{**self.default_options, **options}))
+                seconds = time.perf_counter() - start
+                self._entries[key] = entry
+            _record(self.stats, built, seconds)
+            self.last_build_seconds = seconds
+        with _process_lock:
+            _record(_process_stats, built, seconds)
+        if built and self.logger:
+            self.logger.logger.info(f"🏗️ 크루 생성: {name} ({seconds * 1000:.1f}ms, 이후 호출은 재사용)")
+        return entry
+
+    def get(self, name: str, agents: List[Agent], tasks: List[Task], **options) -> Crew:
+        """단계 크루를 반환합니다. (없으면 options로 생성, 있으면 기존 크루 재사용)"""
+        return self._entry(name, agents, tasks, options).crew
+
+    def kickoff(self, name: str, agents: List[Agent], tasks: List[Task],
+                inputs: Optional[Dict[str, Any]] = None, **options) -> Any:
+        """단계 크루를 입력 복사본으로 실행합니다. 같은 크루의 동시 실행은 순서대로 처리됩니다."""
+        entry = self._entry(name, agents, tasks, options)
+        with entry.lock:
+            return entry.crew.kickoff(inputs=dict(inputs or {}))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """이 레지스트리의 크루 수, 생성/재사용 횟수와 생성 시간을 반환합니다."""
+        with self._lock:
+            return {"crews": len(self._entries), **_summarize(self.stats)}
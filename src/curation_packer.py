@@ -0,0 +1,159 @@
+"""
+큐레이션 요청 묶음 처리 모듈
+동시에 진행 중인 여러 추천 요청의 큐레이션 작업을 짧은 대기 시간 동안 모아 LLM 한 번으로 처리합니다.
+긴 평가 기준 설명과 에이전트 소개는 한 번만 보내고, 요청별 입력/결과는 구분 표시로 나눈 뒤 다시 분리합니다.
+묶음 응답에서 결과를 찾지 못한 요청은 None을 받아 개별 큐레이션으로 처리됩니다.
+함께 묶일 요청(대기 중인 작업이나 큐레이션 전 단계를 진행 중인 요청)이 없으면 기다리지 않고 바로 개별 처리합니다.
+"""
+
+import re
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+# 요청별 결과 구분 표시 (=== 결과 1 ===)
+_RESULT_MARKER = re.compile(r'^\s*=+\s*결과\s*(\d+)\s*=+\s*$', re.MULTILINE)
+
+
+class _Job:
+    def __init__(self, user_request: str, research_text: str):
+        self.user_request = user_request
+        self.research_text = research_text
+        self.result: Optional[str] = None
+        self.done = threading.Event()
+
+
+def build_packed_prompt(instructions: str, jobs: List[Any]) -> str:
+    """공통 지시문 한 번과 요청별 입력 구간으로 묶음 프롬프트를 만듭니다."""
+    sections = [
+        instructions.strip(),
+        f"아래 {len(jobs)}개의 독립된 요청을 각각 따로 평가하세요. 요청끼리 맛집 정보를 섞지 마세요.",
+    ]
+    for number, job in enumerate(jobs, 1):
+        sections.append(f"=== 요청 {number} ===\n사용자 요청: {job.user_request}\n\n리서처가 수집한 맛집 정보:\n{job.research_text.strip()}")
+    sections.append(
+        "각 요청의 결과를 요청 번호 순서대로 아래 형식으로만 작성하세요. 다른 설명은 쓰지 마세요.\n"
+        + "\n".join(f"=== 결과 {number} ===\n(요청 {number}의 선별 결과)" for number in range(1, len(jobs) + 1))
+    )
+    return "\n\n".join(sections)
+
+
+def split_packed_response(text: str, count: int) -> Dict[int, str]:
+    """묶음 응답을 {요청 번호: 결과 텍스트}로 나눕니다. (범위 밖 번호, 빈 결과 제외)"""
+    markers = list(_RESULT_MARKER.finditer(text or ""))
+    results: Dict[int, str] = {}
+    for index, marker in enumerate(markers):
+        number = int(marker.group(1))
+        end = markers[index + 1].start() if index + 1 < len(markers) else len(text)
+        body = text[marker.end():end].strip()
+        if 1 <= number <= count and body and number not in results:
+            results[number] = body
+    return results
+
+
+class CurationPacker:
+    """동시에 들어온 큐레이션 작업을 모아 LLM 한 번으로 처리하는 클래스"""
+
+    def __init__(self, call_fn: Callable[[str], str], instructions: str, max_batch: int = 4,
+                 window_seconds: float = 0.5, validate: Optional[Callable[[str], bool]] = None):
+        self.call_fn = call_fn
+        self.instructions = instructions
+        self.max_batch = max(1, max_batch)
+        self.window_seconds = window_seconds
+        self.validate = validate or bool
+        self.stats = {"packed_calls": 0, "packed_jobs": 0, "fallbacks": 0, "single_jobs": 0}
+
+        self._lock = threading.Lock()
+        self._pending: List[_Job] = []
+        self._collector: Optional[threading.Thread] = None
+        # request()로 등록된 진행 중인 요청 수 (아직 제출 전인 요청도 포함)
+        self._requests = 0
+
+    @classmethod
+    def from_config(cls, packing_settings: Dict[str, Any], call_fn: Callable[[str], str], instructions: str,
+                    validate: Optional[Callable[[str], bool]] = None) -> "CurationPacker":
+        """config.json의 curation_settings.packing 섹션으로 생성합니다."""
+        return cls(
+            call_fn=call_fn,
+            instructions=instructions,
+            max_batch=packing_settings.get("max_batch", 4),
+            window_seconds=packing_settings.get("window_seconds", 0.5),
+            validate=validate
+        )
+
+    @contextmanager
+    def request(self):
+        """
+        추천 요청 하나의 진행 구간(리서치부터 submit까지)을 등록합니다.
+        등록된 다른 요청이 있는 동안에만 submit이 묶을 작업을 기다립니다.
+        """
+        with self._lock:
+            self._requests += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._requests -= 1
+
+    def submit(self, user_request: str, research_text: str) -> Optional[str]:
+        """
+        큐레이션 작업을 제출하고 결과를 기다립니다.
+        함께 묶일 요청이 없거나, 묶음 응답에서 이 요청의 결과를 찾지 못했으면 None (개별 큐레이션으로 처리).
+        묶음 호출이 진행 중이면 끝날 때까지 기다립니다. (같은 작업을 개별 큐레이션으로 중복 실행하지 않음)
+        """
+        job = _Job(user_request, research_text)
+        with self._lock:
+            # 대기 중인 작업도, 진행 중인 다른 요청도 없으면 기다리지 않고 바로 개별 처리
+            if not self._pending and self._requests <= 1:
+                self.stats["single_jobs"] += 1
+                return None
+            self._pending.append(job)
+            if len(self._pending) >= self.max_batch:
+                batch, self._pending = self._pending, []
+                threading.Thread(target=self._dispatch, args=(batch,), daemon=True).start()
+            elif self._collector is None:
+                # 첫 작업이 들어오면 대기 시간 뒤에 모인 작업을 처리
+                self._collector = threading.Thread(target=self._collect, daemon=True)
+                self._collector.start()
+        # _dispatch가 항상 완료 표시를 하므로 호출 시간 제한은 call_fn(LLM timeout)에 맡김
+        job.done.wait()
+        return job.result
+
+    def _collect(self):
+        time.sleep(self.window_seconds)
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._collector = None
+        if batch:
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[_Job]):
+        try:
+            if len(batch) == 1:
+                # 묶을 요청이 없으면 기존 개별 큐레이션 작업을 그대로 사용
+                self._count("single_jobs")
+                return
+            results = split_packed_response(self.call_fn(build_packed_prompt(self.instructions, batch)), len(batch))
+            self._count("packed_calls")
+            for number, job in enumerate(batch, 1):
+                result = results.get(number)
+                if result and self.validate(result):
+                    job.result = result
+                    self._count("packed_jobs")
+                else:
+                    self._count("fallbacks")
+        except Exception:
+            self._count("fallbacks", len(batch))
+        finally:
+            for job in batch:
+                job.done.set()
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """묶음 호출 수와 개별 처리로 대체된 요청 수를 반환합니다."""
+        with self._lock:
+            return dict(self.stats)
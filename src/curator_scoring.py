@@ -0,0 +1,232 @@
+"""
+큐레이터 점수화 엔진 모듈
+후보 맛집의 속성(평점, 가격, 거리, 리뷰 수)을 NumPy 배열로 변환하고
+config.json의 evaluation_weights와 예산 조건을 한 번의 벡터 연산으로 적용하여 순위를 매깁니다.
+"""
+
+import re
+import math
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from src.recommendation_cache import fold_amounts
+
+# 평가 기준 순서 (점수 행렬의 열 순서)
+CRITERIA = ("rating", "price", "distance", "review_quality")
+
+DEFAULT_WEIGHTS = {"rating": 0.4, "price": 0.3, "distance": 0.2, "review_quality": 0.1}
+DEFAULT_PRICE_RANGES = {"low": 10000, "medium": 30000, "high": 50000}
+
+# 정보가 없는 속성에 부여하는 중립 점수
+_MISSING_SCORE = {"rating": 0.4, "price": 0.5, "distance": 0.5, "review_quality": 0.3}
+
+# 도보 1분당 이동 거리 (m)
+_WALK_METERS_PER_MINUTE = 80
+
+
+# 평점 표기 (앞에서부터 우선: 평점/별점 표시, 소수점 평점, '4/5'·'4점', 숫자만 있는 값)
+# 리뷰 수나 가격 같은 다른 숫자를 평점으로 읽지 않도록 숫자 앞뒤가 다른 숫자에 붙어 있으면 제외
+_RATING_PATTERNS = (
+    re.compile(r'(?:평점|별점|★)\s*:?\s*(\d(?:\.\d+)?)(?![\d,])'),
+    re.compile(r'(?<![\d,.])(\d\.\d+)(?![\d,])'),
+    re.compile(r'(?<![\d,.])(\d)\s*(?:/\s*5|점)'),
+    re.compile(r'^\s*(\d(?:\.\d+)?)\s*$'),
+)
+
+
+def parse_rating(text: Any) -> float:
+    """'4.2', '4.2/5', '★4.5', '평점 4.3점', '리뷰 1,234개 평점 4.5' 형식의 평점을 5점 만점 숫자로 변환합니다."""
+    if isinstance(text, (int, float)):
+        return float(text)
+    text = str(text or "")
+    match = next((m for m in (pattern.search(text) for pattern in _RATING_PATTERNS) if m), None)
+    if not match:
+        return math.nan
+    rating = float(match.group(1))
+    return rating if 0 <= rating <= 5 else math.nan
+
+
+def parse_price(text: Any) -> float:
+    """'9,000원', '1~2만원', '1만5천원', '2만원대' 형식의 가격을 원 단위 숫자로 변환합니다. (범위는 평균)"""
+    if isinstance(text, (int, float)):
+        return float(text)
+    folded = fold_amounts(str(text or ""))
+    # '1~2만원'처럼 앞 숫자에 단위가 생략된 범위
+    range_match = re.search(r'(\d+(?:\.\d+)?)\s*[~\-]\s*(\d+)원', folded)
+    if range_match:
+        high = float(range_match.group(2))
+        low = float(range_match.group(1))
+        if low < 100 and high >= 10000:
+            low *= 10000
+        return (low + high) / 2
+    amounts = [float(a) for a in re.findall(r'(\d+)원', folded)]
+    return float(np.mean(amounts)) if amounts else math.nan
+
+
+def parse_distance(text: Any) -> float:
+    """'500m', '1.2km', '도보 5분' 형식의 거리를 미터 단위 숫자로 변환합니다."""
+    if isinstance(text, (int, float)):
+        return float(text)
+    text = str(text or "")
+    match = re.search(r'(\d+(?:\.\d+)?)\s*km', text, re.IGNORECASE)
+    if match:
+        return float(match.group(1)) * 1000
+    # '500m이내'처럼 한글이 바로 붙는 표기도 허용 (영문자가 이어지는 'min' 등은 제외)
+    match = re.search(r'(\d+(?:\.\d+)?)\s*m(?![a-z])', text, re.IGNORECASE)
+    if match:
+        return float(match.group(1))
+    match = re.search(r'도보\s*(\d+)\s*분', text)
+    if match:
+        return float(match.group(1)) * _WALK_METERS_PER_MINUTE
+    return math.nan
+
+
+def parse_review_count(text: Any) -> float:
+    """'리뷰 1,234개', '방문자리뷰 320' 형식의 리뷰 수를 숫자로 변환합니다."""
+    if isinstance(text, (int, float)):
+        return float(text)
+    match = re.search(r'리뷰\s*([\d,]+)', str(text or ""))
+    return float(match.group(1).replace(",", "")) if match else math.nan
+
+
+def extract_attributes(text: str) -> Dict[str, float]:
+    """검색 결과 텍스트에서 점수화에 필요한 속성을 추출합니다."""
+    rating_match = re.search(r'(?:평점|별점|★)\s*:?\s*(\d(?:\.\d+)?)', text or "")
+    price_match = re.search(r'(?:가격|가격대|1인)\s*:?\s*([\d,.~\-\s만천원대]+원)', text or "")
+    return {
+        "rating": parse_rating(rating_match.group(1)) if rating_match else math.nan,
+        "price": parse_price(price_match.group(1)) if price_match else math.nan,
+        "distance": parse_distance(text),
+        "review_count": parse_review_count(text),
+    }
+
+
+@dataclass
+class CandidateArrays:
+    """후보 속성을 열 단위로 담은 배열 묶음"""
+    rating: np.ndarray
+    price: np.ndarray
+    distance: np.ndarray
+    review_count: np.ndarray
+
+    @classmethod
+    def from_candidates(cls, candidates: List[Dict[str, Any]]) -> "CandidateArrays":
+        return cls(
+            rating=np.array([parse_rating(c.get("rating")) for c in candidates], dtype=np.float64),
+            price=np.array([parse_price(c.get("price")) for c in candidates], dtype=np.float64),
+            distance=np.array([parse_distance(c.get("distance")) for c in candidates], dtype=np.float64),
+            review_count=np.array([parse_review_count(c.get("review_count")) for c in candidates], dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.rating)
+
+
+class CuratorScoringEngine:
+    """evaluation_weights 기반의 결정적(deterministic) 맛집 점수화 엔진"""
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None,
+                 price_ranges: Optional[Dict[str, float]] = None,
+                 max_recommendations: int = 5, budget_tolerance: float = 0.1):
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.weights = np.array([weights[c] for c in CRITERIA], dtype=np.float64)
+        self.price_ranges = {**DEFAULT_PRICE_RANGES, **(price_ranges or {})}
+        self.max_recommendations = max_recommendations
+        self.budget_tolerance = budget_tolerance
+
+    @classmethod
+    def from_config(cls, restaurant_settings: Dict[str, Any]) -> "CuratorScoringEngine":
+        """config.json의 restaurant_settings 섹션으로 엔진을 생성합니다."""
+        return cls(
+            weights=restaurant_settings.get("evaluation_weights"),
+            price_ranges=restaurant_settings.get("price_ranges"),
+            max_recommendations=restaurant_settings.get("max_recommendations", 5),
+            budget_tolerance=restaurant_settings.get("budget_tolerance", 0.1)
+        )
+
+    def criterion_scores(self, arrays: CandidateArrays, budget: Optional[float] = None) -> np.ndarray:
+        """기준별 0~1 점수 행렬 (n, 4)을 계산합니다."""
+        rating = np.clip((arrays.rating - 3.0) / 2.0, 0.0, 1.0)
+
+        if budget:
+            # 예산 대비 저렴할수록 높은 점수 (예산과 같으면 0.5)
+            price = np.clip(1.0 - 0.5 * arrays.price / budget, 0.0, 1.0)
+        else:
+            bounds = [self.price_ranges["low"], self.price_ranges["medium"], self.price_ranges["high"]]
+            price = np.select(
+                [arrays.price <= bounds[0], arrays.price <= bounds[1], arrays.price <= bounds[2]],
+                [1.0, 0.7, 0.4], default=0.1
+            )
+
+        distance = np.clip(1.0 - arrays.distance / 2000.0, 0.0, 1.0)
+        review_quality = np.clip(np.log1p(arrays.review_count) / np.log1p(1000.0), 0.0, 1.0)
+
+        scores = np.column_stack([rating, price, distance, review_quality])
+        missing = np.column_stack([
+            np.isnan(arrays.rating), np.isnan(arrays.price),
+            np.isnan(arrays.distance), np.isnan(arrays.review_count)
+        ])
+        defaults = np.array([_MISSING_SCORE[c] for c in CRITERIA])
+        return np.where(missing, defaults, scores)
+
+    def rank(self, arrays: CandidateArrays, budget: Optional[float] = None,
+             top_k: Optional[int] = None):
+        """
+        예산 필터와 가중치를 적용해 상위 top_k 후보를 고릅니다.
+        (선택된 인덱스, 기준별 점수 행렬, 총점)을 반환합니다.
+        """
+        top_k = top_k or self.max_recommendations
+        scores = self.criterion_scores(arrays, budget)
+        totals = scores @ self.weights
+
+        if budget:
+            # 가격 정보가 없는 후보는 제외하지 않음
+            over_budget = arrays.price > budget * (1 + self.budget_tolerance)
+            totals = np.where(over_budget, -np.inf, totals)
+
+        eligible = np.count_nonzero(np.isfinite(totals))
+        k = min(top_k, eligible)
+        if k == 0:
+            return np.array([], dtype=np.int64), scores, totals
+
+        top = np.argpartition(-totals, k - 1)[:k]
+        # 동점은 입력 순서를 유지하여 결과를 결정적으로 만듦
+        order = np.lexsort((top, -totals[top]))
+        return top[order], scores, totals
+
+    def score(self, candidates: List[Dict[str, Any]], budget: Optional[float] = None,
+              top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """후보 목록을 점수화하여 상위 후보를 기준별 점수와 함께 반환합니다."""
+        if not candidates:
+            return []
+        arrays = CandidateArrays.from_candidates(candidates)
+        selected, scores, totals = self.rank(arrays, budget, top_k)
+
+        ranked = []
+        for rank, index in enumerate(selected, 1):
+            ranked.append({
+                **candidates[index],
+                "rank": rank,
+                "total_score": round(float(totals[index]), 4),
+                "criterion_scores": {c: round(float(scores[index, i]), 4) for i, c in enumerate(CRITERIA)}
+            })
+        return ranked
+
+    @staticmethod
+    def format_ranking(ranked: List[Dict[str, Any]]) -> str:
+        """점수화 결과를 다음 에이전트 입력용 텍스트로 정리합니다."""
+        labels = {"rating": "평점", "price": "가격", "distance": "거리", "review_quality": "리뷰"}
+        sections = []
+        for item in ranked:
+            criteria = ", ".join(f"{labels[c]} {item['criterion_scores'][c]:.2f}" for c in CRITERIA)
+            lines = [f"[{item['rank']}위] {item['name']} (총점 {item['total_score']:.3f} / {criteria})"]
+            for key, label in (("rating", "평점"), ("price", "가격"), ("distance", "거리"), ("review_count", "리뷰 수")):
+                value = item.get(key)
+                if value is not None and not (isinstance(value, float) and math.isnan(value)):
+                    lines.append(f"- {label}: {value}")
+            if item.get("details"):
+                lines.append(f"- 수집 정보: {item['details']}")
+            sections.append("\n".join(lines))
+        return "\n\n".join(sections)
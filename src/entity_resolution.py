@@ -0,0 +1,186 @@
+"""
+맛집 개체 식별(entity resolution) 모듈
+"오빠닭 광화문점", "오빠닭(광화문)", "오빠닭 광화문"처럼 검색마다 다르게 표기된 같은 맛집을
+이름의 문자 n-gram MinHash 서명과 전화번호/주소 일치로 묶어 하나로 합칩니다.
+LSH 밴드 버킷으로 비교 대상을 찾으므로 후보 수에 대해 선형 시간으로 동작합니다.
+"""
+
+import re
+import math
+import zlib
+import unicodedata
+from dataclasses import fields, replace
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from src.geo_index import extract_address, normalize_address
+from src.restaurant_models import Restaurant
+
+# MinHash 해시 함수용 소수 (2^32보다 큰 가장 작은 소수)
+_MERSENNE_PRIME = np.uint64(4294967311)
+
+# 이름 끝의 지점 표기 ('광화문점', '본점', '2호점')
+_BRANCH_SUFFIX = re.compile(r'(본점|직영점|\d*호점|지점|점)$')
+_PHONE = re.compile(r'0\d{1,2}[-.\s]?\d{3,4}[-.\s]?\d{4}')
+
+
+def canonical_name(name: str) -> str:
+    """비교용 이름 (공백/기호 제거, 괄호 속 지점명 포함, 끝의 지점 표기 제거)"""
+    text = unicodedata.normalize("NFKC", name or "").lower()
+    text = re.sub(r'[^\w]', '', text)
+    stripped = _BRANCH_SUFFIX.sub('', text)
+    return stripped if len(stripped) >= 2 else text
+
+
+def name_shingles(name: str, n: int = 2) -> set:
+    """이름의 문자 n-gram 집합"""
+    text = canonical_name(name)
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def normalize_phone(text: str) -> Optional[str]:
+    """텍스트에서 지역/휴대전화 번호를 찾아 숫자만 남깁니다. (대표번호 15xx 등은 여러 지점이 공유하므로 제외)"""
+    match = _PHONE.search(text or "")
+    return re.sub(r'\D', '', match.group(0)) if match else None
+
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or value == "" or (isinstance(value, float) and math.isnan(value))
+
+
+def merge_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """같은 맛집 레코드를 하나로 합칩니다. (첫 레코드 우선, 빈 값은 뒤 레코드로 보완, 목록은 이어 붙임)"""
+    merged = dict(records[0])
+    for record in records[1:]:
+        for key, value in record.items():
+            if isinstance(value, list) and isinstance(merged.get(key), list):
+                merged[key] = merged[key] + value
+            elif _is_missing(merged.get(key)) and not _is_missing(value):
+                merged[key] = value
+    return merged
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # 먼저 나온 레코드를 대표로 유지
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+class EntityResolver:
+    """MinHash LSH + 전화번호/주소 일치 기반 맛집 중복 제거기"""
+
+    def __init__(self, num_perm: int = 64, bands: int = 32, threshold: float = 0.6,
+                 address_threshold: float = 0.3, max_bucket_compare: int = 8, seed: int = 42):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.address_threshold = address_threshold
+        self.max_bucket_compare = max_bucket_compare
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2 ** 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 2 ** 31, size=num_perm, dtype=np.uint64)
+
+    @classmethod
+    def from_config(cls, resolution_settings: Dict[str, Any]) -> "EntityResolver":
+        """config.json의 entity_resolution_settings 섹션으로 생성합니다."""
+        return cls(
+            num_perm=resolution_settings.get("num_perm", 64),
+            bands=resolution_settings.get("bands", 32),
+            threshold=resolution_settings.get("threshold", 0.6),
+            address_threshold=resolution_settings.get("address_threshold", 0.3)
+        )
+
+    def signature(self, shingles: set) -> np.ndarray:
+        """n-gram 집합의 MinHash 서명"""
+        if not shingles:
+            return np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+        ids = np.array([zlib.crc32(s.encode("utf-8")) for s in shingles], dtype=np.uint64)
+        hashes = (self._a[:, None] * ids[None, :] + self._b[:, None]) % _MERSENNE_PRIME
+        return hashes.min(axis=1)
+
+    def clusters(self, records: List[Dict[str, Any]]) -> List[List[int]]:
+        """
+        같은 맛집으로 판단된 레코드 인덱스 묶음을 첫 등장 순서로 반환합니다.
+        레코드는 name과 선택적으로 address, phone, details(주소/전화번호를 찾을 텍스트)를 가집니다.
+        """
+        n = len(records)
+        union_find = _UnionFind(n)
+        shingles = [name_shingles(r.get("name", "")) for r in records]
+        signatures = [self.signature(s) for s in shingles]
+
+        # 1) 이름: LSH 밴드 버킷 안에서만 비교 (버킷당 비교 수 상한)
+        buckets: Dict[Tuple[int, bytes], List[int]] = {}
+        for i, sig in enumerate(signatures):
+            if not shingles[i]:
+                continue
+            for band in range(self.bands):
+                key = (band, sig[band * self.rows:(band + 1) * self.rows].tobytes())
+                members = buckets.setdefault(key, [])
+                for j in members[:self.max_bucket_compare]:
+                    if union_find.find(i) != union_find.find(j) and \
+                            np.mean(signatures[i] == signatures[j]) >= self.threshold:
+                        union_find.union(i, j)
+                members.append(i)
+
+        # 2) 전화번호 일치, 3) 주소 일치 + 이름 일부 일치
+        by_phone: Dict[str, int] = {}
+        by_address: Dict[str, List[int]] = {}
+        for i, record in enumerate(records):
+            text = f"{record.get('phone', '')} {record.get('details', '')}"
+            phone = normalize_phone(text)
+            if phone:
+                if phone in by_phone:
+                    union_find.union(i, by_phone[phone])
+                else:
+                    by_phone[phone] = i
+
+            address = record.get("address") or extract_address(record.get("details", ""))
+            if address:
+                members = by_address.setdefault(normalize_address(address), [])
+                for j in members[:self.max_bucket_compare]:
+                    if _jaccard(shingles[i], shingles[j]) >= self.address_threshold:
+                        union_find.union(i, j)
+                members.append(i)
+
+        groups: Dict[int, List[int]] = {}
+        for i in range(n):
+            groups.setdefault(union_find.find(i), []).append(i)
+        return sorted(groups.values(), key=lambda group: group[0])
+
+    def dedupe_names(self, names: List[str]) -> List[str]:
+        """이름 목록에서 같은 맛집의 변형 표기를 제거합니다. (처음 나온 표기 유지)"""
+        return [names[group[0]] for group in self.clusters([{"name": name} for name in names])]
+
+    def merge(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """같은 맛집 레코드를 merge_records로 합친 목록을 반환합니다."""
+        return [merge_records([records[i] for i in group]) for group in self.clusters(records)]
+
+    def dedupe_restaurants(self, restaurants: List[Restaurant]) -> List[Restaurant]:
+        """추천 맛집 목록의 중복을 합치고 순위를 1부터 다시 매깁니다. (상위 순위 항목 기준)"""
+        ordered = sorted(restaurants, key=lambda r: r.rank)
+        merged = self.merge([r.to_dict() for r in ordered])
+        names = {f.name for f in fields(Restaurant)}
+        return [replace(Restaurant(**{k: v for k, v in m.items() if k in names}), rank=rank)
+                for rank, m in enumerate(merged, 1)]
@@ -0,0 +1,115 @@
+"""
+맛집 상세 정보 필드별 메모 모듈
+주소/전화번호처럼 거의 바뀌지 않는 정보와 평점/리뷰처럼 자주 바뀌는 정보의 유효 기간을 필드마다 따로 두고,
+이미 아는 맛집은 만료된 필드만 다시 검색하도록 후보별 수집 결과를 필드 단위로 저장합니다.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from src.entity_resolution import canonical_name
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 필드별 기본 유효 기간 (초)
+DEFAULT_FIELD_TTLS = {
+    "address": 90 * 24 * 3600,
+    "phone": 90 * 24 * 3600,
+    "hours": 14 * 24 * 3600,
+    "menu": 14 * 24 * 3600,
+    "price": 14 * 24 * 3600,
+    "rating": 24 * 3600,
+    "reviews": 24 * 3600,
+}
+
+
+class FieldMemo:
+    """(맛집, 지역, 필드)별 검색 결과 메모 (SQLite)"""
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, db_file: Optional[str] = None):
+        self.ttls = {**DEFAULT_FIELD_TTLS, **(ttls or {})}
+        self.db_file = db_file or ":memory:"
+
+        self._lock = threading.Lock()
+        # 메모리 DB는 연결마다 새로 생성되므로 단일 연결을 공유
+        self._memory_conn = None
+        if self.db_file == ":memory:":
+            self._memory_conn = sqlite3.connect(":memory:", check_same_thread=False)
+        else:
+            Path(self.db_file).parent.mkdir(parents=True, exist_ok=True)
+
+        self.stats = {"fresh_fields": 0, "expired_fields": 0, "stored_fields": 0}
+        self._init_db()
+
+    @classmethod
+    def from_config(cls, restaurant_settings: Dict[str, Any]) -> "FieldMemo":
+        """config.json의 restaurant_settings.field_memo 섹션으로 생성합니다."""
+        memo_settings = restaurant_settings.get("field_memo", {}) or {}
+        db_file = memo_settings.get("db_file", "cache/field_memo.db")
+        if db_file and db_file != ":memory:" and not os.path.isabs(db_file):
+            db_file = str(PROJECT_ROOT / db_file)
+        return cls(ttls=memo_settings.get("field_ttls"), db_file=db_file)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._memory_conn is not None:
+            return self._memory_conn
+        return sqlite3.connect(self.db_file, timeout=10)
+
+    def _execute(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(sql, params).fetchall()
+                conn.commit()
+                return rows
+            finally:
+                if conn is not self._memory_conn:
+                    conn.close()
+
+    def _init_db(self):
+        self._execute("""
+            CREATE TABLE IF NOT EXISTS field_memo (
+                name_key TEXT NOT NULL,
+                area TEXT NOT NULL,
+                field TEXT NOT NULL,
+                snippets TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (name_key, area, field)
+            )
+        """)
+
+    def lookup(self, name: str, area: str = "") -> Dict[str, List[Dict[str, Any]]]:
+        """유효 기간이 남은 필드의 저장된 검색 결과를 {필드: 검색 결과 목록}으로 반환합니다."""
+        rows = self._execute(
+            "SELECT field, snippets, fetched_at FROM field_memo WHERE name_key = ? AND area = ?",
+            (canonical_name(name), area)
+        )
+        now = time.time()
+        fresh = {field: json.loads(snippets) for field, snippets, fetched_at in rows
+                 if now - fetched_at <= self.ttls.get(field, 0)}
+        self.stats["fresh_fields"] += len(fresh)
+        self.stats["expired_fields"] += len(rows) - len(fresh)
+        return fresh
+
+    def store(self, name: str, area: str, fields: List[str], snippets: List[Dict[str, Any]]):
+        """이번에 검색한 필드들의 검색 결과를 저장합니다. (결과가 없으면 저장하지 않음)"""
+        if not snippets:
+            return
+        now = time.time()
+        payload = json.dumps(snippets, ensure_ascii=False)
+        for field in fields:
+            self._execute(
+                "INSERT OR REPLACE INTO field_memo VALUES (?, ?, ?, ?, ?)",
+                (canonical_name(name), area, field, payload, now)
+            )
+        self.stats["stored_fields"] += len(fields)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """메모 적중 통계를 반환합니다."""
+        return dict(self.stats)
@@ -0,0 +1,68 @@
+"""
+에이전트별 생성 프로필 모듈
+에이전트마다 최대 출력 토큰, temperature, stop 시퀀스를 다르게 설정합니다.
+커뮤니케이터나 이메일 작성자처럼 사용하는 분량이 정해진 에이전트가 필요 이상으로 길게 생성하지 않도록 합니다.
+system_settings의 temperature / max_tokens / timeout은 프로필에 없는 값의 기본값으로 사용되며,
+기본 프로필(balanced)은 아무 값도 바꾸지 않으므로 명시적으로 선택한 프로필만 system_settings보다 우선합니다.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional
+
+from crewai import LLM
+
+AGENT_NAMES = ("researcher", "research_synthesizer", "curator", "communicator",
+               "form_creator", "email_sender", "data_analyst")
+
+# 기본 프로필 (balanced: 모든 에이전트가 system_settings 사용, short: 응답 속도 우선)
+DEFAULT_PROFILES: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "balanced": {},
+    "short": {
+        "researcher": {"max_tokens": 1000, "temperature": 0.2},
+        "research_synthesizer": {"max_tokens": 1000, "temperature": 0.2},
+        "curator": {"max_tokens": 800, "temperature": 0.1},
+        "communicator": {"max_tokens": 600, "temperature": 0.3},
+        "form_creator": {"max_tokens": 800, "temperature": 0.2},
+        "email_sender": {"max_tokens": 300, "temperature": 0.5, "stop": ["\n\n\n"]},
+        "data_analyst": {"max_tokens": 1000, "temperature": 0.2},
+    },
+}
+
+
+class GenerationProfiles:
+    """에이전트별 생성 설정(최대 출력 토큰, temperature, stop, timeout)을 제공하는 클래스"""
+
+    def __init__(self, profiles: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
+                 active_profile: str = "balanced", defaults: Optional[Dict[str, Any]] = None):
+        # 설정한 프로필이 같은 이름의 기본 프로필을 대체 (balanced는 항상 비교 기준으로 사용 가능)
+        self.profiles = {**copy.deepcopy(DEFAULT_PROFILES), **(profiles or {})}
+        if active_profile not in self.profiles:
+            raise ValueError(f"생성 프로필이 없습니다: {active_profile} (사용 가능: {', '.join(self.profiles)})")
+        self.active_profile = active_profile
+        # 프로필에 없는 값의 기본값 (system_settings)
+        self.defaults = defaults or {}
+
+    @classmethod
+    def from_config(cls, generation_settings: Dict[str, Any],
+                    system_settings: Optional[Dict[str, Any]] = None) -> "GenerationProfiles":
+        """config.json의 generation_settings 섹션과 system_settings의 기본값으로 생성합니다."""
+        system_settings = system_settings or {}
+        return cls(
+            profiles=generation_settings.get("profiles"),
+            active_profile=generation_settings.get("profile", "balanced"),
+            defaults={key: system_settings[key] for key in ("temperature", "max_tokens", "timeout")
+                      if system_settings.get(key) is not None}
+        )
+
+    def settings_for(self, agent_name: str, profile: Optional[str] = None) -> Dict[str, Any]:
+        """에이전트의 생성 설정을 반환합니다. (profile을 지정하지 않으면 사용 중인 프로필)"""
+        settings = dict(self.defaults)
+        settings.update(self.profiles[profile or self.active_profile].get(agent_name, {}) or {})
+        stop: List[str] = list(settings.pop("stop", None) or [])
+        if stop:
+            settings["stop"] = stop
+        return settings
+
+    def build_llm(self, model: str, agent_name: str, profile: Optional[str] = None) -> LLM:
+        """에이전트 생성 설정을 적용한 LLM 객체를 만듭니다."""
+        return LLM(model=model, **self.settings_for(agent_name, profile))
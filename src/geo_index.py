@@ -0,0 +1,370 @@
+"""
+위치 인덱스 모듈
+정규화된 주소 -> 좌표 지오코딩 캐시(SQLite, 백엔드 교체 가능)와
+맛집 좌표의 geohash 인덱스를 제공합니다.
+"광화문역 500m 이내" 같은 조건을 반경 질의로 처리하고, 계산된 실제 거리를 점수화 엔진의 거리 기준에 사용합니다.
+"""
+
+import os
+import re
+import math
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from src.research_compactor import ADDRESS_PATTERN
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+
+EARTH_RADIUS_M = 6371008.8
+
+# 지역/역 좌표 (request_intent.AREA_GAZETTEER의 대표 지역명과 주요 별칭)
+LANDMARKS = {
+    "광화문": (37.5710, 126.9768), "광화문역": (37.5710, 126.9768),
+    "시청역": (37.5657, 126.9769), "종각역": (37.5702, 126.9831), "경복궁역": (37.5757, 126.9735),
+    "을지로": (37.5660, 126.9826), "을지로입구역": (37.5660, 126.9826), "명동역": (37.5609, 126.9863),
+    "강남역": (37.4979, 127.0276), "역삼역": (37.5006, 127.0364), "신논현역": (37.5045, 127.0250),
+    "홍대": (37.5572, 126.9245), "홍대입구역": (37.5572, 126.9245), "합정역": (37.5496, 126.9139),
+    "여의도": (37.5216, 126.9243), "여의도역": (37.5216, 126.9243),
+    "성수": (37.5446, 127.0559), "성수역": (37.5446, 127.0559),
+    "잠실": (37.5133, 127.1001), "잠실역": (37.5133, 127.1001),
+    "판교": (37.3948, 127.1112), "판교역": (37.3948, 127.1112),
+}
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이의 거리 (m)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def geohash_encode(lat: float, lng: float, precision: int = 8) -> str:
+    """좌표를 geohash 문자열로 변환합니다."""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, bit_count, even = [], 0, 0, True
+    while len(chars) < precision:
+        target, value = (lng_range, lng) if even else (lat_range, lat)
+        mid = (target[0] + target[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            target[0] = mid
+        else:
+            target[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits, bit_count = 0, 0
+    return "".join(chars)
+
+
+def geohash_cell_size(precision: int) -> Tuple[float, float]:
+    """geohash 칸 하나의 (위도 폭, 경도 폭) (도 단위)"""
+    total_bits = 5 * precision
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def normalize_address(address: str) -> str:
+    """캐시 키용 주소 정규화 (시/도 표기 통일, 층/호수와 괄호 설명 제거, 공백 정리)"""
+    text = re.sub(r'\(.*?\)', ' ', address or "")
+    text = re.sub(r'(서울|부산|대구|인천|광주|대전|울산)(특별시|광역시)', r'\1', text)
+    text = re.sub(r'\s*(지하\s*)?\d+\s*(층|F|호)\b.*$', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'[,·]', ' ', text)
+    return " ".join(text.split())
+
+
+def extract_address(text: str) -> Optional[str]:
+    """텍스트에서 도로명 주소를 찾습니다."""
+    match = ADDRESS_PATTERN.search(text or "")
+    return match.group(0) if match else None
+
+
+class StaticGeocoder:
+    """
+    네트워크 없이 동작하는 지오코더 (테스트, 오프라인 실행용)
+    LANDMARKS와 추가로 등록한 주소만 변환합니다.
+    """
+
+    name = "static"
+
+    def __init__(self, coordinates: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.coordinates = {normalize_address(k): tuple(v) for k, v in {**LANDMARKS, **(coordinates or {})}.items()}
+        self.calls = 0
+
+    def geocode(self, address: str) -> Optional[Tuple[float, float]]:
+        self.calls += 1
+        return self.coordinates.get(normalize_address(address))
+
+
+class KakaoGeocoder:
+    """카카오 로컬 API 지오코더 (KAKAO_REST_API_KEY 필요). 주소 검색 후 장소(키워드) 검색으로 재시도합니다."""
+
+    ADDRESS_URL = "https://dapi.kakao.com/v2/local/search/address.json"
+    KEYWORD_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
+    name = "kakao"
+
+    def __init__(self, api_key: Optional[str] = None, timeout: float = 5.0):
+        self.api_key = api_key or os.getenv("KAKAO_REST_API_KEY", "")
+        self.timeout = timeout
+
+    def geocode(self, address: str) -> Optional[Tuple[float, float]]:
+        import requests
+
+        headers = {"Authorization": f"KakaoAK {self.api_key}"}
+        for url in (self.ADDRESS_URL, self.KEYWORD_URL):
+            response = requests.get(url, headers=headers, params={"query": address, "size": 1}, timeout=self.timeout)
+            response.raise_for_status()
+            documents = response.json().get("documents") or []
+            if documents:
+                return float(documents[0]["y"]), float(documents[0]["x"])
+        return None
+
+
+GEOCODER_BACKENDS = {"static": StaticGeocoder, "kakao": KakaoGeocoder}
+
+
+class GeocodeCache:
+    """
+    지오코딩 결과를 정규화된 주소 기준으로 SQLite에 저장하는 캐시
+    좌표는 백엔드와 관계없이 공유하고, 변환 실패는 백엔드별로 저장합니다. (다른 백엔드로 바꾸면 다시 조회)
+    StaticGeocoder의 실패는 저장하지 않습니다. (조회 비용이 없고, 등록한 좌표가 바로 반영되도록)
+    """
+
+    def __init__(self, backend: Any = None, db_file: Optional[str] = None,
+                 negative_ttl_seconds: float = 24 * 3600):
+        self.backend = backend or StaticGeocoder()
+        self.db_file = db_file or ":memory:"
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.backend_name = getattr(self.backend, "name", type(self.backend).__name__)
+        self.cache_failures = not isinstance(self.backend, StaticGeocoder)
+
+        self._lock = threading.Lock()
+        # 메모리 DB는 연결마다 새로 생성되므로 단일 연결을 공유
+        self._memory_conn = None
+        if self.db_file == ":memory:":
+            self._memory_conn = sqlite3.connect(":memory:", check_same_thread=False)
+        else:
+            Path(self.db_file).parent.mkdir(parents=True, exist_ok=True)
+
+        self.stats = {"hits": 0, "misses": 0, "failures": 0}
+        self._init_db()
+
+    @classmethod
+    def from_config(cls, geo_settings: Dict[str, Any]) -> "GeocodeCache":
+        """config.json의 geo_settings 섹션으로 생성합니다. (backend: static / kakao)"""
+        db_file = geo_settings.get("db_file", "cache/geocode_cache.db")
+        if db_file and db_file != ":memory:" and not os.path.isabs(db_file):
+            db_file = str(PROJECT_ROOT / db_file)
+        backend_name = geo_settings.get("backend", "static")
+        if backend_name == "static":
+            backend = StaticGeocoder(geo_settings.get("coordinates"))
+        else:
+            backend = GEOCODER_BACKENDS[backend_name]()
+        return cls(
+            backend=backend,
+            db_file=db_file,
+            negative_ttl_seconds=geo_settings.get("negative_ttl_seconds", 24 * 3600)
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._memory_conn is not None:
+            return self._memory_conn
+        return sqlite3.connect(self.db_file, timeout=10)
+
+    def _execute(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(sql, params).fetchall()
+                conn.commit()
+                return rows
+            finally:
+                if conn is not self._memory_conn:
+                    conn.close()
+
+    def _init_db(self):
+        self._execute("""
+            CREATE TABLE IF NOT EXISTS geocodes (
+                address TEXT PRIMARY KEY,
+                lat REAL,
+                lng REAL,
+                created_at REAL NOT NULL
+            )
+        """)
+
+    def geocode(self, address: str) -> Optional[Tuple[float, float]]:
+        """
+        주소의 (위도, 경도)를 반환합니다. 변환에 실패한 주소는 negative_ttl_seconds 동안 다시 조회하지 않습니다.
+        """
+        key = normalize_address(address)
+        if not key:
+            return None
+        # 실패 기록은 '백엔드|주소' 키 (이전 버전의 주소 키 실패 기록은 무시)
+        failure_key = f"{self.backend_name}|{key}"
+        rows = self._execute("SELECT address, lat, lng, created_at FROM geocodes WHERE address IN (?, ?)",
+                             (key, failure_key))
+        for address, lat, lng, created_at in rows:
+            if address == key and lat is not None:
+                self.stats["hits"] += 1
+                return lat, lng
+        for address, lat, lng, created_at in rows:
+            if address == failure_key and time.time() - created_at <= self.negative_ttl_seconds:
+                self.stats["hits"] += 1
+                return None
+
+        self.stats["misses"] += 1
+        try:
+            coordinates = self.backend.geocode(key)
+        except Exception:
+            # 네트워크 오류는 캐시하지 않음
+            self.stats["failures"] += 1
+            return None
+        if coordinates:
+            self._execute("INSERT OR REPLACE INTO geocodes VALUES (?, ?, ?, ?)", (key, *coordinates, time.time()))
+        elif self.cache_failures:
+            self._execute("INSERT OR REPLACE INTO geocodes VALUES (?, NULL, NULL, ?)", (failure_key, time.time()))
+        return coordinates
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {**self.stats, "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0}
+
+
+class GeoIndex:
+    """
+    geohash 칸 단위 버킷 인덱스
+    반경 질의는 반경보다 큰 칸 크기의 geohash 접두어로 중심 칸과 주변 8칸의 후보만 고른 뒤
+    실제 거리(haversine)로 걸러냅니다.
+    """
+
+    def __init__(self, precision: int = 8):
+        self.precision = precision
+        self._points: List[Tuple[str, float, float]] = []
+        self._buckets: Dict[str, List[int]] = {}
+        self._keys = set()
+
+    def add(self, key: str, lat: float, lng: float):
+        index = len(self._points)
+        self._points.append((key, lat, lng))
+        self._keys.add(key)
+        geohash = geohash_encode(lat, lng, self.precision)
+        for length in range(1, self.precision + 1):
+            self._buckets.setdefault(geohash[:length], []).append(index)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def _query_precision(self, lat: float, radius_m: float) -> int:
+        """칸의 가로/세로가 모두 반경 이상인 가장 긴 geohash 길이"""
+        meters_per_degree = math.pi * EARTH_RADIUS_M / 180
+        for length in range(self.precision, 0, -1):
+            lat_size, lng_size = geohash_cell_size(length)
+            if min(lat_size * meters_per_degree,
+                   lng_size * meters_per_degree * math.cos(math.radians(lat))) >= radius_m:
+                return length
+        return 0
+
+    def within(self, lat: float, lng: float, radius_m: float) -> List[Tuple[str, float]]:
+        """중심에서 radius_m 이내의 (키, 거리 m) 목록을 가까운 순으로 반환합니다."""
+        length = self._query_precision(lat, radius_m)
+        if length == 0:
+            candidates = range(len(self._points))
+        else:
+            lat_size, lng_size = geohash_cell_size(length)
+            cells = {geohash_encode(lat + dy * lat_size, lng + dx * lng_size, length)
+                     for dy in (-1, 0, 1) for dx in (-1, 0, 1)}
+            candidates = {i for cell in cells for i in self._buckets.get(cell, ())}
+
+        found = []
+        for i in candidates:
+            key, point_lat, point_lng = self._points[i]
+            distance = haversine_m(lat, lng, point_lat, point_lng)
+            if distance <= radius_m:
+                found.append((key, distance))
+        return sorted(found, key=lambda item: (item[1], item[0]))
+
+
+class DistanceResolver:
+    """요청 위치와 후보 주소로 실제 거리를 계산해 점수화용 후보에 채워 넣는 클래스"""
+
+    def __init__(self, geocoder: GeocodeCache):
+        self.geocoder = geocoder
+        # 지역 -> (카탈로그 revision, 인덱스). 지역 정보가 바뀌면 다시 생성
+        self._indexes: Dict[str, Tuple[int, GeoIndex]] = {}
+
+    def origin(self, place: Optional[str]) -> Optional[Tuple[float, float]]:
+        """요청 지역/역 이름의 좌표"""
+        return self.geocoder.geocode(place) if place else None
+
+    def annotate(self, candidates: List[Dict[str, Any]], origin: Tuple[float, float],
+                 radius_m: Optional[float] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        후보의 주소(address 또는 details에서 추출)를 좌표로 바꾸어 거리(m)를 채웁니다.
+        radius_m이 주어지면 반경 질의로 반경 밖 후보를 제외하며, (후보 목록, 제외된 이름 목록)을 반환합니다.
+        좌표를 알 수 없는 후보는 기존 거리 정보를 유지하고 제외하지 않습니다.
+        """
+        located: Dict[int, Tuple[float, float]] = {}
+        for i, candidate in enumerate(candidates):
+            address = candidate.get("address") or extract_address(candidate.get("details", ""))
+            coordinates = self.geocoder.geocode(address) if address else None
+            if coordinates:
+                located[i] = coordinates
+
+        if radius_m:
+            index = GeoIndex()
+            for i, (lat, lng) in located.items():
+                index.add(str(i), lat, lng)
+            distances = {int(key): distance for key, distance in index.within(origin[0], origin[1], radius_m)}
+        else:
+            distances = {i: haversine_m(origin[0], origin[1], lat, lng) for i, (lat, lng) in located.items()}
+
+        kept, rejected = [], []
+        for i, candidate in enumerate(candidates):
+            if i in located and i not in distances:
+                rejected.append(candidate["name"])
+                continue
+            if i in distances:
+                candidate = {**candidate, "distance": round(distances[i], 1)}
+            kept.append(candidate)
+        return kept, rejected
+
+    def catalog_index(self, catalog: Any, area: str) -> GeoIndex:
+        """카탈로그의 지역 맛집 좌표 인덱스 (좌표를 알 수 있는 맛집만 포함)"""
+        revision = catalog.area_revision(area)
+        cached = self._indexes.get(area)
+        if cached and cached[0] == revision:
+            return cached[1]
+        index = GeoIndex()
+        for entry in catalog.area_entries(area, limit=1000):
+            coordinates = self.geocoder.geocode(entry["address"]) if entry["address"] else None
+            if coordinates:
+                index.add(entry["name"], *coordinates)
+        self._indexes[area] = (revision, index)
+        return index
+
+    def filter_entries(self, catalog: Any, area: str, entries: List[Dict[str, Any]],
+                       origin: Tuple[float, float], radius_m: float) -> List[Dict[str, Any]]:
+        """카탈로그 항목 중 반경 밖으로 확인된 맛집을 제외하고, 반경 안의 맛집에는 거리(m)를 채웁니다."""
+        index = self.catalog_index(catalog, area)
+        nearby = dict(index.within(origin[0], origin[1], radius_m))
+        filtered = []
+        for entry in entries:
+            if entry["name"] in nearby:
+                filtered.append({**entry, "distance": round(nearby[entry["name"]], 1)})
+            elif entry["name"] not in index:
+                filtered.append(entry)
+        return filtered
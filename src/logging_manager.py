@@ -33,6 +33,8 @@ class LoggingManager:
         # 로거 설정
         self.logger = self._setup_logger()
         self.task_logs = []
+        self.cache_stats: Dict[str, Dict[str, Any]] = {}
+        self.compaction_stats: Dict[str, Dict[str, int]] = {}
         self._lock = threading.Lock()
         
     def _setup_logger(self) -> logging.Logger:
@@ -72,6 +74,10 @@ class LoggingManager:
         self.logger.info("=" * 80)
         self.logger.info(f"🏁 맛집 추천 시스템 세션 종료 - {self.session_id}")
         self.logger.info(f"📈 세션 결과: {json.dumps(results, ensure_ascii=False, indent=2)}")
+        if self.cache_stats:
+            self.logger.info(f"🗄️ 캐시 통계: {json.dumps(self.cache_stats, ensure_ascii=False, indent=2)}")
+        if self.compaction_stats:
+            self.logger.info(f"🗜️ 압축 통계: {json.dumps(self.compaction_stats, ensure_ascii=False, indent=2)}")
         self.logger.info("=" * 80)
         
         # Task 로그를 JSON 파일로 저장
@@ -235,6 +241,28 @@ class LoggingManager:
         self.logger.info(f"📝 제목: {subject}")
         self.logger.info(f"📄 템플릿: {template_used}")
     
+    def log_cache_event(self, cache_name: str, event: str, key: str, stats: Dict[str, Any]):
+        """캐시 조회/저장 로깅 및 캐시 통계 갱신"""
+        with self._lock:
+            self.cache_stats[cache_name] = dict(stats)
+        
+        self.logger.info(f"🗄️ 캐시 {event}: {cache_name} - {key}")
+        self.logger.debug(f"캐시 통계: {json.dumps(stats, ensure_ascii=False)}")
+    
+    def log_compaction(self, stage: str, input_tokens: int, output_tokens: int, candidates: int):
+        """단계 간 전달 텍스트 압축 로깅 및 세션 누적 토큰 통계 갱신"""
+        with self._lock:
+            stats = self.compaction_stats.setdefault(stage, {"calls": 0, "input_tokens": 0, "output_tokens": 0})
+            stats["calls"] += 1
+            stats["input_tokens"] += input_tokens
+            stats["output_tokens"] += output_tokens
+        
+        reduction = 1 - output_tokens / input_tokens if input_tokens else 0.0
+        self.logger.info(
+            f"🗜️ 압축 {stage}: {input_tokens:,} → {output_tokens:,} 토큰 "
+            f"({reduction:.0%} 감소, 항목 {candidates}개)"
+        )
+    
     def _save_task_logs(self):
         """Task 로그를 JSON 파일로 저장"""
         try:
@@ -256,6 +284,8 @@ class LoggingManager:
             "completed_tasks": completed_tasks,
             "error_tasks": error_tasks,
             "total_execution_time": total_execution_time,
+            "cache_stats": dict(self.cache_stats),
+            "compaction_stats": dict(self.compaction_stats),
             "log_files": {
                 "session_log": str(self.session_log_file),
                 "task_log": str(self.task_log_file)
@@ -0,0 +1,68 @@
+"""
+에이전트별 모델 라우팅 모듈
+리서치/큐레이션처럼 판단이 필요한 에이전트는 기본 모델을, 보고서 정리·설문 초안·이메일 작성처럼
+형식이 정해진 에이전트는 더 가볍고 빠른 모델을 사용하도록 계획(plan)별로 에이전트 → 모델을 지정합니다.
+계획에 없는 에이전트는 system_settings의 llm_model을 그대로 사용합니다.
+"""
+
+import copy
+from typing import Any, Dict, Optional
+
+from src.generation_profiles import AGENT_NAMES
+
+# 기본 계획 (single: 모든 에이전트가 기본 모델 사용 - 기존 동작)
+DEFAULT_PLANS: Dict[str, Dict[str, str]] = {
+    "single": {},
+}
+
+
+def model_string(llm_provider: str, llm_model: str) -> str:
+    """
+    config의 모델 이름을 LiteLLM 형식으로 바꿉니다.
+    gemini 제공자의 gemini-* 모델에만 'gemini/' 접두사를 붙이고, 이미 접두사가 있거나 다른 모델(gpt-4o-mini 등)은 그대로 둡니다.
+    """
+    if llm_provider == "gemini" and "/" not in llm_model and llm_model.startswith("gemini"):
+        return f"gemini/{llm_model}"
+    return llm_model
+
+
+class ModelRouter:
+    """계획(plan)별로 에이전트가 사용할 모델을 정하는 클래스"""
+
+    def __init__(self, default_model: str, plans: Optional[Dict[str, Dict[str, str]]] = None,
+                 active_plan: str = "single", llm_provider: str = "gemini"):
+        self.default_model = default_model
+        self.plans = {**copy.deepcopy(DEFAULT_PLANS), **(plans or {})}
+        self.llm_provider = llm_provider
+        self.active_plan = "single"
+        self.select(active_plan)
+
+    @classmethod
+    def from_config(cls, model_routing_settings: Dict[str, Any], system_settings: Dict[str, Any]) -> "ModelRouter":
+        """config.json의 model_routing 섹션과 system_settings의 기본 모델로 생성합니다."""
+        llm_provider = system_settings.get("llm_provider", "gemini")
+        default_model = system_settings.get("llm_model", "gemini-2.0-flash" if llm_provider == "gemini" else "gpt-3.5-turbo")
+        return cls(
+            default_model=model_string(llm_provider, default_model),
+            plans=model_routing_settings.get("plans"),
+            active_plan=model_routing_settings.get("plan", "single"),
+            llm_provider=llm_provider
+        )
+
+    def select(self, plan: str):
+        """사용할 계획을 바꿉니다. (바꾼 뒤 setup_agents를 다시 실행해야 에이전트에 반영됩니다)"""
+        if plan not in self.plans:
+            raise ValueError(f"모델 라우팅 계획이 없습니다: {plan} (사용 가능: {', '.join(self.plans)})")
+        unknown = set(self.plans[plan]) - set(AGENT_NAMES)
+        if unknown:
+            raise ValueError(f"모델 라우팅 계획 {plan}에 알 수 없는 에이전트가 있습니다: {', '.join(sorted(unknown))}")
+        self.active_plan = plan
+
+    def model_for(self, agent_name: str, plan: Optional[str] = None) -> str:
+        """에이전트가 사용할 모델(LiteLLM 형식)을 반환합니다. (plan을 지정하지 않으면 사용 중인 계획)"""
+        model = self.plans[plan or self.active_plan].get(agent_name)
+        return model_string(self.llm_provider, model) if model else self.default_model
+
+    def describe(self, plan: Optional[str] = None) -> Dict[str, str]:
+        """계획의 에이전트별 모델 {에이전트: 모델}"""
+        return {agent_name: self.model_for(agent_name, plan) for agent_name in AGENT_NAMES}
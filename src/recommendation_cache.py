@@ -0,0 +1,209 @@
+"""
+맛집 추천 결과 캐시 모듈
+정규화된 사용자 요청을 키로 추천 결과를 LRU + TTL 방식으로 캐싱하고 디스크에 저장합니다.
+"""
+
+import os
+import re
+import json
+import time
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 요청 끝에 붙는 조사 (긴 것부터 검사)
+_PARTICLES = ("에서", "으로", "까지", "부터", "의", "을", "를", "은", "는", "이", "가", "에", "로", "와", "과", "도")
+
+# 캐시 키에 영향을 주지 않는 요청 표현
+_FILLER_WORDS = {
+    "찾아줘", "찾아주세요", "추천해줘", "추천해주세요", "추천", "알려줘", "알려주세요",
+    "부탁해", "부탁합니다", "좀", "please",
+}
+
+
+def fold_amounts(text: str) -> str:
+    """'3만원', '1만 5천원', '9,000원' 같은 금액 표현을 원 단위 숫자로 통일합니다."""
+    # 천 단위 구분 쉼표 제거: 9,000 -> 9000
+    text = re.sub(r'(?<=\d),(?=\d{3})', '', text)
+
+    def _man_to_won(match: re.Match) -> str:
+        man = float(match.group(1))
+        chun = int(match.group(2)) if match.group(2) else 0
+        return f"{int(man * 10000 + chun * 1000)}원"
+
+    # 1만5천원, 3만 원, 2.5만원
+    text = re.sub(r'(\d+(?:\.\d+)?)\s*만\s*(?:(\d+)\s*천)?\s*원?', _man_to_won, text)
+    # 5천원
+    text = re.sub(r'(\d+)\s*천\s*원?', lambda m: f"{int(m.group(1)) * 1000}원", text)
+    # 9000 원 -> 9000원
+    text = re.sub(r'(\d+)\s+원', r'\1원', text)
+    return text
+
+
+def _strip_particle(token: str) -> str:
+    """토큰 끝의 조사를 제거합니다."""
+    for particle in _PARTICLES:
+        if token.endswith(particle) and len(token) > len(particle) + 1:
+            return token[:-len(particle)]
+    return token
+
+
+def request_words(user_request: str) -> List[Tuple[str, str]]:
+    """
+    정규화한 요청의 (원래 단어, 조사를 제거한 토큰) 목록을 반환합니다.
+    '떡볶이'처럼 조사와 같은 글자로 끝나는 단어는 원래 단어로 판단할 수 있도록 함께 반환합니다.
+    """
+    text = unicodedata.normalize("NFKC", user_request or "").lower()
+    text = fold_amounts(text)
+    text = re.sub(r'[^\w\s]', ' ', text)
+
+    words = []
+    for word in text.split():
+        token = _strip_particle(word)
+        if token and token not in _FILLER_WORDS:
+            words.append((word, token))
+    return words
+
+
+def normalize_request(user_request: str) -> str:
+    """
+    사용자 요청을 캐시 키로 사용할 수 있도록 정규화합니다.
+    공백, 조사, 금액 표기, 요청 표현의 차이를 흡수합니다.
+    """
+    return " ".join(token for _, token in request_words(user_request))
+
+
+class RecommendationCache:
+    """정규화된 요청 키 기반의 LRU + TTL 추천 결과 캐시"""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 6 * 3600,
+                 cache_file: Optional[str] = None,
+                 key_fn: Callable[[str], str] = normalize_request):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.key_fn = key_fn
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+        self._load()
+
+    @classmethod
+    def from_config(cls, cache_settings: Dict[str, Any],
+                    key_fn: Callable[[str], str] = normalize_request) -> "RecommendationCache":
+        """config.json의 cache_settings.recommendation 섹션으로 캐시를 생성합니다."""
+        cache_file = cache_settings.get("cache_file", "cache/recommendation_cache.json")
+        if cache_file and not os.path.isabs(cache_file):
+            cache_file = str(PROJECT_ROOT / cache_file)
+        return cls(
+            max_entries=cache_settings.get("max_entries", 256),
+            ttl_seconds=cache_settings.get("ttl_seconds", 6 * 3600),
+            cache_file=cache_file,
+            key_fn=key_fn
+        )
+
+    def make_key(self, user_request: str) -> str:
+        """사용자 요청에서 캐시 키를 생성합니다."""
+        return self.key_fn(user_request)
+
+    def get(self, user_request: str) -> Optional[str]:
+        """캐시된 추천 결과를 반환합니다. 없거나 만료된 경우 None"""
+        key = self.make_key(user_request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            if self._is_expired(entry):
+                del self._entries[key]
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            entry["hits"] = entry.get("hits", 0) + 1
+            self.stats["hits"] += 1
+            return entry["result"]
+
+    def put(self, user_request: str, result: str):
+        """추천 결과를 캐시에 저장합니다."""
+        key = self.make_key(user_request)
+        with self._lock:
+            self._entries[key] = {
+                "request": user_request,
+                "result": result,
+                "created_at": time.time(),
+                "hits": 0
+            }
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+            self._save()
+
+    def clear(self):
+        """캐시를 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+            self._save()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계를 반환합니다."""
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "entries": len(self._entries),
+                "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        if not self.ttl_seconds or self.ttl_seconds <= 0:
+            return False
+        return time.time() - entry["created_at"] > self.ttl_seconds
+
+    def _load(self):
+        """디스크에 저장된 캐시를 로딩합니다. (만료된 항목은 제외)"""
+        if not self.cache_file or not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+
+        # 파일에는 오래된 순서대로 저장되어 있음
+        for entry in data.get("entries", []):
+            if "key" not in entry or self._is_expired(entry):
+                continue
+            self._entries[entry.pop("key")] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _save(self):
+        """캐시를 디스크에 저장합니다. (호출자가 lock을 보유해야 함)"""
+        if not self.cache_file:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            data = {"entries": [{"key": key, **entry} for key, entry in self._entries.items()]}
+            tmp_file = self.cache_file.with_suffix(self.cache_file.suffix + ".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            # 디스크 저장 실패는 메모리 캐시 동작에 영향을 주지 않음
+            pass
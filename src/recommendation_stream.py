@@ -0,0 +1,136 @@
+"""
+추천 결과 스트리밍 모듈
+crewai 이벤트 버스의 LLM 스트리밍 청크(LLMStreamChunkEvent) 중 추천 마지막 단계 작업의 최종 답변 부분만 골라
+콜백과 반복자로 전달합니다. 전체 보고서가 완성되기 전에 첫 토큰부터 사용자에게 보여줄 수 있습니다.
+"""
+
+import time
+import queue
+import threading
+from typing import Any, Callable, Iterator, List, Optional
+
+from crewai.events import crewai_event_bus, LLMCallStartedEvent, LLMStreamChunkEvent
+
+# 에이전트 응답에서 최종 답변이 시작되는 표시 (그 전의 Thought 부분은 전달하지 않음)
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+# 이벤트 버스 핸들러는 해제할 수 없으므로 한 번만 등록하고 활성 릴레이로 전달
+_active_relays: List["StreamRelay"] = []
+_relay_lock = threading.Lock()
+_handlers_registered = False
+
+
+def _register_handlers():
+    global _handlers_registered
+    with _relay_lock:
+        if _handlers_registered:
+            return
+
+        @crewai_event_bus.on(LLMCallStartedEvent)
+        def _on_call_started(source, event):
+            for relay in list(_active_relays):
+                relay.on_call_started(event)
+
+        @crewai_event_bus.on(LLMStreamChunkEvent)
+        def _on_chunk(source, event):
+            for relay in list(_active_relays):
+                relay.on_chunk(event)
+
+        _handlers_registered = True
+
+
+class TokenStream:
+    """토큰을 콜백으로 즉시 전달하고, 반복자로도 읽을 수 있는 스트림"""
+
+    def __init__(self, callback: Optional[Callable[[str], None]] = None):
+        self.callback = callback
+        self.started_at = time.time()
+        self.first_token_at: Optional[float] = None
+        self.result: Optional[str] = None
+        self.error: Optional[BaseException] = None
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+
+    def push(self, text: str):
+        """토큰을 전달합니다."""
+        if not text:
+            return
+        if self.first_token_at is None:
+            self.first_token_at = time.time()
+        if self.callback:
+            self.callback(text)
+        self._queue.put(text)
+
+    def close(self, result: Optional[str] = None, error: Optional[BaseException] = None):
+        """스트림을 닫습니다. (최종 결과 또는 오류 기록)"""
+        self.result = result
+        self.error = error
+        self._queue.put(None)
+
+    def __iter__(self) -> Iterator[str]:
+        """닫힐 때까지 토큰을 반환합니다. 실행 중 오류가 있었으면 마지막에 다시 발생시킵니다."""
+        while True:
+            text = self._queue.get()
+            if text is None:
+                break
+            yield text
+        if self.error is not None:
+            raise self.error
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """시작부터 첫 토큰까지 걸린 시간(초). 토큰이 없었으면 None."""
+        return self.first_token_at - self.started_at if self.first_token_at else None
+
+
+class StreamRelay:
+    """지정한 작업의 LLM 스트리밍 청크에서 최종 답변 부분을 push 함수(예: TokenStream.push)로 전달하는 컨텍스트 매니저"""
+
+    def __init__(self, push: Callable[[str], None]):
+        self.push = push
+        self._task_ids = set()
+        # 작업별 최종 답변 표시 전까지의 텍스트 (표시 이후에는 None)
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def watch(self, tasks: List[Any]):
+        """전달할 작업을 지정합니다. (이전 지정은 대체)"""
+        with self._lock:
+            self._task_ids = {task.id for task in tasks}
+            self._pending = {}
+
+    def on_call_started(self, event: LLMCallStartedEvent):
+        # 같은 작업의 LLM 재호출은 다시 최종 답변 표시부터 전달
+        with self._lock:
+            if event.task_id in self._task_ids:
+                self._pending[event.task_id] = ""
+
+    def on_chunk(self, event: LLMStreamChunkEvent):
+        with self._lock:
+            if event.task_id not in self._task_ids:
+                return
+            pending = self._pending.get(event.task_id, "")
+            if pending is None:
+                text = event.chunk
+            else:
+                pending += event.chunk
+                index = pending.find(FINAL_ANSWER_MARKER)
+                if index < 0:
+                    self._pending[event.task_id] = pending
+                    return
+                text = pending[index + len(FINAL_ANSWER_MARKER):].lstrip()
+                # 표시 직후 공백만 온 경우 다음 청크의 앞 공백도 제거하도록 표시를 유지
+                self._pending[event.task_id] = None if text else FINAL_ANSWER_MARKER
+        if text:
+            self.push(text)
+
+    def __enter__(self) -> "StreamRelay":
+        _register_handlers()
+        with _relay_lock:
+            _active_relays.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with _relay_lock:
+            if self in _active_relays:
+                _active_relays.remove(self)
+        return False
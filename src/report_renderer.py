@@ -0,0 +1,79 @@
+"""
+추천 보고서 템플릿 렌더러 모듈
+큐레이션 결과(맛집별 점수, 추천 이유, 수집 정보)를 커뮤니케이터 작업이 요구하는 고정 형식 보고서로 바로 변환합니다.
+모든 맛집에 추천 이유가 있으면 커뮤니케이터 LLM 호출을 생략하고,
+추천 이유가 없는 등 렌더링할 수 없는 경우에만 None을 반환해 LLM 작성으로 대체하도록 합니다.
+"""
+
+import re
+from typing import Dict, Any, List, Optional
+
+from src.request_intent import RequestIntent
+from src.research_compactor import ResearchCompactor, CURATION_FIELDS
+from src.restaurant_models import RecommendationOutput, RestaurantItem
+
+# 큐레이션 작업의 출력 형식 (템플릿 렌더링과 결과 압축이 읽는 맛집별 고정 구성)
+CURATION_OUTPUT_FORMAT = """
+            **출력 형식 (맛집마다 아래 구성을 그대로 사용하고, 추천 순위 순서대로 작성):**
+            ## 맛집 이름
+            - 점수: 100점 만점 점수
+            - 평점: 예) 4.3
+            - 가격: 예) 1인 12,000원
+            - 주소: 도로명 주소
+            - 대표 메뉴: 메뉴 이름
+            - 강점: 한 문장
+            - 약점: 한 문장
+            - 추천 이유: 한두 문장
+
+            제목 줄에는 번호나 순위를 붙이지 말고 맛집 이름만 쓰며, 모르는 항목은 줄을 생략하세요."""
+
+# 큐레이션 결과 항목 -> 보고서 항목
+_REPORT_FIELDS = ("address", "phone", "rating", "price", "menu", "hours", "url", "category", "distance", "reason")
+
+
+def build_summary(intent: Optional[RequestIntent], count: int) -> str:
+    """요청 의도로 보고서 첫머리의 한 문장 요약을 만듭니다."""
+    parts = []
+    if intent is not None:
+        parts = [p for p in (intent.area_alias or intent.area, "/".join(intent.cuisines)) if p]
+        if intent.budget_max:
+            parts.append(f"1인 {intent.budget_max:,}원 이하")
+    prefix = " ".join(parts) + " " if parts else ""
+    return f"{prefix}맛집 {count}곳을 추천 순위대로 정리했습니다."
+
+
+class ReportRenderer:
+    """큐레이션 결과를 커뮤니케이터 형식의 추천 결과로 변환하는 렌더러"""
+
+    def __init__(self, compactor: Optional[ResearchCompactor] = None, max_recommendations: int = 5):
+        self.compactor = compactor or ResearchCompactor(fields=CURATION_FIELDS)
+        self.max_recommendations = max_recommendations
+        self.stats = {"rendered": 0, "fallbacks": 0}
+
+    def to_output(self, curated_text: str, intent: Optional[RequestIntent] = None) -> Optional[RecommendationOutput]:
+        """
+        큐레이션 결과 텍스트를 RecommendationOutput으로 변환합니다. (등장 순서가 순위)
+        맛집을 찾지 못했거나 추천 이유가 없는 맛집이 있으면 None.
+        """
+        candidates = self.compactor.extract_candidates(curated_text)
+        items: List[Dict[str, Any]] = []
+        for name, facts in list(candidates.items())[:self.max_recommendations]:
+            if not facts.get("reason"):
+                items = []
+                break
+            # 점수화 엔진 순위 줄의 "(총점 ...)" 제거
+            name = re.sub(r'\s*\((?:총점|점수)[^)]*\)\s*$', '', name)
+            items.append({"rank": len(items) + 1, "name": name,
+                          **{field: facts[field] for field in _REPORT_FIELDS if facts.get(field)}})
+        if not items:
+            self.stats["fallbacks"] += 1
+            return None
+        self.stats["rendered"] += 1
+        return RecommendationOutput(
+            summary=build_summary(intent, len(items)),
+            restaurants=[RestaurantItem(**item) for item in items]
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """템플릿 렌더링과 LLM 대체 횟수를 반환합니다."""
+        return dict(self.stats)
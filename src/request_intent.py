@@ -0,0 +1,229 @@
+"""
+요청 의도 파싱 모듈
+"강남역 주변 2만원 이하의 일식 맛집" 같은 요청에서 지역, 예산, 음식 종류를 규칙 기반으로 추출합니다.
+추출한 의도는 추천/검색 캐시 키와 LLM 호출 전 후보 사전 필터링에 사용됩니다.
+"""
+
+import re
+import math
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+
+from src.recommendation_cache import fold_amounts, normalize_request, request_words
+from src.curator_scoring import parse_distance
+
+# 대표 지역명 -> 같은 상권으로 취급하는 별칭 ('역'이 붙은 표기는 자동으로 포함)
+AREA_GAZETTEER = {
+    "광화문": ("광화문", "시청", "서울시청", "종각", "경복궁", "서촌"),
+    "을지로": ("을지로", "을지로입구", "을지로3가", "명동", "충무로"),
+    "강남역": ("강남", "역삼", "신논현"),
+    "홍대": ("홍대", "홍대입구", "합정", "상수", "연남동"),
+    "여의도": ("여의도", "여의나루", "국회의사당"),
+    "성수": ("성수", "성수동", "뚝섬", "서울숲"),
+    "잠실": ("잠실", "송리단길", "석촌"),
+    "판교": ("판교", "판교테크노밸리"),
+}
+
+# 음식 종류 -> 해당 종류로 판단하는 키워드 (첫 번째 항목은 종류 자체를 뜻하는 단어)
+CUISINE_KEYWORDS = {
+    "한식": ("한식", "한식당", "국밥", "백반", "찌개", "김치찌개", "된장찌개", "비빔밥", "불고기", "갈비",
+            "삼겹살", "한우", "냉면", "칼국수", "설렁탕", "곰탕", "보쌈", "족발"),
+    "일식": ("일식", "일식당", "초밥", "스시", "라멘", "돈카츠", "돈까스", "우동", "소바", "오마카세", "이자카야"),
+    "중식": ("중식", "중식당", "중국집", "짜장면", "짬뽕", "마라탕", "마라", "딤섬", "양꼬치"),
+    "양식": ("양식", "파스타", "스테이크", "피자", "버거", "햄버거", "브런치", "리조또"),
+    "아시안": ("아시안", "쌀국수", "태국", "베트남", "커리", "카레", "인도"),
+    "분식": ("분식", "떡볶이", "김밥", "순대", "라볶이"),
+    "치킨": ("치킨", "닭강정", "통닭"),
+    "카페": ("카페", "디저트", "베이커리", "빵집"),
+}
+
+# 음식 종류 자체를 뜻하는 단어 (키워드에서 제외하고 cuisines로만 표현)
+_CUISINE_CATEGORY_WORDS = {"한식", "한식당", "일식", "일식당", "중식", "중식당", "중국집", "양식", "아시안", "분식"}
+
+# 의도에 영향을 주지 않는 단어
+_INTENT_STOPWORDS = {
+    "근처", "주변", "부근", "인근", "맛집", "식당", "음식점", "곳", "집", "1인", "인당", "1인당",
+    "이하", "이내", "미만", "까지", "이상", "정도", "쯤", "내외", "안팎", "예산",
+}
+
+# 거리 조건에 쓰이는 단어 ('500m 이내', '도보 5분 거리')
+_DISTANCE_WORDS = {"도보", "거리", "반경", "이내", "안", "내"}
+
+# 금액 뒤에 붙는 예산 조건
+_MAX_QUALIFIERS = ("이하", "이내", "미만", "까지", "안쪽")
+_MIN_QUALIFIERS = ("이상", "넘는", "초과")
+# 금액 토큰 ('30000원', '20000원대', 조건을 붙여 쓴 '30000원이하', '10000원정도')
+_AMOUNT_TOKEN = re.compile(
+    r'\d+원(대)?(' + "|".join(_MAX_QUALIFIERS + _MIN_QUALIFIERS + ("정도", "쯤", "내외", "안팎")) + r')?'
+)
+
+
+def _build_alias_index() -> Dict[str, Tuple[str, str]]:
+    """토큰 -> (대표 지역명, 검색어용 표기)"""
+    # 요청 토큰은 조사가 제거된 형태이므로 같은 방식으로 정규화한 표기도 등록 (을지로 -> 을지)
+    index = {}
+    for area, aliases in AREA_GAZETTEER.items():
+        for alias in (area,) + aliases:
+            for name in (alias, alias if alias.endswith("역") else alias + "역"):
+                index[name] = (area, name)
+                index.setdefault(normalize_request(name), (area, name))
+    return index
+
+
+def _build_cuisine_index() -> Dict[str, str]:
+    index = {}
+    for cuisine, keywords in CUISINE_KEYWORDS.items():
+        for keyword in keywords:
+            index[keyword] = cuisine
+            index[normalize_request(keyword)] = cuisine
+    return index
+
+
+_ALIAS_TO_AREA = _build_alias_index()
+_KEYWORD_TO_CUISINE = _build_cuisine_index()
+
+
+def detect_cuisines(text: str) -> Tuple[str, ...]:
+    """텍스트에 언급된 음식 종류를 CUISINE_KEYWORDS 순서대로 반환합니다."""
+    found = {cuisine for keyword, cuisine in _KEYWORD_TO_CUISINE.items() if keyword in (text or "")}
+    return tuple(cuisine for cuisine in CUISINE_KEYWORDS if cuisine in found)
+
+
+def _parse_budget(folded: str) -> Tuple[Optional[int], Optional[int]]:
+    """금액이 통일된 요청에서 (최소 예산, 최대 예산)을 추출합니다."""
+    # '2만~3만원', '1~2만원' 형식의 범위
+    range_match = re.search(r'(\d+)원?\s*[~\-]\s*(\d+)원', folded)
+    if range_match:
+        low, high = int(range_match.group(1)), int(range_match.group(2))
+        if low < 100 and high >= 10000:
+            low *= 10000
+        return low, high
+
+    match = re.search(r'(\d+)원\s*(대|' + "|".join(_MAX_QUALIFIERS + _MIN_QUALIFIERS) + r')?', folded)
+    if not match:
+        return None, None
+    amount, qualifier = int(match.group(1)), match.group(2)
+    if qualifier in _MIN_QUALIFIERS:
+        return amount, None
+    if qualifier == "대":
+        # 2만원대 -> 20000 ~ 29999
+        return amount, amount + 10 ** (len(str(amount)) - 1) - 1
+    # 조건이 없거나 '정도'인 금액도 상한으로 취급
+    return None, amount
+
+
+@dataclass(frozen=True)
+class RequestIntent:
+    """요청에서 추출한 구조화된 의도"""
+    area: Optional[str] = None
+    area_alias: Optional[str] = None
+    cuisines: Tuple[str, ...] = ()
+    budget_min: Optional[int] = None
+    budget_max: Optional[int] = None
+    keywords: Tuple[str, ...] = ()
+    radius_m: Optional[int] = None
+
+    @property
+    def budget(self) -> Optional[int]:
+        """점수화와 검색에 사용하는 예산 (최대 예산)"""
+        return self.budget_max
+
+    def guard_key(self) -> str:
+        """지역, 음식 종류, 예산(, 거리) 조합. 이 값이 다른 요청끼리는 결과를 공유하지 않습니다."""
+        parts = [
+            f"area={self.area or ''}",
+            f"cuisine={','.join(self.cuisines)}",
+            f"budget={self.budget_min or ''}-{self.budget_max or ''}",
+        ]
+        if self.radius_m:
+            parts.append(f"radius={self.radius_m}")
+        return "|".join(parts)
+
+    def cache_key(self) -> str:
+        """추천/검색 캐시 키. 지역 별칭, 어순, 금액 표기가 달라도 같은 의도면 같은 키가 됩니다."""
+        return f"{self.guard_key()}|kw={' '.join(sorted(self.keywords))}"
+
+    def topic(self) -> str:
+        """검색어용 주제 (사용자가 쓴 지역 표기 + 음식 종류 + 기타 키워드)"""
+        return " ".join([word for word in (self.area_alias,) if word] + list(self.cuisines) + list(self.keywords))
+
+    def admits(self, candidate: Dict[str, Any], tolerance: float = 0.1) -> bool:
+        """
+        후보가 요청 조건(예산, 거리, 음식 종류)을 만족하는지 확인합니다.
+        정보가 없는 조건은 만족하는 것으로 봅니다.
+        """
+        price = candidate.get("price")
+        if isinstance(price, (int, float)) and not math.isnan(price):
+            if self.budget_max and price > self.budget_max * (1 + tolerance):
+                return False
+            if self.budget_min and price < self.budget_min * (1 - tolerance):
+                return False
+
+        distance = candidate.get("distance")
+        if self.radius_m and isinstance(distance, (int, float)) and not math.isnan(distance):
+            if distance > self.radius_m:
+                return False
+
+        if self.cuisines and candidate.get("category"):
+            candidate_cuisines = detect_cuisines(str(candidate["category"]))
+            if candidate_cuisines and not set(candidate_cuisines) & set(self.cuisines):
+                return False
+        return True
+
+
+@lru_cache(maxsize=1024)
+def parse_request_intent(user_request: str) -> RequestIntent:
+    """사용자 요청에서 지역, 예산, 음식 종류, 기타 키워드를 추출합니다."""
+    folded = fold_amounts(unicodedata.normalize("NFKC", user_request or "").lower())
+    budget_min, budget_max = _parse_budget(folded)
+    # '500m 이내', '1.5km', '도보 5분' 형식의 거리 조건
+    radius = parse_distance(folded)
+    radius_m = None if math.isnan(radius) else int(radius)
+
+    area = area_alias = None
+    cuisines = []
+    keywords = []
+    for word, token in request_words(user_request):
+        if _AMOUNT_TOKEN.fullmatch(word) or _AMOUNT_TOKEN.fullmatch(token) or token in _INTENT_STOPWORDS:
+            continue
+        if radius_m and (re.fullmatch(r'\d+(k?m|분)?(이내|내|안)?', token) or token in _DISTANCE_WORDS):
+            continue
+        if token in _ALIAS_TO_AREA and area is None:
+            area, area_alias = _ALIAS_TO_AREA[token]
+            continue
+        if token.endswith("역") and len(token) > 2 and area is None:
+            # 사전에 없는 역 이름은 그대로 지역으로 사용
+            area = area_alias = token
+            continue
+        # '떡볶이'처럼 조사와 같은 글자로 끝나는 음식 이름은 원래 단어로 판단
+        if word in _KEYWORD_TO_CUISINE:
+            token = word
+        # '치킨집', '국밥집'처럼 '집'이 붙은 표기는 앞부분으로 음식 종류 판단
+        base = token[:-1] if token.endswith("집") and len(token) > 2 else token
+        cuisine = _KEYWORD_TO_CUISINE.get(token) or _KEYWORD_TO_CUISINE.get(base)
+        if cuisine and cuisine not in cuisines:
+            cuisines.append(cuisine)
+        if token not in _CUISINE_CATEGORY_WORDS and base not in CUISINE_KEYWORDS:
+            keywords.append(token)
+
+    return RequestIntent(
+        area=area,
+        area_alias=area_alias,
+        cuisines=tuple(sorted(cuisines, key=list(CUISINE_KEYWORDS).index)),
+        budget_min=budget_min,
+        budget_max=budget_max,
+        keywords=tuple(keywords),
+        radius_m=radius_m,
+    )
+
+
+def intent_cache_key(user_request: str) -> str:
+    """요청 의도 기반 캐시 키 (RecommendationCache, SearchResultStore의 키 함수)"""
+    return parse_request_intent(user_request).cache_key()
+
+
+def intent_guard_key(user_request: str) -> str:
+    """요청 의도 기반 공유 조건 키 (SemanticRecommendationCache의 guard_key)"""
+    return parse_request_intent(user_request).guard_key()
@@ -0,0 +1,239 @@
+"""
+리서치 결과 압축 모듈
+에이전트 사이에 전달되는 리서치/큐레이션 결과를 맛집별 사실 목록으로 정리합니다.
+중복된 사실과 평가에 쓰이지 않는 내용(리뷰 원문, 검색 과정 설명 등)을 제거하고
+맛집별 토큰 예산을 넘지 않도록 잘라 다음 에이전트의 프롬프트를 줄입니다.
+"""
+
+import re
+import math
+from typing import Dict, Any, List, Optional, Tuple
+
+from src.curator_scoring import extract_attributes
+
+# 리서치 결과에서 유지하는 항목 (앞쪽일수록 우선, 큐레이터 평가 기준 항목이 먼저)
+RESEARCH_FIELDS = ("rating", "price", "distance", "review_count", "category", "address", "menu", "hours", "phone", "url")
+# 큐레이션 결과에서 유지하는 항목 (커뮤니케이터가 사용하는 평가 결과 포함)
+CURATION_FIELDS = ("score", "reason", "strengths", "weaknesses") + RESEARCH_FIELDS
+
+FIELD_LABELS = {
+    "rating": "평점", "price": "가격", "distance": "거리", "review_count": "리뷰 수",
+    "category": "음식 종류", "address": "주소", "menu": "메뉴", "hours": "영업시간",
+    "phone": "전화", "url": "URL", "score": "점수", "reason": "추천 이유",
+    "strengths": "강점", "weaknesses": "약점",
+}
+
+# 결과 텍스트의 라벨 -> 항목 (LLM이 쓰는 변형 표기 포함)
+_LABEL_TO_FIELD = {
+    "평점": "rating", "별점": "rating",
+    "가격": "price", "가격대": "price", "1인 가격": "price",
+    "거리": "distance", "위치": "address", "주소": "address",
+    "리뷰": "review_count", "리뷰 수": "review_count",
+    "카테고리": "category", "음식 종류": "category", "분류": "category",
+    "메뉴": "menu", "대표 메뉴": "menu", "대표메뉴": "menu",
+    "영업시간": "hours", "영업 시간": "hours",
+    "전화": "phone", "전화번호": "phone", "연락처": "phone",
+    "url": "url", "링크": "url",
+    "점수": "score", "총점": "score", "종합 점수": "score",
+    "추천 이유": "reason", "추천 사유": "reason", "선정 이유": "reason",
+    "강점": "strengths", "장점": "strengths",
+    "약점": "weaknesses", "단점": "weaknesses",
+}
+
+# 띄어쓰기 차이('추천이유', '리뷰수')를 흡수하기 위해 공백을 뺀 라벨로 조회
+_COMPACT_LABEL_TO_FIELD = {label.replace(" ", ""): field for label, field in _LABEL_TO_FIELD.items()}
+
+_FIELD_LINE = re.compile(r'^[\s\-*•]*(?:[^\w\s\[]+\s*)*(?:\*\*)?([^:*\[\]]+?)(?:\*\*)?\s*:\s*(.+)$')
+_HEADING_LINES = (
+    re.compile(r'^\s*#{1,6}\s*(?:후보\s*\d+\s*[:.]\s*)?(.+?)\s*$'),
+    re.compile(r'^\s*(?:\d+\s*[.)]|\[?\d+\s*위\]?)\s*(.+?)\s*$'),
+    re.compile(r'^\s*(\*\*.+\*\*)\s*$'),
+)
+# 제목 앞의 순번 ('1.', '2)')
+_LEADING_NUMBER = re.compile(r'^\d+\s*[.)]\s*')
+_REVIEW_COUNT_VALUE = re.compile(r'^(?:약\s*)?[\d,]+\s*(?:개|건)?(?:\s|\(|$)')
+_PHONE = re.compile(r'0\d{1,2}-\d{3,4}-\d{4}')
+_URL = re.compile(r'https?://[^\s)\]]+')
+# 도로명 주소 (geo_index의 주소 추출에도 사용)
+ADDRESS_PATTERN = re.compile(
+    r'(?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)\S*\s+'
+    r'\S+[구시군]\s+(?:\S+[동읍면]\s+)?[가-힣\d]+(?:로|길)\s*\d+(?:-\d+)?'
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    LLM 토큰 수 근사치. (한글은 1.5자당 1토큰, 그 외 문자는 3.5자당 1토큰으로 계산)
+    모델별 토크나이저 없이 단계 간 감소율을 비교하는 용도입니다.
+    """
+    text = text or ""
+    hangul = len(re.findall(r'[가-힣]', text))
+    others = len(re.sub(r'[가-힣\s]', '', text))
+    return math.ceil(hangul / 1.5 + others / 3.5)
+
+
+def _clean(value: str) -> str:
+    value = re.sub(r'\*\*|__|`', '', value)
+    return " ".join(value.split()).strip(" -·")
+
+
+def _field_of(line: str) -> Optional[Tuple[str, str]]:
+    match = _FIELD_LINE.match(line)
+    if not match:
+        return None
+    field = _COMPACT_LABEL_TO_FIELD.get(re.sub(r'\s+', '', match.group(1).lower()))
+    if not field:
+        return None
+    value = _clean(match.group(2))
+    # '리뷰: 최근 리뷰에서 반찬이 좋다는 평'처럼 리뷰 원문인 값은 리뷰 수로 쓰지 않음
+    if field == "review_count" and not _REVIEW_COUNT_VALUE.match(value):
+        return None
+    return field, value
+
+
+def _heading_of(line: str) -> Optional[str]:
+    if _field_of(line):
+        return None
+    for pattern in _HEADING_LINES:
+        match = pattern.match(line)
+        if match:
+            heading = match.group(1)
+            bold = re.search(r'\*\*(.+?)\*\*', heading)
+            name = bold.group(1) if bold else re.split(r'\s+-\s+|:\s', heading)[0]
+            name = re.sub(r'^\[?\d+\s*위\]?\s*', '', _clean(name))
+            name = _LEADING_NUMBER.sub('', name)
+            return name or None
+    return None
+
+
+def _format_number(field: str, value: float) -> str:
+    if field == "rating":
+        return f"{value:g}"
+    if field == "price":
+        return f"{value:,.0f}원"
+    if field == "distance":
+        return f"{value:,.0f}m"
+    return f"{value:,.0f}개"
+
+
+class ResearchCompactor:
+    """에이전트 간 전달 텍스트를 맛집별 사실 목록으로 압축하는 클래스"""
+
+    def __init__(self, fields: Tuple[str, ...] = RESEARCH_FIELDS, token_budget_per_candidate: int = 120,
+                 max_value_chars: int = 80, resolver: Any = None):
+        self.fields = fields
+        self.token_budget_per_candidate = token_budget_per_candidate
+        self.max_value_chars = max_value_chars
+        # 지정되면(EntityResolver) 변형 표기된 같은 맛집을 하나로 합침
+        self.resolver = resolver
+
+    @classmethod
+    def from_config(cls, compaction_settings: Dict[str, Any], stage: str = "research",
+                    resolver: Any = None) -> "ResearchCompactor":
+        """config.json의 compaction_settings 섹션으로 생성합니다. (stage: research / curation)"""
+        if stage == "curation":
+            return cls(
+                fields=CURATION_FIELDS,
+                token_budget_per_candidate=compaction_settings.get("curation_token_budget_per_candidate", 200),
+                max_value_chars=compaction_settings.get("max_value_chars", 120),
+                resolver=resolver
+            )
+        return cls(
+            fields=RESEARCH_FIELDS,
+            token_budget_per_candidate=compaction_settings.get("research_token_budget_per_candidate", 120),
+            max_value_chars=compaction_settings.get("max_value_chars", 80),
+            resolver=resolver
+        )
+
+    def _split_candidates(self, text: str) -> Dict[str, List[str]]:
+        """텍스트를 맛집별 줄 묶음으로 나눕니다. (같은 이름은 하나로 병합, 첫 맛집 이전 내용은 제외)"""
+        blocks: Dict[str, List[str]] = {}
+        current: Optional[List[str]] = None
+        for line in (text or "").splitlines():
+            name = _heading_of(line)
+            if name:
+                current = blocks.setdefault(name, [])
+                continue
+            if current is not None and line.strip():
+                current.append(line)
+        return blocks
+
+    def _extract_facts(self, lines: List[str]) -> Dict[str, str]:
+        """맛집 한 곳의 줄 묶음에서 항목별 첫 번째 값을 추출합니다. (중복 사실 제거)"""
+        facts: Dict[str, str] = {}
+        for line in lines:
+            parsed = _field_of(line)
+            if parsed and parsed[0] in self.fields and parsed[1] and parsed[0] not in facts:
+                facts[parsed[0]] = parsed[1]
+
+        # 라벨 없이 문장/검색 스니펫에 섞인 값
+        block = " ".join(lines)
+        for field, value in extract_attributes(block).items():
+            if field in self.fields and field not in facts and not math.isnan(value):
+                facts[field] = _format_number(field, value)
+        if "phone" in self.fields and "phone" not in facts:
+            phone = _PHONE.search(block)
+            if phone:
+                facts["phone"] = phone.group(0)
+        if "address" in self.fields and "address" not in facts:
+            address = ADDRESS_PATTERN.search(block)
+            if address:
+                facts["address"] = address.group(0)
+        if "url" in self.fields:
+            url = _URL.search(facts.get("url", "") or block)
+            if url:
+                facts["url"] = url.group(0)
+        return facts
+
+    def _render_candidate(self, name: str, facts: Dict[str, str]) -> str:
+        """우선순위 순으로 토큰 예산 안에 들어가는 항목만 포함합니다."""
+        lines = [f"## {name}"]
+        used = estimate_tokens(lines[0])
+        for field in self.fields:
+            value = facts.get(field)
+            if not value:
+                continue
+            if len(value) > self.max_value_chars:
+                value = value[:self.max_value_chars].rstrip() + "…"
+            line = f"- {FIELD_LABELS[field]}: {value}"
+            cost = estimate_tokens(line)
+            if used + cost > self.token_budget_per_candidate:
+                continue
+            lines.append(line)
+            used += cost
+        return "\n".join(lines)
+
+    def extract_candidates(self, text: str) -> Dict[str, Dict[str, str]]:
+        """텍스트에서 맛집별 사실을 {맛집 이름: {항목: 값}}으로 추출합니다. (사실이 없는 맛집 제외)"""
+        candidates = {
+            name: facts for name, facts in
+            ((name, self._extract_facts(lines)) for name, lines in self._split_candidates(text).items())
+            if facts
+        }
+        if self.resolver and len(candidates) > 1:
+            merged = self.resolver.merge([{"name": name, **facts} for name, facts in candidates.items()])
+            candidates = {facts.pop("name"): facts for facts in merged}
+        return candidates
+
+    def render(self, candidates: Dict[str, Dict[str, str]]) -> str:
+        """맛집별 사실을 압축 형식 텍스트로 변환합니다."""
+        return "\n\n".join(self._render_candidate(name, facts) for name, facts in candidates.items())
+
+    def compact(self, text: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        텍스트를 압축하여 (압축된 텍스트, 통계)를 반환합니다.
+        맛집 단위를 찾지 못하면 원문을 그대로 반환합니다.
+        """
+        input_tokens = estimate_tokens(text)
+        candidates = self.extract_candidates(text)
+        if not candidates:
+            return text, {"input_tokens": input_tokens, "output_tokens": input_tokens,
+                          "candidates": 0, "compacted": False}
+
+        compacted = self.render(candidates)
+        output_tokens = estimate_tokens(compacted)
+        if output_tokens >= input_tokens:
+            return text, {"input_tokens": input_tokens, "output_tokens": input_tokens,
+                          "candidates": len(candidates), "compacted": False}
+        return compacted, {"input_tokens": input_tokens, "output_tokens": output_tokens,
+                           "candidates": len(candidates), "compacted": True}
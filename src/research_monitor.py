@@ -0,0 +1,151 @@
+"""
+리서치 완성도 모니터 모듈
+리서처 에이전트의 검색 결과를 도구 호출마다 누적하여, 큐레이션에 필요한 항목(주소, 평점, 가격 등)을
+모두 갖춘 후보 수를 셉니다. 목표 수에 도달하면 남은 검색을 생략하고 리서처가 지금까지의 결과로
+바로 최종 답변을 작성하도록 안내합니다. (최종 답변은 항상 리서처가 작성)
+"""
+
+import re
+import json
+import math
+from typing import Any, Dict, Optional, Tuple
+
+from src.curator_scoring import parse_price, parse_rating
+from src.entity_resolution import canonical_name
+from src.research_compactor import FIELD_LABELS, ResearchCompactor
+
+# 큐레이션 평가에 반드시 필요한 항목 (평점 40%, 가격 30%, 거리 20% - 거리는 주소로 계산)
+DEFAULT_REQUIRED_FIELDS = ("address", "rating", "price")
+
+# 검색 결과 제목에서 맛집 이름 뒤에 붙는 사이트명/설명 구분자
+_TITLE_SEPARATOR = re.compile(r'\s+[-|:·]\s+|\s*[|]\s*')
+# 맛집 한 곳이 아닌 목록/블로그 글 제목 ('광화문 맛집 BEST 10', '강남역 회식 장소 추천 5곳')
+_LISTING_TITLE = re.compile(r'맛집|추천|블로그|베스트|모음|리스트|best|top\s*\d+|\d+\s*(?:곳|선)', re.IGNORECASE)
+# 스니펫 한 줄에 이어 쓴 항목 라벨 ('주소: ... 평점: 4.5 가격: 12,000원')
+_INLINE_LABEL = re.compile(r'\s*((?:주소|위치|평점|별점|가격대?|1인 가격|전화번호|전화|연락처|영업\s?시간|대표\s?메뉴|메뉴)\s*:)')
+
+
+def search_result_text(result: Any) -> str:
+    """검색 도구 결과({"organic": [...]} 또는 텍스트)를 맛집별 '## 이름' 구간 텍스트로 변환합니다."""
+    if isinstance(result, str):
+        try:
+            result = json.loads(result)
+        except ValueError:
+            return result
+    if not isinstance(result, dict):
+        return str(result or "")
+    sections = []
+    for item in result.get("organic") or []:
+        name = _TITLE_SEPARATOR.split(item.get("title", ""))[0].strip()
+        if name and not _LISTING_TITLE.search(name):
+            # 라벨마다 줄을 나눠 한 항목 값에 다른 항목이 섞이지 않도록 함
+            snippet = _INLINE_LABEL.sub(r'\n\1', item.get("snippet", "")).strip()
+            sections.append(f"## {name}\n{snippet}\n{item.get('link', '')}")
+    return "\n\n".join(sections)
+
+
+def _valid_fact(field: str, value: str) -> bool:
+    """완성도 판단에 쓸 수 있는 값인지 확인합니다. (다른 라벨이 섞였거나 숫자로 읽을 수 없는 값 제외)"""
+    if _INLINE_LABEL.search(value):
+        return False
+    if field == "rating":
+        return not math.isnan(parse_rating(value))
+    if field == "price":
+        return not math.isnan(parse_price(value))
+    return bool(value)
+
+
+class ResearchCompletenessMonitor:
+    """
+    도구 결과마다 후보별 수집 항목을 누적하고, 필요한 항목을 모두 갖춘 후보가 목표 수에 도달했는지 판단하는 클래스
+    start()로 켠 실행(에이전트 리서치 작업)에서만 동작하며, 실행마다 새로 시작합니다.
+    """
+
+    def __init__(self, compactor: ResearchCompactor, target_candidates: int = 5,
+                 required_fields: Tuple[str, ...] = DEFAULT_REQUIRED_FIELDS):
+        self.compactor = compactor
+        self.target_candidates = target_candidates
+        self.required_fields = tuple(required_fields)
+
+        self.active = False
+        self.max_iterations = 0
+        self.iterations = 0
+        self.stopped = False
+        self.searches_skipped = 0
+        self._candidates: Dict[str, Tuple[str, Dict[str, str]]] = {}
+
+    @classmethod
+    def from_config(cls, early_termination_settings: Dict[str, Any],
+                    compactor: ResearchCompactor) -> "ResearchCompletenessMonitor":
+        """config.json의 research_settings.early_termination 섹션으로 생성합니다."""
+        return cls(
+            compactor=compactor,
+            target_candidates=early_termination_settings.get("target_candidates", 5),
+            required_fields=tuple(early_termination_settings.get("required_fields", DEFAULT_REQUIRED_FIELDS))
+        )
+
+    def fresh(self) -> "ResearchCompletenessMonitor":
+        """같은 설정의 새 모니터를 만듭니다. (동시 실행 워커용)"""
+        return ResearchCompletenessMonitor(self.compactor, self.target_candidates, self.required_fields)
+
+    def start(self, max_iterations: int):
+        """에이전트 리서치 실행을 시작합니다. (max_iterations: 리서처의 최대 반복 횟수)"""
+        self.active = True
+        self.max_iterations = max_iterations
+        self.iterations = 0
+        self.stopped = False
+        self.searches_skipped = 0
+        self._candidates = {}
+
+    def finish(self) -> Optional[Dict[str, Any]]:
+        """실행을 끝내고 요약(사용/생략한 반복 수, 완성된 후보 수)을 반환합니다. 시작하지 않았으면 None."""
+        if not self.active:
+            return None
+        self.active = False
+        return {
+            "stopped_early": self.stopped,
+            "iterations_used": self.iterations,
+            "iterations_skipped": max(0, self.max_iterations - self.iterations) if self.stopped else 0,
+            # 안내 후에도 리서처가 요청해 실행하지 않은 검색 수
+            "searches_skipped": self.searches_skipped,
+            "complete_candidates": len(self.complete_candidates()),
+            "target_candidates": self.target_candidates,
+        }
+
+    def observe(self, result: Any) -> bool:
+        """
+        도구 결과 하나를 누적하고, 목표 수의 완성된 후보가 모였으면 True를 반환합니다.
+        실행 중이 아니면(시스템이 직접 검색하는 단계 등) 아무것도 하지 않습니다.
+        """
+        if not self.active or self.stopped:
+            return False
+        self.iterations += 1
+        for name, facts in self.compactor.extract_candidates(search_result_text(result)).items():
+            key = canonical_name(name)
+            _, known = self._candidates.setdefault(key, (name, {}))
+            for field, value in facts.items():
+                if _valid_fact(field, value):
+                    known.setdefault(field, value)
+        self.stopped = len(self.complete_candidates()) >= self.target_candidates
+        return self.stopped
+
+    def complete_candidates(self) -> Dict[str, Dict[str, str]]:
+        """필요한 항목을 모두 갖춘 후보 {이름: 항목}"""
+        return {
+            name: facts for name, facts in self._candidates.values()
+            if all(facts.get(field) for field in self.required_fields)
+        }
+
+    def should_skip_search(self) -> bool:
+        """목표에 도달한 실행에서 추가 검색 요청이면 True (검색하지 않고 notice()를 반환)"""
+        if self.active and self.stopped:
+            self.searches_skipped += 1
+            return True
+        return False
+
+    def notice(self) -> str:
+        """리서처에게 검색을 멈추고 최종 답변을 작성하도록 안내하는 문구"""
+        complete = self.complete_candidates()
+        fields = "/".join(FIELD_LABELS.get(field, field) for field in self.required_fields)
+        return (f"[리서치 완료] {fields}을(를) 갖춘 후보 {len(complete)}곳({', '.join(complete)})을 확보했습니다. "
+                f"더 이상 검색하지 말고, 지금까지의 검색 결과로 맛집별 정보를 정리한 Final Answer를 작성하세요.")
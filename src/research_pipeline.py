@@ -0,0 +1,217 @@
+"""
+2단계 리서치 파이프라인 모듈
+후보 맛집 발굴(discovery) 결과를 받아 후보별 상세 정보를 동시에 수집(enrichment)합니다.
+후보마다 제한 시간을 두어 느린 검색 하나가 전체 목록을 지연시키지 않도록 합니다.
+"""
+
+import re
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, List, Callable, Optional
+
+from src.curator_scoring import extract_attributes
+
+# 후보별 상세 정보 검색어 템플릿 ({terms}: 검색할 필드의 검색어)
+ENRICHMENT_QUERIES = {
+    "basic": "{area} {name} {terms}",
+    "reviews": "{name} {area} {terms}",
+}
+# 검색어별로 수집하는 필드와 필드별 검색어
+ENRICHMENT_FIELDS = {
+    "basic": ("address", "phone", "hours"),
+    "reviews": ("menu", "price", "rating", "reviews"),
+}
+FIELD_QUERY_TERMS = {
+    "address": "주소", "phone": "전화번호", "hours": "영업시간",
+    "menu": "메뉴", "price": "가격", "rating": "평점", "reviews": "리뷰",
+}
+
+
+def parse_candidate_names(text: str, max_candidates: int = 8) -> List[str]:
+    """
+    discovery 단계 응답에서 후보 맛집 이름 목록을 추출합니다.
+    JSON 배열(문자열 또는 {"name": ...} 객체)을 우선 해석하고, 실패하면 목록 형식의 줄을 사용합니다.
+    """
+    names: List[str] = []
+
+    match = re.search(r'\[.*\]', text or "", re.DOTALL)
+    if match:
+        try:
+            data = json.loads(match.group(0))
+            for item in data:
+                name = item.get("name") if isinstance(item, dict) else item
+                if isinstance(name, str) and name.strip():
+                    names.append(name.strip())
+        except (json.JSONDecodeError, AttributeError):
+            names = []
+
+    if not names:
+        for line in (text or "").splitlines():
+            item = re.match(r'^\s*(?:[-*•]|\d+[.)])\s*(?:\*\*)?([^*:\n(]+)', line)
+            if item:
+                names.append(item.group(1).strip())
+
+    # 순서를 유지하며 중복 제거
+    unique = list(dict.fromkeys(name for name in names if name))
+    return unique[:max_candidates]
+
+
+class CandidateEnricher:
+    """후보 맛집별 상세 정보를 동시에 수집하는 클래스"""
+
+    def __init__(self, max_workers: int = 6, timeout_seconds: float = 15.0, results_per_query: int = 3,
+                 memo: Any = None):
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self.results_per_query = results_per_query
+        # 지정되면(FieldMemo) 유효 기간이 남은 필드는 다시 검색하지 않음
+        self.memo = memo
+
+    @classmethod
+    def from_config(cls, research_settings: Dict[str, Any], memo: Any = None) -> "CandidateEnricher":
+        """config.json의 research_settings 섹션으로 생성합니다."""
+        return cls(
+            max_workers=research_settings.get("enrichment_max_workers", 6),
+            timeout_seconds=research_settings.get("enrichment_timeout_seconds", 15.0),
+            results_per_query=research_settings.get("enrichment_results_per_query", 3),
+            memo=memo
+        )
+
+    def _enrich_one(self, name: str, area: str, memo_area: str, search_fn: Callable[[str], Any],
+                    started_at: Dict[str, float], lock: threading.Lock) -> Dict[str, Any]:
+        with lock:
+            started_at[name] = time.time()
+        memo = self.memo.lookup(name, memo_area) if self.memo else {}
+        snippets = []
+        searches_saved = 0
+        for purpose, template in ENRICHMENT_QUERIES.items():
+            fields = ENRICHMENT_FIELDS[purpose]
+            # 만료된 필드만 검색어에 넣어 다시 검색
+            expired = [field for field in fields if field not in memo]
+            if expired:
+                terms = " ".join(FIELD_QUERY_TERMS[field] for field in expired)
+                query = " ".join(template.format(name=name, area=area, terms=terms).split())
+                result = search_fn(query)
+                organic = result.get("organic", []) if isinstance(result, dict) else []
+                fetched = [{
+                    "purpose": purpose,
+                    "title": item.get("title", ""),
+                    "snippet": item.get("snippet", ""),
+                    "link": item.get("link", "")
+                } for item in organic[:self.results_per_query]]
+                snippets.extend(fetched)
+                if self.memo:
+                    self.memo.store(name, memo_area, expired, fetched)
+            else:
+                searches_saved += 1
+            for field in fields:
+                for item in memo.get(field, []):
+                    if item not in snippets:
+                        snippets.append(item)
+        return {"name": name, "snippets": snippets, "memo_fields": list(memo),
+                "searches_saved": searches_saved}
+
+    def enrich(self, candidates: List[str], search_fn: Callable[[str], Any], area: str = "",
+               memo_area: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        후보별 상세 정보를 동시에 수집합니다.
+        area는 검색어에 넣을 지역/주제, memo_area는 필드 메모 키의 지역입니다. (생략하면 area 사용)
+        각 후보의 결과에는 status(ok/timeout/error)와 elapsed(초)가 포함됩니다.
+        """
+        memo_area = area if memo_area is None else memo_area
+        if not candidates:
+            return []
+
+        started_at: Dict[str, float] = {}
+        lock = threading.Lock()
+        results: Dict[str, Dict[str, Any]] = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="enrichment")
+        try:
+            pending = {
+                executor.submit(self._enrich_one, name, area, memo_area, search_fn, started_at, lock): name
+                for name in candidates
+            }
+            while pending:
+                done, _ = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                now = time.time()
+
+                for future in done:
+                    name = pending.pop(future)
+                    elapsed = now - started_at.get(name, now)
+                    try:
+                        results[name] = {**future.result(), "status": "ok", "elapsed": elapsed}
+                    except Exception as e:
+                        results[name] = {"name": name, "snippets": [], "status": "error",
+                                         "error": str(e), "elapsed": elapsed}
+
+                # 시작 후 제한 시간을 넘긴 후보는 기다리지 않고 제외
+                with lock:
+                    expired = [f for f, name in pending.items()
+                               if name in started_at and now - started_at[name] > self.timeout_seconds]
+                for future in expired:
+                    name = pending.pop(future)
+                    future.cancel()
+                    results[name] = {"name": name, "snippets": [], "status": "timeout",
+                                     "elapsed": now - started_at[name]}
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return [results[name] for name in candidates]
+
+    @staticmethod
+    def to_candidates(enriched: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """수집 결과를 점수화 엔진 입력용 후보 목록으로 변환합니다. (수집 실패 후보 제외)"""
+        candidates = []
+        for candidate in enriched:
+            if candidate["status"] != "ok":
+                continue
+            text = " ".join(f"{s['title']} {s['snippet']}" for s in candidate["snippets"])
+            candidates.append({
+                "name": candidate["name"],
+                **extract_attributes(text),
+                "link": next((s["link"] for s in candidate["snippets"] if s["link"]), ""),
+                "details": " / ".join(s["snippet"] for s in candidate["snippets"] if s["snippet"])[:500]
+            })
+        return candidates
+    
+    @staticmethod
+    def merge_duplicates(enriched: List[Dict[str, Any]], resolver: Any) -> List[Dict[str, Any]]:
+        """
+        같은 맛집의 변형 표기로 수집된 후보를 하나로 합칩니다. (첫 표기 유지, 검색 결과는 이어 붙임)
+        resolver는 EntityResolver이며, 수집 성공 후보가 하나라도 있으면 합친 후보도 성공으로 봅니다.
+        """
+        # 목록 페이지의 다른 맛집 전화번호/주소로 잘못 합치지 않도록 제목에 후보 이름이 있는 결과만 사용
+        records = []
+        for c in enriched:
+            compact_name = re.sub(r'\s', '', c["name"])
+            own = [f"{s['title']} {s['snippet']}" for s in c["snippets"]
+                   if compact_name in re.sub(r'\s', '', s["title"])]
+            records.append({"name": c["name"], "details": " ".join(own)})
+        merged = []
+        for group in resolver.clusters(records):
+            members = [enriched[i] for i in group]
+            succeeded = [m for m in members if m["status"] == "ok"] or members
+            merged.append({
+                **succeeded[0],
+                "name": members[0]["name"],
+                "snippets": [s for m in succeeded for s in m["snippets"]],
+                "aliases": [m["name"] for m in members[1:]]
+            })
+        return merged
+
+    @staticmethod
+    def format_results(enriched: List[Dict[str, Any]]) -> str:
+        """후보별 수집 결과를 큐레이터 입력용 텍스트로 병합합니다."""
+        sections = []
+        for index, candidate in enumerate(enriched, 1):
+            header = f"## 후보 {index}: {candidate['name']}"
+            if candidate["status"] != "ok":
+                sections.append(f"{header}\n(상세 정보 수집 실패: {candidate['status']})")
+                continue
+            lines = [f"- [{s['purpose']}] {s['title']}: {s['snippet']} ({s['link']})"
+                     for s in candidate["snippets"]]
+            sections.append(header + "\n" + ("\n".join(lines) if lines else "(검색 결과 없음)"))
+        return "\n\n".join(sections)
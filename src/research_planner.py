@@ -0,0 +1,118 @@
+"""
+리서치 검색 계획 모듈
+사용자 요청을 목적별 검색 쿼리 묶음으로 미리 변환하고,
+제한된 작업자 풀로 동시에 검색하여 리서처에게 한 번에 전달합니다.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Callable, Optional, Tuple
+
+from src.recommendation_cache import normalize_request
+from src.request_intent import parse_request_intent
+
+# 검색 목적별 쿼리 템플릿
+QUERY_TEMPLATES = {
+    "listing": "{topic} 맛집 추천",
+    "reviews": "{topic} 맛집 리뷰 평점",
+    "menus": "{topic} 맛집 대표 메뉴",
+    "prices": "{topic} 맛집 가격{budget}",
+    "hours": "{topic} 맛집 영업시간 전화번호",
+}
+
+
+def _format_budget(budget: int) -> str:
+    """검색어용 금액 표기 (30000 -> 3만원)"""
+    if budget >= 10000 and budget % 10000 == 0:
+        return f"{budget // 10000}만원"
+    return f"{budget:,}원"
+
+
+class ParallelSearchPlanner:
+    """요청을 검색 쿼리 묶음으로 변환하고 동시에 실행하는 플래너"""
+
+    def __init__(self, max_workers: int = 5, timeout_seconds: float = 20.0, results_per_query: int = 5):
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self.results_per_query = results_per_query
+
+    @classmethod
+    def from_config(cls, research_settings: Dict[str, Any]) -> "ParallelSearchPlanner":
+        """config.json의 research_settings 섹션으로 플래너를 생성합니다."""
+        return cls(
+            max_workers=research_settings.get("fanout_max_workers", 5),
+            timeout_seconds=research_settings.get("search_timeout_seconds", 20.0),
+            results_per_query=research_settings.get("results_per_query", 5)
+        )
+
+    def extract_topic(self, user_request: str) -> Tuple[str, Optional[int]]:
+        """요청에서 검색 주제(지역, 음식 종류 등)와 예산(원)을 추출합니다."""
+        intent = parse_request_intent(user_request)
+        return intent.topic() or normalize_request(user_request), intent.budget
+
+    def plan(self, user_request: str, purposes: Optional[List[str]] = None) -> List[Dict[str, str]]:
+        """사용자 요청을 목적별 검색 쿼리 목록으로 변환합니다. (purposes 지정 시 해당 목적만)"""
+        topic, budget = self.extract_topic(user_request)
+        budget_text = f" {_format_budget(budget)} 이하" if budget else ""
+
+        return [
+            {"purpose": purpose, "query": template.format(topic=topic, budget=budget_text)}
+            for purpose, template in QUERY_TEMPLATES.items()
+            if purposes is None or purpose in purposes
+        ]
+
+    def execute(self, queries: List[Dict[str, str]], search_fn: Callable[[str], Any]) -> List[Dict[str, Any]]:
+        """
+        검색 쿼리들을 동시에 실행합니다.
+        전체 제한 시간을 넘긴 검색은 결과 없이 timeout으로 표시됩니다.
+        """
+        results = []
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="search_fanout")
+        try:
+            futures = {}
+            for item in queries:
+                futures[executor.submit(self._timed_search, search_fn, item["query"])] = item
+            done, _ = wait(futures, timeout=self.timeout_seconds)
+
+            for future, item in futures.items():
+                entry = {"purpose": item["purpose"], "query": item["query"]}
+                if future in done:
+                    try:
+                        entry["result"], entry["elapsed"] = future.result()
+                        entry["status"] = "ok"
+                    except Exception as e:
+                        entry["status"] = "error"
+                        entry["error"] = str(e)
+                else:
+                    future.cancel()
+                    entry["status"] = "timeout"
+                results.append(entry)
+        finally:
+            # 시간 초과된 검색을 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    @staticmethod
+    def _timed_search(search_fn: Callable[[str], Any], query: str):
+        start = time.time()
+        result = search_fn(query)
+        return result, time.time() - start
+
+    def format_results(self, results: List[Dict[str, Any]]) -> str:
+        """검색 결과를 리서처 프롬프트용 텍스트로 정리합니다."""
+        sections = []
+        for entry in results:
+            header = f"### [{entry['purpose']}] {entry['query']}"
+            if entry["status"] != "ok":
+                sections.append(f"{header}\n(검색 실패: {entry.get('error', entry['status'])})")
+                continue
+
+            result = entry["result"]
+            lines = []
+            organic = result.get("organic", []) if isinstance(result, dict) else []
+            for item in organic[:self.results_per_query]:
+                lines.append(f"- {item.get('title', '')}: {item.get('snippet', '')} ({item.get('link', '')})")
+            if not organic and result:
+                lines.append(str(result)[:1000])
+            sections.append(header + "\n" + ("\n".join(lines) if lines else "(결과 없음)"))
+        return "\n\n".join(sections)
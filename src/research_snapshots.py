@@ -0,0 +1,126 @@
+"""
+리서치 웜 스타트 모듈
+지역(+음식 종류)별 마지막 리서치 후보 집합을 카탈로그 DB에 저장해 두고,
+같은 지역을 다시 조사할 때 알려진 후보를 리서처에게 먼저 제공하여 새 후보와 바뀐 정보만 찾도록 합니다.
+리서처가 보고한 변경분(delta)은 저장된 후보 집합에 병합되어 큐레이터에게 전체 후보로 전달됩니다.
+"""
+
+import json
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from src.entity_resolution import canonical_name
+from src.request_intent import RequestIntent
+from src.research_compactor import ResearchCompactor
+from src.restaurant_catalog import RestaurantCatalog
+
+
+class ResearchSnapshotStore:
+    """지역별 마지막 리서치 후보 집합 (카탈로그 DB의 research_snapshots 테이블)"""
+
+    def __init__(self, catalog: RestaurantCatalog, compactor: Optional[ResearchCompactor] = None,
+                 max_age_seconds: float = 7 * 24 * 3600, min_candidates: int = 3, max_candidates: int = 12):
+        self.catalog = catalog
+        self.compactor = compactor or ResearchCompactor()
+        self.max_age_seconds = max_age_seconds
+        self.min_candidates = min_candidates
+        self.max_candidates = max_candidates
+        self.stats = {"warm_starts": 0, "cold_starts": 0, "new_candidates": 0, "changed_candidates": 0}
+        self._init_db()
+
+    @classmethod
+    def from_config(cls, warm_start_settings: Dict[str, Any], catalog: RestaurantCatalog,
+                    compactor: Optional[ResearchCompactor] = None) -> "ResearchSnapshotStore":
+        """config.json의 warm_start_settings 섹션으로 생성합니다."""
+        return cls(
+            catalog=catalog,
+            compactor=compactor,
+            max_age_seconds=warm_start_settings.get("max_age_seconds", 7 * 24 * 3600),
+            min_candidates=warm_start_settings.get("min_candidates", 3),
+            max_candidates=warm_start_settings.get("max_candidates", 12)
+        )
+
+    def _init_db(self):
+        self.catalog.execute("""
+            CREATE TABLE IF NOT EXISTS research_snapshots (
+                area TEXT NOT NULL,
+                cuisine TEXT NOT NULL,
+                candidates TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (area, cuisine)
+            )
+        """)
+
+    @staticmethod
+    def snapshot_key(intent: RequestIntent) -> Optional[Tuple[str, str]]:
+        """요청 의도의 스냅샷 키 (지역, 음식 종류). 지역이 없으면 None."""
+        if not intent.area:
+            return None
+        return intent.area, ",".join(sorted(intent.cuisines))
+
+    def load(self, intent: RequestIntent) -> Optional[Dict[str, Dict[str, str]]]:
+        """최근 리서치 후보 집합을 반환합니다. 없거나 오래되었거나 후보가 min_candidates개 미만이면 None."""
+        key = self.snapshot_key(intent)
+        rows = self.catalog.execute(
+            "SELECT candidates, updated_at FROM research_snapshots WHERE area = ? AND cuisine = ?", key
+        ) if key else []
+        if rows and time.time() - rows[0][1] <= self.max_age_seconds:
+            candidates = json.loads(rows[0][0])
+            if len(candidates) >= self.min_candidates:
+                self.stats["warm_starts"] += 1
+                return candidates
+        self.stats["cold_starts"] += 1
+        return None
+
+    def save(self, intent: RequestIntent, candidates: Dict[str, Dict[str, str]]):
+        """후보 집합을 지역의 최신 스냅샷으로 저장합니다. (최근 후보 max_candidates개 유지)"""
+        key = self.snapshot_key(intent)
+        if not key or not candidates:
+            return
+        names = list(candidates)[-self.max_candidates:]
+        self.catalog.execute(
+            "INSERT OR REPLACE INTO research_snapshots VALUES (?, ?, ?, ?)",
+            key + (json.dumps({name: candidates[name] for name in names}, ensure_ascii=False), time.time())
+        )
+
+    def record_research(self, intent: RequestIntent, text: str) -> int:
+        """처음부터 수행한 리서치 결과로 스냅샷을 만들고 후보 수를 반환합니다."""
+        candidates = self.compactor.extract_candidates(text)
+        self.save(intent, candidates)
+        return len(candidates)
+
+    def merge(self, intent: RequestIntent, known: Dict[str, Dict[str, str]],
+              delta_text: str) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Any]]:
+        """
+        리서처가 보고한 새 후보와 바뀐 항목을 알려진 후보 집합에 병합하여 저장하고,
+        (병합된 후보 집합, {"new": [...], "changed": {맛집: [항목, ...]}})을 반환합니다.
+        """
+        merged = {name: dict(facts) for name, facts in known.items()}
+        by_key = {canonical_name(name): name for name in merged}
+        new: List[str] = []
+        changed: Dict[str, List[str]] = {}
+
+        for name, facts in self.compactor.extract_candidates(delta_text).items():
+            existing = by_key.get(canonical_name(name))
+            if existing is None:
+                merged[name] = facts
+                by_key[canonical_name(name)] = name
+                new.append(name)
+                continue
+            fields = [field for field, value in facts.items() if merged[existing].get(field) != value]
+            if fields:
+                merged[existing].update({field: facts[field] for field in fields})
+                changed[existing] = fields
+
+        self.save(intent, merged)
+        self.stats["new_candidates"] += len(new)
+        self.stats["changed_candidates"] += len(changed)
+        return merged, {"new": new, "changed": changed}
+
+    def format_known(self, candidates: Dict[str, Dict[str, str]]) -> str:
+        """알려진 후보 집합을 리서처 프롬프트용 텍스트로 변환합니다."""
+        return self.compactor.render(candidates)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """웜 스타트 통계를 반환합니다."""
+        return dict(self.stats)
@@ -0,0 +1,285 @@
+"""
+로컬 맛집 카탈로그 모듈
+추천이 완료될 때마다 맛집 정보(주소, 전화번호, 평점, 가격, 메뉴, 영업시간, 출처 URL)를 SQLite에 누적하고
+이름/메뉴/지역에 FTS5 전문 검색 인덱스를 둡니다.
+리서치 단계는 카탈로그를 먼저 조회하고, 없거나 오래된 지역/항목만 웹 검색으로 보완합니다.
+"""
+
+import os
+import re
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional
+
+from src.recommendation_cache import normalize_request
+from src.entity_resolution import canonical_name
+from src.research_compactor import FIELD_LABELS
+from src.restaurant_models import Restaurant
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 카탈로그에 저장하는 항목 (category는 저장만 하고 완전성 판단에는 사용하지 않음)
+CATALOG_FIELDS = ("address", "phone", "rating", "price", "menu", "hours", "url", "category")
+# 이 항목이 모두 있어야 웹 검색 없이 카탈로그만으로 사용할 수 있는 정보로 봅니다
+REQUIRED_FIELDS = ("address", "phone", "rating", "price", "menu", "hours", "url")
+
+
+def name_key(name: str) -> str:
+    """같은 맛집 판단용 이름 키 (공백, 대소문자, 기호, 지점 표기 차이 무시)"""
+    return canonical_name(name)
+
+
+def _match_query(text: str) -> str:
+    """사용자 입력을 FTS5 MATCH 식으로 변환합니다. (단어별 접두 일치, 하나라도 맞으면 검색)"""
+    words = [re.sub(r'"', '', word) for word in normalize_request(text).split()]
+    return " OR ".join(f'"{word}"*' for word in words if word)
+
+
+class RestaurantCatalog:
+    """SQLite FTS5 기반 로컬 맛집 카탈로그"""
+
+    # 조회 결과 열 순서 (_to_entry의 키 순서와 동일)
+    _COLUMNS = "r.name, r.area, " + ", ".join(f"r.{field}" for field in CATALOG_FIELDS) + ", r.last_seen"
+
+    def __init__(self, db_file: Optional[str] = None, stale_after_seconds: float = 7 * 24 * 3600,
+                 min_area_entries: int = 5):
+        self.db_file = db_file or ":memory:"
+        self.stale_after_seconds = stale_after_seconds
+        self.min_area_entries = min_area_entries
+
+        self._lock = threading.Lock()
+        # 메모리 DB는 연결마다 새로 생성되므로 단일 연결을 공유
+        self._memory_conn = None
+        if self.db_file == ":memory:":
+            self._memory_conn = sqlite3.connect(":memory:", check_same_thread=False)
+        else:
+            Path(self.db_file).parent.mkdir(parents=True, exist_ok=True)
+
+        self.stats = {"searches": 0, "hits": 0, "records": 0}
+        self._init_db()
+
+    @classmethod
+    def from_config(cls, catalog_settings: Dict[str, Any]) -> "RestaurantCatalog":
+        """config.json의 catalog_settings 섹션으로 카탈로그를 생성합니다."""
+        db_file = catalog_settings.get("db_file", "cache/restaurant_catalog.db")
+        if db_file and db_file != ":memory:" and not os.path.isabs(db_file):
+            db_file = str(PROJECT_ROOT / db_file)
+        return cls(
+            db_file=db_file,
+            stale_after_seconds=catalog_settings.get("stale_after_seconds", 7 * 24 * 3600),
+            min_area_entries=catalog_settings.get("min_area_entries", 5)
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._memory_conn is not None:
+            return self._memory_conn
+        return sqlite3.connect(self.db_file, timeout=10)
+
+    def execute(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """카탈로그 DB에서 SQL을 실행합니다. (같은 DB에 저장되는 지역별 순위 뷰와 공유)"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(sql, params).fetchall()
+                conn.commit()
+                return rows
+            finally:
+                if conn is not self._memory_conn:
+                    conn.close()
+
+    def _init_db(self):
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS restaurants (
+                        id INTEGER PRIMARY KEY,
+                        name_key TEXT NOT NULL,
+                        area TEXT NOT NULL,
+                        name TEXT NOT NULL,
+                        address TEXT NOT NULL DEFAULT '',
+                        phone TEXT NOT NULL DEFAULT '',
+                        rating TEXT NOT NULL DEFAULT '',
+                        price TEXT NOT NULL DEFAULT '',
+                        menu TEXT NOT NULL DEFAULT '',
+                        hours TEXT NOT NULL DEFAULT '',
+                        url TEXT NOT NULL DEFAULT '',
+                        category TEXT NOT NULL DEFAULT '',
+                        last_seen REAL NOT NULL,
+                        UNIQUE (name_key, area)
+                    );
+                    CREATE TABLE IF NOT EXISTS area_revisions (
+                        area TEXT PRIMARY KEY,
+                        revision INTEGER NOT NULL
+                    );
+                    CREATE VIRTUAL TABLE IF NOT EXISTS restaurants_fts USING fts5(
+                        name, menu, area, content='restaurants', content_rowid='id', tokenize='unicode61'
+                    );
+                    CREATE TRIGGER IF NOT EXISTS restaurants_ai AFTER INSERT ON restaurants BEGIN
+                        INSERT INTO restaurants_fts(rowid, name, menu, area) VALUES (new.id, new.name, new.menu, new.area);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS restaurants_ad AFTER DELETE ON restaurants BEGIN
+                        INSERT INTO restaurants_fts(restaurants_fts, rowid, name, menu, area)
+                        VALUES ('delete', old.id, old.name, old.menu, old.area);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS restaurants_au AFTER UPDATE ON restaurants BEGIN
+                        INSERT INTO restaurants_fts(restaurants_fts, rowid, name, menu, area)
+                        VALUES ('delete', old.id, old.name, old.menu, old.area);
+                        INSERT INTO restaurants_fts(rowid, name, menu, area) VALUES (new.id, new.name, new.menu, new.area);
+                    END;
+                """)
+                conn.commit()
+            finally:
+                if conn is not self._memory_conn:
+                    conn.close()
+
+    def record(self, restaurants: List[Restaurant], area: str = "",
+               verified: Optional[Iterable[str]] = None) -> int:
+        """
+        추천 결과를 카탈로그에 저장합니다.
+        이미 있는 맛집은 새로 확인된 항목만 갱신합니다. (빈 값은 기존 값 유지)
+        마지막 확인 시각은 verified(이번 실행에서 웹 검색으로 확인한 맛집 이름, None이면 전체)만 갱신하고,
+        카탈로그/순위 뷰에서 가져와 웹으로 다시 확인하지 않은 맛집은 이전 시각을 유지합니다. (새 항목은 오래됨으로 저장)
+        내용이 실제로 바뀐 경우에만 지역 revision을 올려 지역별 순위 뷰가 다시 계산되도록 합니다.
+        """
+        now = time.time()
+        verified_keys = None if verified is None else {name_key(name) for name in verified}
+        rows = [
+            (name_key(r.name), area or "", r.name.strip(),
+             *(str(getattr(r, field) or "").strip() for field in CATALOG_FIELDS),
+             now if verified_keys is None or name_key(r.name) in verified_keys else 0.0)
+            for r in restaurants if name_key(r.name)
+        ]
+        if not rows:
+            return 0
+        updates = ", ".join(f"{field} = COALESCE(NULLIF(excluded.{field}, ''), {field})" for field in CATALOG_FIELDS)
+        # 새 값이 기존 값과 다른 항목이 있을 때만 갱신 (변경 건수로 revision 증가 여부 판단)
+        differs = " OR ".join(
+            ["excluded.name IS NOT name"] +
+            [f"(excluded.{field} != '' AND excluded.{field} IS NOT {field})" for field in CATALOG_FIELDS]
+        )
+        with self._lock:
+            conn = self._connect()
+            try:
+                before = conn.total_changes
+                conn.executemany(
+                    f"INSERT INTO restaurants (name_key, area, name, {', '.join(CATALOG_FIELDS)}, last_seen) "
+                    f"VALUES ({', '.join('?' * (len(CATALOG_FIELDS) + 4))}) "
+                    f"ON CONFLICT (name_key, area) DO UPDATE SET name = excluded.name, {updates} WHERE {differs}",
+                    rows
+                )
+                changed = conn.total_changes - before
+                conn.executemany(
+                    "UPDATE restaurants SET last_seen = ? WHERE name_key = ? AND area = ?",
+                    [(now, row[0], row[1]) for row in rows if row[-1]]
+                )
+                if changed:
+                    conn.execute(
+                        "INSERT INTO area_revisions (area, revision) VALUES (?, 1) "
+                        "ON CONFLICT (area) DO UPDATE SET revision = revision + 1",
+                        (area or "",)
+                    )
+                conn.commit()
+            finally:
+                if conn is not self._memory_conn:
+                    conn.close()
+        self.stats["records"] += len(rows)
+        return len(rows)
+
+    def area_revision(self, area: str) -> int:
+        """지역 맛집 정보의 변경 번호 (내용이 바뀔 때마다 증가)"""
+        rows = self.execute("SELECT revision FROM area_revisions WHERE area = ?", (area or "",))
+        return rows[0][0] if rows else 0
+
+    def _to_entry(self, row: tuple, now: float) -> Dict[str, Any]:
+        entry = dict(zip(("name", "area") + CATALOG_FIELDS + ("last_seen",), row))
+        entry["stale"] = now - entry["last_seen"] > self.stale_after_seconds
+        entry["missing"] = [field for field in REQUIRED_FIELDS if not entry[field]]
+        return entry
+
+    def search(self, query: str, area: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """이름/메뉴/지역 전문 검색. 관련도(bm25) 순으로 정렬하며 각 항목에 stale, missing 정보가 포함됩니다."""
+        match = _match_query(query)
+        if not match:
+            return []
+        sql = (f"SELECT {self._COLUMNS} FROM restaurants_fts f JOIN restaurants r ON r.id = f.rowid "
+               f"WHERE restaurants_fts MATCH ?")
+        params: tuple = (match,)
+        if area:
+            sql += " AND r.area = ?"
+            params += (area,)
+        sql += " ORDER BY bm25(restaurants_fts), r.last_seen DESC LIMIT ?"
+        rows = self.execute(sql, params + (limit,))
+
+        now = time.time()
+        self.stats["searches"] += 1
+        if rows:
+            self.stats["hits"] += 1
+        return [self._to_entry(row, now) for row in rows]
+
+    def area_entries(self, area: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """지역의 카탈로그 항목을 최근 확인 순으로 반환합니다."""
+        rows = self.execute(
+            f"SELECT {self._COLUMNS} FROM restaurants r WHERE r.area = ? ORDER BY r.last_seen DESC LIMIT ?",
+            (area or "", limit)
+        )
+        now = time.time()
+        return [self._to_entry(row, now) for row in rows]
+
+    def find(self, name: str, area: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """이름이 같은 맛집 항목을 반환합니다. (지역이 주어지면 같은 지역 항목만)"""
+        sql = f"SELECT {self._COLUMNS} FROM restaurants r WHERE r.name_key = ?"
+        params: tuple = (name_key(name),)
+        if area:
+            sql += " AND r.area = ?"
+            params += (area,)
+        rows = self.execute(sql + " ORDER BY r.last_seen DESC LIMIT 1", params)
+        return self._to_entry(rows[0], time.time()) if rows else None
+
+    def has_fresh_area(self, area: Optional[str]) -> bool:
+        """지역에 최신 정보가 충분히 쌓여 있어 후보 목록 검색을 생략할 수 있는지 확인합니다."""
+        if not area:
+            return False
+        fresh = [e for e in self.area_entries(area, self.min_area_entries) if not e["stale"]]
+        return len(fresh) >= self.min_area_entries
+
+    @staticmethod
+    def is_complete(entry: Optional[Dict[str, Any]]) -> bool:
+        """오래되지 않았고 필수 항목이 모두 있는 항목인지 확인합니다."""
+        return bool(entry) and not entry["stale"] and not entry["missing"]
+
+    @staticmethod
+    def format_entries(entries: List[Dict[str, Any]]) -> str:
+        """카탈로그 항목을 에이전트 입력용 텍스트로 변환합니다. (웹 검색이 필요한 항목 표시)"""
+        sections = []
+        for entry in entries:
+            lines = [f"## {entry['name']}"]
+            lines += [f"- {FIELD_LABELS[field]}: {entry[field]}" for field in CATALOG_FIELDS if entry[field]]
+            if entry.get("distance") is not None:
+                lines.append(f"- {FIELD_LABELS['distance']}: {entry['distance']:,.0f}m")
+            checked = time.strftime("%Y-%m-%d", time.localtime(entry["last_seen"])) if entry["last_seen"] else "없음"
+            lines.append(f"- 마지막 확인: {checked}" + (" (오래됨, 웹 검색으로 재확인 필요)" if entry["stale"] else ""))
+            if entry["missing"]:
+                lines.append(f"- 정보 없음: {', '.join(FIELD_LABELS[field] for field in entry['missing'])} (웹 검색으로 보완 필요)")
+            sections.append("\n".join(lines))
+        return "\n\n".join(sections)
+
+    @staticmethod
+    def to_enriched(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """카탈로그 항목을 CandidateEnricher.enrich 결과와 같은 형식으로 변환합니다."""
+        details = " / ".join(f"{FIELD_LABELS[field]} {entry[field]}" for field in CATALOG_FIELDS
+                             if entry[field] and field != "url")
+        return {
+            "name": entry["name"],
+            "snippets": [{"purpose": "catalog", "title": entry["name"], "snippet": details, "link": entry["url"]}],
+            "status": "ok",
+            "elapsed": 0.0
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """카탈로그 크기와 조회 적중 통계를 반환합니다."""
+        total = self.execute("SELECT COUNT(*) FROM restaurants")[0][0]
+        return {**self.stats, "entries": total}
@@ -18,6 +18,7 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config_manager import load_config
+from src.search_tools import CachedSerperDevTool
 
 # 설정 로딩 (config_manager가 자동으로 환경 변수를 설정함)
 config = load_config()
@@ -29,8 +30,11 @@ class RestaurantFinder:
 
 
     def __init__(self):
-        # 도구 설정
-        self.search_tool = SerperDevTool()
+        # 도구 설정 (검색 결과 캐시 및 후처리 적용)
+        self.search_tool = CachedSerperDevTool.from_config(
+            config.get("cache_settings.search", {}) or {},
+            config.get("search_filter_settings", {}) or {}
+        )
         # WebsiteSearchTool은 OpenAI를 사용하므로 제거 (Gemini 사용 시)
         # self.web_search_tool = WebsiteSearchTool()
         
@@ -171,8 +175,13 @@ class RestaurantFinder:
         print("=" * 50)
         
         # CrewAI 실행
+        self.search_tool.begin_run(user_request)
         result = self.crew.kickoff(inputs={"user_request": user_request})
         
+        stats = self.search_tool.get_stats()
+        if stats:
+            print(f"🗄️ 검색 캐시 적중률: {stats['hit_rate']:.0%} (절약: {stats['bytes_saved']:,} bytes)")
+        
         return result
 
 def main():
@@ -0,0 +1,192 @@
+"""
+맛집 추천 결과 모델 모듈
+커뮤니케이터의 구조화된 출력(JSON 스키마)과 이후 단계(설문 폼, 시트, 이메일, 분석)에
+그대로 전달되는 Restaurant 레코드를 정의합니다.
+"""
+
+import re
+import json
+from dataclasses import dataclass, asdict, fields
+from typing import Dict, Any, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+
+@dataclass(slots=True)
+class Restaurant:
+    """추천 맛집 한 곳의 정보"""
+    rank: int
+    name: str
+    address: str = ""
+    phone: str = ""
+    rating: str = ""
+    price: str = ""
+    menu: str = ""
+    hours: str = ""
+    url: str = ""
+    category: str = ""
+    distance: str = ""
+    reason: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @property
+    def label(self) -> str:
+        """설문 선택지 등에 사용하는 표시 이름"""
+        return f"[{self.rank}위] {self.name}"
+
+
+class RestaurantItem(BaseModel):
+    """커뮤니케이터 출력 스키마의 맛집 항목"""
+    rank: int = Field(description="추천 순위 (1부터 시작)")
+    name: str = Field(description="맛집 이름")
+    address: str = Field(default="", description="주소")
+    phone: str = Field(default="", description="전화번호")
+    rating: str = Field(default="", description="평점 (예: 4.3)")
+    price: str = Field(default="", description="1인 가격대 (예: 9,000원)")
+    menu: str = Field(default="", description="대표 메뉴")
+    hours: str = Field(default="", description="영업시간")
+    url: str = Field(default="", description="상세 정보 URL")
+    category: str = Field(default="", description="음식 종류 (예: 한식)")
+    distance: str = Field(default="", description="요청 위치로부터의 거리")
+    reason: str = Field(default="", description="추천 이유")
+
+
+class RecommendationOutput(BaseModel):
+    """커뮤니케이터의 구조화된 추천 결과"""
+    summary: str = Field(default="", description="사용자에게 전달할 한두 문장의 요약 인사말")
+    restaurants: List[RestaurantItem] = Field(description="순위대로 정렬된 추천 맛집 목록")
+
+
+# 마크다운 표시용 항목 (필드, 라벨)
+_DISPLAY_FIELDS = (
+    ("category", "🏷️ 카테고리"),
+    ("address", "📍 주소"),
+    ("distance", "📏 거리"),
+    ("phone", "📞 전화"),
+    ("hours", "🕐 영업시간"),
+    ("rating", "⭐ 평점"),
+    ("price", "💰 가격대"),
+    ("menu", "🍽️ 메뉴"),
+    ("reason", "💡 추천 이유"),
+    ("url", "🔗 URL"),
+)
+
+# 마크다운 라벨 -> 필드 (LLM이 쓰는 변형 표기 포함)
+_LABEL_TO_FIELD = {
+    "주소": "address", "위치": "address",
+    "전화": "phone", "전화번호": "phone", "연락처": "phone",
+    "평점": "rating", "별점": "rating",
+    "가격대": "price", "가격": "price",
+    "메뉴": "menu", "대표 메뉴": "menu", "대표메뉴": "menu",
+    "영업시간": "hours", "영업 시간": "hours",
+    "url": "url", "링크": "url", "상세정보": "url",
+    "카테고리": "category", "분류": "category", "음식 종류": "category",
+    "거리": "distance",
+    "추천 이유": "reason", "ai 추천 이유": "reason",
+}
+
+_RESTAURANT_FIELDS = {f.name for f in fields(Restaurant)}
+
+# **[1위] 맛집명**, [1위] 맛집명, ### 1위: 맛집명 형식의 제목 줄
+_TITLE_PATTERN = re.compile(r'^[#\s]*(?:\*\*)?\s*\[?\s*(\d+)\s*위\s*\]?\s*[:.)]?\s*(.+?)\s*(?:\*\*)?\s*$')
+# 📍 주소: ..., - **주소**: ... 형식의 항목 줄
+_FIELD_PATTERN = re.compile(r'^[\s\-*•]*(?:[^\w\s]+\s*)*(?:\*\*)?([가-힣A-Za-z ]+?)(?:\*\*)?\s*:\s*(.*)$')
+
+
+def _from_item(item: Dict[str, Any], default_rank: int) -> Optional[Restaurant]:
+    data = {key: ("" if value is None else value) for key, value in item.items() if key in _RESTAURANT_FIELDS}
+    if not str(data.get("name", "")).strip():
+        return None
+    try:
+        data["rank"] = int(data.get("rank") or default_rank)
+    except (TypeError, ValueError):
+        data["rank"] = default_rank
+    return Restaurant(**{key: value if key == "rank" else str(value).strip() for key, value in data.items()})
+
+
+def parse_recommendation_markdown(text: str) -> List[Restaurant]:
+    """
+    마크다운 추천 보고서에서 맛집 목록을 추출합니다.
+    구조화된 출력이 없는 경우(캐시된 결과, 스키마 변환 실패)의 대체 경로입니다.
+    """
+    restaurants: List[Restaurant] = []
+    current: Optional[Restaurant] = None
+
+    for line in (text or "").splitlines():
+        title = _TITLE_PATTERN.match(line)
+        if title:
+            current = Restaurant(rank=int(title.group(1)), name=title.group(2).strip("* "))
+            restaurants.append(current)
+            continue
+        if current is None:
+            continue
+        field = _FIELD_PATTERN.match(line)
+        if not field:
+            continue
+        key = _LABEL_TO_FIELD.get(field.group(1).strip().lower())
+        value = field.group(2).strip()
+        if key == "url":
+            url_match = re.search(r'https?://[^\s)\]]+', value)
+            value = url_match.group(0) if url_match else ""
+        if key and value and not getattr(current, key):
+            setattr(current, key, value)
+    return restaurants
+
+
+def restaurants_from_output(output: Any) -> List[Restaurant]:
+    """
+    CrewOutput/TaskOutput, RecommendationOutput, dict, 문자열 중 무엇이든 Restaurant 목록으로 변환합니다.
+    스키마 검증된 출력을 우선 사용하고, 없으면 JSON 본문, 마지막으로 마크다운을 해석합니다.
+    """
+    structured = getattr(output, "pydantic", None)
+    if isinstance(output, RecommendationOutput):
+        structured = output
+    if structured is None and isinstance(getattr(output, "json_dict", None), dict):
+        structured = output.json_dict
+    if isinstance(output, dict):
+        structured = output
+
+    if structured is None:
+        raw = str(getattr(output, "raw", output) or "")
+        match = re.search(r'\{.*\}', raw, re.DOTALL)
+        if match:
+            try:
+                structured = RecommendationOutput.model_validate(json.loads(match.group(0)))
+            except (json.JSONDecodeError, ValidationError):
+                structured = None
+        if structured is None:
+            return parse_recommendation_markdown(raw)
+
+    if isinstance(structured, BaseModel):
+        structured = structured.model_dump()
+    items = structured.get("restaurants", []) if isinstance(structured, dict) else []
+    restaurants = [r for r in (_from_item(item, i) for i, item in enumerate(items, 1)) if r]
+    return sorted(restaurants, key=lambda r: r.rank)
+
+
+def render_recommendations(restaurants: List[Restaurant], summary: str = "") -> str:
+    """Restaurant 목록을 사용자에게 보여줄 추천 보고서로 변환합니다. (parse_recommendation_markdown으로 되읽기 가능)"""
+    sections = ["🍽️ 추천 맛집 리스트"]
+    if summary:
+        sections.append(summary.strip())
+    for restaurant in restaurants:
+        lines = [f"**{restaurant.label}**"]
+        for key, label in _DISPLAY_FIELDS:
+            value = getattr(restaurant, key)
+            if value:
+                lines.append(f"{label}: {value}")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections)
+
+
+def summarize_restaurants(restaurants: List[Restaurant]) -> str:
+    """이메일, 분석 작업 프롬프트에 넣을 한 줄 요약"""
+    if not restaurants:
+        return "추천 맛집 정보 없음"
+    parts = []
+    for restaurant in restaurants:
+        details = ", ".join(v for v in (restaurant.category, restaurant.price, f"평점 {restaurant.rating}" if restaurant.rating else "") if v)
+        parts.append(f"{restaurant.label}" + (f" ({details})" if details else ""))
+    return " / ".join(parts)
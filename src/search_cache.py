@@ -0,0 +1,227 @@
+"""
+검색 결과 캐시 저장소 모듈
+웹 검색 결과를 SQLite에 압축 저장하고 쿼리별 TTL, 빈 결과(negative) 캐싱,
+실행 단위 중복 쿼리 제거를 제공합니다.
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Callable
+
+from src.recommendation_cache import normalize_request
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 쿼리 키워드별 기본 TTL (초). 자주 바뀌는 정보일수록 짧게 유지
+DEFAULT_TTL_RULES = {
+    "리뷰": 24 * 3600,
+    "평점": 24 * 3600,
+    "영업시간": 3 * 24 * 3600,
+    "가격": 3 * 24 * 3600,
+    "메뉴": 3 * 24 * 3600,
+}
+
+
+def _is_empty_result(result: Any) -> bool:
+    """검색 결과가 비어 있는지 확인합니다."""
+    if not result:
+        return True
+    if isinstance(result, dict):
+        return not any(result.get(k) for k in ("organic", "news", "knowledgeGraph", "places"))
+    return False
+
+
+class SearchResultStore:
+    """SQLite 기반 검색 결과 캐시 저장소"""
+
+    def __init__(self, db_file: Optional[str] = None, default_ttl_seconds: float = 7 * 24 * 3600,
+                 negative_ttl_seconds: float = 3600, ttl_rules: Optional[Dict[str, float]] = None):
+        self.db_file = db_file or ":memory:"
+        self.default_ttl_seconds = default_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.ttl_rules = DEFAULT_TTL_RULES if ttl_rules is None else ttl_rules
+
+        self._lock = threading.Lock()
+        # 메모리 DB는 연결마다 새로 생성되므로 단일 연결을 공유
+        self._memory_conn = None
+        if self.db_file == ":memory:":
+            self._memory_conn = sqlite3.connect(":memory:", check_same_thread=False)
+        else:
+            Path(self.db_file).parent.mkdir(parents=True, exist_ok=True)
+
+        # 실행(run) 단위 중복 제거용 메모리 캐시
+        self._run_results: Dict[str, Any] = {}
+        self._inflight: Dict[str, threading.Event] = {}
+
+        self.stats = {
+            "hits": 0, "misses": 0, "negative_hits": 0, "dedup_hits": 0,
+            "stores": 0, "bytes_saved": 0, "bytes_stored": 0
+        }
+        self._init_db()
+
+    @classmethod
+    def from_config(cls, cache_settings: Dict[str, Any]) -> "SearchResultStore":
+        """config.json의 cache_settings.search 섹션으로 저장소를 생성합니다."""
+        db_file = cache_settings.get("db_file", "cache/search_cache.db")
+        if db_file and db_file != ":memory:" and not os.path.isabs(db_file):
+            db_file = str(PROJECT_ROOT / db_file)
+        return cls(
+            db_file=db_file,
+            default_ttl_seconds=cache_settings.get("ttl_seconds", 7 * 24 * 3600),
+            negative_ttl_seconds=cache_settings.get("negative_ttl_seconds", 3600),
+            ttl_rules=cache_settings.get("ttl_rules")
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._memory_conn is not None:
+            return self._memory_conn
+        return sqlite3.connect(self.db_file, timeout=10)
+
+    def _init_db(self):
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS search_cache (
+                        key TEXT PRIMARY KEY,
+                        query TEXT NOT NULL,
+                        search_type TEXT NOT NULL,
+                        payload BLOB NOT NULL,
+                        raw_size INTEGER NOT NULL,
+                        is_empty INTEGER NOT NULL,
+                        created_at REAL NOT NULL,
+                        expires_at REAL NOT NULL
+                    )
+                """)
+                conn.commit()
+            finally:
+                if conn is not self._memory_conn:
+                    conn.close()
+
+    def make_key(self, query: str, search_type: str = "search") -> str:
+        """
+        검색 쿼리에서 캐시 키를 생성합니다. (공백, 조사, 금액 표기 차이만 흡수)
+        검색 결과 원문은 쿼리 문구에 따라 달라지므로 요청 의도 키(지역 별칭 통합 등)는 사용하지 않습니다.
+        """
+        return f"{search_type}:{normalize_request(query)}"
+
+    def ttl_for(self, query: str) -> float:
+        """쿼리 내용에 따른 TTL을 반환합니다. (여러 규칙이 맞으면 가장 짧은 값)"""
+        matched = [ttl for keyword, ttl in self.ttl_rules.items() if keyword in query]
+        return min(matched) if matched else self.default_ttl_seconds
+
+    def get(self, query: str, search_type: str = "search") -> Tuple[bool, Any]:
+        """캐시된 검색 결과를 조회합니다. (found, result)를 반환"""
+        key = self.make_key(query, search_type)
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT payload, raw_size, is_empty, expires_at FROM search_cache WHERE key = ?",
+                    (key,)
+                ).fetchone()
+            finally:
+                if conn is not self._memory_conn:
+                    conn.close()
+
+            if row is None or row[3] < time.time():
+                self.stats["misses"] += 1
+                return False, None
+
+            payload, raw_size, is_empty, _ = row
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += raw_size
+            if is_empty:
+                self.stats["negative_hits"] += 1
+            return True, json.loads(zlib.decompress(payload).decode('utf-8'))
+
+    def put(self, query: str, result: Any, search_type: str = "search", ttl_seconds: Optional[float] = None):
+        """검색 결과를 압축하여 저장합니다. 빈 결과는 짧은 TTL로 저장합니다."""
+        key = self.make_key(query, search_type)
+        raw = json.dumps(result, ensure_ascii=False).encode('utf-8')
+        payload = zlib.compress(raw, 6)
+        is_empty = _is_empty_result(result)
+
+        if ttl_seconds is None:
+            ttl_seconds = self.negative_ttl_seconds if is_empty else self.ttl_for(query)
+        now = time.time()
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, query, search_type, payload, len(raw), int(is_empty), now, now + ttl_seconds)
+                )
+                conn.commit()
+            finally:
+                if conn is not self._memory_conn:
+                    conn.close()
+            self.stats["stores"] += 1
+            self.stats["bytes_stored"] += len(payload)
+
+    def fetch(self, query: str, search_fn: Callable[[str], Any], search_type: str = "search") -> Any:
+        """
+        실행 단위 메모리 → SQLite → 실제 검색 순으로 결과를 가져옵니다.
+        같은 실행 안에서 동시에 들어온 동일 쿼리는 한 번만 검색합니다.
+        """
+        key = self.make_key(query, search_type)
+
+        while True:
+            with self._lock:
+                if key in self._run_results:
+                    self.stats["dedup_hits"] += 1
+                    return self._run_results[key]
+                event = self._inflight.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._inflight[key] = event
+                    break
+            # 다른 스레드가 같은 쿼리를 검색 중이면 완료를 기다림
+            event.wait()
+
+        try:
+            found, result = self.get(query, search_type)
+            if not found:
+                result = search_fn(query)
+                self.put(query, result, search_type)
+            with self._lock:
+                self._run_results[key] = result
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def begin_run(self):
+        """새 실행(crew run)을 시작합니다. 실행 단위 중복 제거 캐시를 비웁니다."""
+        with self._lock:
+            self._run_results.clear()
+
+    def purge_expired(self) -> int:
+        """만료된 항목을 삭제하고 삭제 건수를 반환합니다."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                cursor = conn.execute("DELETE FROM search_cache WHERE expires_at < ?", (time.time(),))
+                conn.commit()
+                return cursor.rowcount
+            finally:
+                if conn is not self._memory_conn:
+                    conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중률과 절약한 바이트 수를 포함한 통계를 반환합니다."""
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"] + self.stats["dedup_hits"]
+            served = self.stats["hits"] + self.stats["dedup_hits"]
+            return {
+                **self.stats,
+                "hit_rate": round(served / lookups, 3) if lookups else 0.0
+            }
@@ -0,0 +1,139 @@
+"""
+검색 결과 후처리 모듈
+Serper 응답에서 에이전트가 사용하지 않는 항목(지식 그래프 원본, 사이트링크, 관련 질문 등)을 제거하고
+검색 결과 문단을 요청과의 BM25 관련도로 정렬하여 상위 k개만 남깁니다.
+"""
+
+import re
+import math
+import json
+from collections import Counter
+from typing import Dict, Any, List, Tuple
+
+from src.recommendation_cache import normalize_request
+from src.research_compactor import estimate_tokens
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    BM25용 토큰 목록. 조사가 제거된 단어와 한글 2-gram을 함께 사용하여
+    '광화문역'과 '광화문' 같은 어형 차이도 부분 일치하도록 합니다.
+    """
+    tokens = []
+    for word in normalize_request(text).split():
+        tokens.append(word)
+        hangul = re.sub(r'[^가-힣]', '', word)
+        if len(hangul) > 2:
+            tokens.extend(hangul[i:i + 2] for i in range(len(hangul) - 1))
+    return tokens
+
+
+class BM25Scorer:
+    """문서 집합 단위의 Okapi BM25 점수 계산기"""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    def score(self, query_tokens: List[str], documents: List[List[str]]) -> List[float]:
+        """각 문서의 질의 관련도 점수를 반환합니다."""
+        if not documents:
+            return []
+        n = len(documents)
+        avg_length = sum(len(doc) for doc in documents) / n or 1.0
+        document_frequency = Counter(token for doc in documents for token in set(doc))
+        query_terms = set(query_tokens)
+
+        scores = []
+        for doc in documents:
+            frequencies = Counter(doc)
+            norm = self.k1 * (1 - self.b + self.b * len(doc) / avg_length)
+            total = 0.0
+            for term in query_terms:
+                tf = frequencies.get(term, 0)
+                if not tf:
+                    continue
+                df = document_frequency[term]
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                total += idf * tf * (self.k1 + 1) / (tf + norm)
+            scores.append(total)
+        return scores
+
+
+class SearchResultFilter:
+    """검색 결과 필드 정리 + BM25 상위 k개 문단 선택"""
+
+    def __init__(self, top_k: int = 5, max_snippet_chars: int = 200):
+        self.top_k = top_k
+        self.max_snippet_chars = max_snippet_chars
+        self.scorer = BM25Scorer()
+
+    @classmethod
+    def from_config(cls, filter_settings: Dict[str, Any]) -> "SearchResultFilter":
+        """config.json의 search_filter_settings 섹션으로 생성합니다."""
+        return cls(
+            top_k=filter_settings.get("top_k", 5),
+            max_snippet_chars=filter_settings.get("max_snippet_chars", 200)
+        )
+
+    def _passages(self, result: Dict[str, Any]) -> List[Dict[str, str]]:
+        """응답에서 제목/링크/스니펫만 남긴 문단 목록을 만듭니다."""
+        passages = []
+        knowledge_graph = result.get("knowledgeGraph")
+        if isinstance(knowledge_graph, dict) and knowledge_graph.get("title"):
+            # 지식 그래프는 속성을 한 문단으로 요약
+            attributes = knowledge_graph.get("attributes") or {}
+            details = [knowledge_graph.get("type", ""), knowledge_graph.get("description", "")]
+            details += [f"{key}: {value}" for key, value in attributes.items()]
+            passages.append({
+                "title": knowledge_graph["title"],
+                "link": knowledge_graph.get("website", ""),
+                "snippet": " / ".join(d for d in details if d)
+            })
+        for item in result.get("organic") or []:
+            passages.append({
+                "title": item.get("title", ""),
+                "link": item.get("link", ""),
+                "snippet": item.get("snippet", "")
+            })
+        for item in result.get("places") or []:
+            details = [item.get("category", ""), item.get("address", ""), item.get("phoneNumber", "")]
+            if item.get("rating"):
+                details.append(f"평점 {item['rating']} (리뷰 {item.get('ratingCount', 0)})")
+            passages.append({
+                "title": item.get("title", ""),
+                "link": item.get("website", ""),
+                "snippet": " / ".join(str(d) for d in details if d)
+            })
+        return passages
+
+    def process(self, result: Any, query: str, context: str = "") -> Tuple[Any, Dict[str, Any]]:
+        """
+        검색 결과를 정리하여 ({"organic": [...]} 형식의 결과, 통계)를 반환합니다.
+        context에는 파싱된 사용자 요청(지역, 음식 종류 등)을 전달하여 관련도 계산에 함께 사용합니다.
+        """
+        if not isinstance(result, dict):
+            size = estimate_tokens(str(result))
+            return result, {"input_tokens": size, "output_tokens": size, "kept": 0, "total": 0}
+
+        # 실제로 전달될 길이로 자른 뒤 관련도를 계산 (긴 스니펫이 길이 정규화로 불리해지지 않도록)
+        passages = self._passages(result)
+        for passage in passages:
+            if len(passage["snippet"]) > self.max_snippet_chars:
+                passage["snippet"] = passage["snippet"][:self.max_snippet_chars].rstrip() + "…"
+
+        query_tokens = tokenize(f"{query} {context}")
+        scores = self.scorer.score(
+            query_tokens, [tokenize(f"{p['title']} {p['snippet']}") for p in passages]
+        )
+        # 동점은 원래 검색 순위를 유지
+        ranked = sorted(range(len(passages)), key=lambda i: (-scores[i], i))[:self.top_k]
+        kept = [passages[index] for index in ranked]
+
+        trimmed = {"organic": kept}
+        return trimmed, {
+            "input_tokens": estimate_tokens(json.dumps(result, ensure_ascii=False)),
+            "output_tokens": estimate_tokens(json.dumps(trimmed, ensure_ascii=False)),
+            "kept": len(kept),
+            "total": len(passages)
+        }
@@ -0,0 +1,168 @@
+"""
+에이전트용 검색 도구 모듈
+SerperDevTool을 감싸 검색 결과 캐시와 결과 후처리(불필요 필드 제거, BM25 상위 문단 선택)를 적용한 도구와
+이전 실행에서 수집한 로컬 맛집 카탈로그 검색 도구를 제공합니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Type
+
+from crewai.tools import BaseTool
+from crewai_tools import SerperDevTool
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.search_cache import SearchResultStore
+from src.search_filter import SearchResultFilter
+from src.restaurant_catalog import RestaurantCatalog
+from src.request_intent import parse_request_intent
+from src.entity_resolution import canonical_name
+
+
+class CachedSerperDevToolSchema(BaseModel):
+    """CachedSerperDevTool 입력 스키마 (SerperDevTool과 동일)"""
+    search_query: str = Field(
+        ..., description="Mandatory search query you want to use to search the internet"
+    )
+
+
+def _result_text(result: Any) -> str:
+    """검색 결과의 제목/스니펫 텍스트 (검색어가 그대로 담긴 searchParameters, relatedSearches 제외)"""
+    if not isinstance(result, dict):
+        return str(result)
+    items = [result.get("knowledgeGraph") or {}] + list(result.get("organic") or []) + list(result.get("places") or [])
+    return " ".join(f"{item.get('title', '')} {item.get('snippet', '')}" for item in items if isinstance(item, dict))
+
+
+class CachedSerperDevTool(BaseTool):
+    """
+    SerperDevTool과 동일한 인터페이스의 캐시 적용 검색 도구
+    에이전트의 tools 목록에서 SerperDevTool 대신 그대로 사용할 수 있습니다.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str = "Search the internet with Serper"
+    description: str = (
+        "A tool that can be used to search the internet with a search_query. "
+        "Repeated queries are served from a local cache."
+    )
+    args_schema: Type[BaseModel] = CachedSerperDevToolSchema
+
+    search_tool: Any = Field(default=None, exclude=True)
+    store: Any = Field(default=None, exclude=True)
+    result_filter: Any = Field(default=None, exclude=True)
+    logger: Any = Field(default=None, exclude=True)
+    request_context: str = Field(default="", exclude=True)
+    # 리서치 완성도 모니터 (ResearchCompletenessMonitor)
+    monitor: Any = Field(default=None, exclude=True)
+    # 현재 실행에서 받은 웹 검색 결과 텍스트 (카탈로그 확인 시각 갱신 대상 판단용)
+    run_texts: List[str] = Field(default_factory=list, exclude=True)
+
+    def __init__(self, search_tool: Optional[SerperDevTool] = None,
+                 store: Optional[SearchResultStore] = None,
+                 result_filter: Optional[SearchResultFilter] = None, logger: Any = None,
+                 monitor: Any = None, **kwargs):
+        super().__init__(**kwargs)
+        self.search_tool = search_tool or SerperDevTool()
+        self.store = store
+        self.result_filter = result_filter
+        self.logger = logger
+        self.monitor = monitor
+
+    @classmethod
+    def from_config(cls, cache_settings: Dict[str, Any], filter_settings: Optional[Dict[str, Any]] = None,
+                    logger: Any = None) -> "CachedSerperDevTool":
+        """
+        config.json의 cache_settings.search, search_filter_settings 섹션으로 도구를 생성합니다.
+        캐시와 후처리는 각각 enabled 설정으로 끌 수 있습니다.
+        """
+        filter_settings = filter_settings or {}
+        return cls(
+            store=SearchResultStore.from_config(cache_settings) if cache_settings.get("enabled", True) else None,
+            result_filter=SearchResultFilter.from_config(filter_settings) if filter_settings.get("enabled", True) else None,
+            logger=logger
+        )
+
+    def _search(self, search_query: str) -> Any:
+        """캐시 미적중 시 실제 Serper 검색을 수행합니다."""
+        return self.search_tool.run(search_query=search_query)
+
+    def _run(self, **kwargs: Any) -> Any:
+        search_query = kwargs.get("search_query") or kwargs.get("query")
+        if not search_query:
+            raise ValueError("search_query is required")
+        if self.monitor and self.monitor.should_skip_search():
+            # 필요한 후보가 이미 모였으면 검색하지 않고 최종 답변 작성을 다시 안내
+            return self.monitor.notice()
+        # 캐시에는 원본 응답을 저장하고, 후처리는 요청마다 적용
+        result = self.store.fetch(search_query, self._search) if self.store else self._search(search_query)
+        if self.result_filter:
+            result, stats = self.result_filter.process(result, search_query, self.request_context)
+            if self.logger:
+                self.logger.log_compaction("search", stats["input_tokens"], stats["output_tokens"], stats["kept"])
+
+        self.run_texts.append(canonical_name(_result_text(result)))
+
+        if self.monitor and self.monitor.observe(result):
+            # 필요한 항목을 갖춘 후보가 목표 수만큼 모이면 검색 결과와 함께 최종 답변 작성을 안내 (남은 반복 생략)
+            return f"{result}\n\n{self.monitor.notice()}"
+        return result
+
+    def begin_run(self, user_request: Optional[str] = None):
+        """
+        새 crew 실행을 시작합니다. (실행 단위 중복 쿼리 제거 초기화)
+        user_request의 지역/음식 종류/키워드는 검색 결과 관련도 계산에 함께 사용됩니다.
+        """
+        self.request_context = parse_request_intent(user_request).topic() if user_request else ""
+        self.run_texts = []
+        if self.store:
+            self.store.begin_run()
+        if self.monitor:
+            self.monitor.finish()
+
+    def verified_names(self, names: Iterable[str]) -> Set[str]:
+        """현재 실행의 웹 검색 결과에 이름이 나온 맛집 (카탈로그/순위 뷰에서만 가져온 맛집 제외)"""
+        return {name for name in names
+                if canonical_name(name) and any(canonical_name(name) in text for text in self.run_texts)}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """검색 캐시 통계를 반환합니다. (캐시 비활성화 시 빈 값)"""
+        return self.store.get_stats() if self.store else {}
+
+
+class LocalCatalogSearchToolSchema(BaseModel):
+    """LocalCatalogSearchTool 입력 스키마"""
+    search_query: str = Field(
+        ..., description="Restaurant name, menu or area to look up in the local catalog"
+    )
+
+
+class LocalCatalogSearchTool(BaseTool):
+    """
+    로컬 맛집 카탈로그 검색 도구
+    이전 실행에서 확인된 맛집 정보를 네트워크 없이 반환하고, 오래되었거나 없는 항목을 함께 표시합니다.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str = "Search the local restaurant catalog"
+    description: str = (
+        "A tool that searches restaurants collected in previous runs by name, menu or area. "
+        "Use it before searching the internet; only search the internet for restaurants, "
+        "areas or fields it reports as missing or stale."
+    )
+    args_schema: Type[BaseModel] = LocalCatalogSearchToolSchema
+
+    catalog: Any = Field(default=None, exclude=True)
+    max_results: int = Field(default=8, exclude=True)
+
+    def __init__(self, catalog: RestaurantCatalog, max_results: int = 8, **kwargs):
+        super().__init__(**kwargs)
+        self.catalog = catalog
+        self.max_results = max_results
+
+    def _run(self, **kwargs: Any) -> str:
+        search_query = kwargs.get("search_query") or kwargs.get("query")
+        if not search_query:
+            raise ValueError("search_query is required")
+        entries = self.catalog.search(search_query, limit=self.max_results)
+        if not entries:
+            return "카탈로그에 일치하는 맛집이 없습니다. 웹 검색으로 맛집 정보를 수집하세요."
+        return self.catalog.format_entries(entries)
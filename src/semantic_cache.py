@@ -0,0 +1,301 @@
+"""
+의미 기반 추천 캐시 모듈
+오프라인 로컬 벡터화(문자 n-gram 해싱)와 LSH 근사 최근접 이웃 인덱스로
+표현만 다른 유사 요청에 대해 캐시된 추천 결과를 반환합니다.
+"""
+
+import os
+import json
+import time
+import zlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Callable
+
+import numpy as np
+
+from src.recommendation_cache import normalize_request
+from src.request_intent import intent_guard_key
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 거의 모든 요청에 등장하여 유사도 판별에 도움이 되지 않는 단어
+_DOMAIN_STOPWORDS = {"근처", "주변", "부근", "맛집", "식당", "음식점", "이하", "이내", "정도", "곳", "집"}
+
+
+def _stable_hash(text: str) -> int:
+    """프로세스와 무관하게 동일한 해시 값을 반환합니다. (Python hash()는 실행마다 달라짐)"""
+    return zlib.crc32(text.encode('utf-8'))
+
+
+class RequestVectorizer:
+    """외부 API 없이 동작하는 해싱 기반 요청 벡터화기 (단어 + 문자 2/3-gram)"""
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+
+    def _features(self, text: str) -> List[Tuple[str, float]]:
+        features = []
+        for word in normalize_request(text).split():
+            if word in _DOMAIN_STOPWORDS:
+                continue
+            # 단어 단위 특성은 가중치를 높여 '한식'/'일식' 같은 차이를 구분
+            features.append(("w:" + word, 3.0))
+            padded = f"<{word}>"
+            for n in (2, 3):
+                for i in range(len(padded) - n + 1):
+                    features.append((f"c{n}:" + padded[i:i + n], 1.0))
+        return features
+
+    def transform(self, text: str) -> np.ndarray:
+        """요청 문자열을 L2 정규화된 벡터로 변환합니다."""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature, weight in self._features(text):
+            h = _stable_hash(feature)
+            sign = 1.0 if (h >> 31) & 1 else -1.0
+            vector[h % self.dim] += sign * weight
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def transform_many(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.vstack([self.transform(text) for text in texts])
+
+
+class LSHIndex:
+    """랜덤 초평면 LSH 기반 근사 최근접 이웃 인덱스"""
+
+    def __init__(self, dim: int, num_tables: int = 20, num_bits: int = 12, seed: int = 42):
+        rng = np.random.default_rng(seed)
+        self.num_tables = num_tables
+        self.num_bits = num_bits
+        self.planes = rng.standard_normal((dim, num_tables * num_bits)).astype(np.float32)
+        self._bit_weights = (1 << np.arange(num_bits)).astype(np.int64)
+        self.tables: List[Dict[int, List[int]]] = [{} for _ in range(num_tables)]
+
+    def signatures(self, vectors: np.ndarray) -> np.ndarray:
+        """벡터 묶음의 테이블별 버킷 번호 (n, num_tables)를 계산합니다."""
+        bits = (vectors.astype(np.float32) @ self.planes) > 0
+        bits = bits.reshape(len(vectors), self.num_tables, self.num_bits)
+        return (bits * self._bit_weights).sum(axis=2)
+
+    def add(self, ids: List[int], signatures: np.ndarray):
+        for row_id, signature in zip(ids, signatures):
+            for table, bucket in zip(self.tables, signature):
+                table.setdefault(int(bucket), []).append(row_id)
+
+    def candidates(self, signature: np.ndarray) -> List[int]:
+        found = set()
+        for table, bucket in zip(self.tables, signature):
+            found.update(table.get(int(bucket), ()))
+        return list(found)
+
+
+class SemanticRecommendationCache:
+    """유사 요청에 대한 추천 결과 캐시 (로컬 벡터 인덱스, 디스크 영속화)"""
+
+    # 이 크기 이하에서는 LSH 대신 전수 비교가 더 빠르고 정확함
+    EXACT_SEARCH_LIMIT = 2000
+    # 저널이 이 크기를 넘으면 스냅샷으로 압축
+    COMPACT_THRESHOLD = 1000
+
+    def __init__(self, similarity_threshold: float = 0.9, ttl_seconds: float = 6 * 3600,
+                 index_dir: Optional[str] = None, dim: int = 384,
+                 guard_key: Optional[Callable[[str], str]] = intent_guard_key):
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.index_dir = Path(index_dir) if index_dir else None
+        self.guard_key = guard_key
+
+        self.vectorizer = RequestVectorizer(dim)
+        self.index = LSHIndex(dim)
+        self._buffer = np.zeros((1024, dim), dtype=np.float16)
+        self._entries: List[Dict[str, Any]] = []
+        self._journal_size = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+        self._load()
+
+    @classmethod
+    def from_config(cls, cache_settings: Dict[str, Any]) -> "SemanticRecommendationCache":
+        """config.json의 cache_settings.semantic 섹션으로 캐시를 생성합니다."""
+        index_dir = cache_settings.get("index_dir", "cache/semantic_index")
+        if index_dir and not os.path.isabs(index_dir):
+            index_dir = str(PROJECT_ROOT / index_dir)
+        return cls(
+            similarity_threshold=cache_settings.get("similarity_threshold", 0.9),
+            ttl_seconds=cache_settings.get("ttl_seconds", 6 * 3600),
+            index_dir=index_dir,
+            dim=cache_settings.get("dim", 384)
+        )
+
+    def lookup(self, user_request: str) -> Optional[Dict[str, Any]]:
+        """
+        가장 유사한 과거 요청을 찾습니다.
+        유사도가 임계값 이상이면 {"request", "result", "similarity"}를 반환하고, 아니면 None
+        """
+        query = self.vectorizer.transform(user_request)
+        guard = self.guard_key(user_request) if self.guard_key else None
+
+        with self._lock:
+            if not self._entries:
+                self.stats["misses"] += 1
+                return None
+
+            if len(self._entries) <= self.EXACT_SEARCH_LIMIT:
+                candidate_ids = np.arange(len(self._entries))
+            else:
+                signature = self.index.signatures(query[None, :])[0]
+                candidate_ids = np.array(self.index.candidates(signature), dtype=np.int64)
+
+            best = None
+            if len(candidate_ids):
+                scores = self._vectors[candidate_ids].astype(np.float32) @ query
+                above = np.nonzero(scores >= self.similarity_threshold)[0]
+                # 유사도 내림차순으로 검사하여 만료/의도(지역, 음식 종류, 예산) 불일치 항목을 건너뜀
+                for order in above[np.argsort(-scores[above])]:
+                    similarity = float(scores[order])
+                    entry = self._entries[int(candidate_ids[order])]
+                    if self._is_expired(entry):
+                        continue
+                    if guard is not None and entry.get("guard") != guard:
+                        continue
+                    best = {"request": entry["request"], "result": entry["result"],
+                            "similarity": round(similarity, 4)}
+                    break
+
+            self.stats["hits" if best else "misses"] += 1
+            return best
+
+    def put(self, user_request: str, result: str):
+        """추천 결과를 인덱스에 추가합니다."""
+        entry = {
+            "request": user_request,
+            "result": result,
+            "created_at": time.time(),
+            "guard": self.guard_key(user_request) if self.guard_key else None
+        }
+        vector = self.vectorizer.transform(user_request)
+
+        with self._lock:
+            self._append(entry, vector)
+            self._append_journal(entry)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계를 반환합니다."""
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "entries": len(self._entries),
+                "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def _vectors(self) -> np.ndarray:
+        return self._buffer[:len(self._entries)]
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        if not self.ttl_seconds or self.ttl_seconds <= 0:
+            return False
+        return time.time() - entry["created_at"] > self.ttl_seconds
+
+    def _append(self, entry: Dict[str, Any], vector: np.ndarray):
+        row_id = len(self._entries)
+        if row_id >= len(self._buffer):
+            # 용량을 두 배로 늘려 추가 비용을 분할 상환
+            grown = np.zeros((len(self._buffer) * 2, self._buffer.shape[1]), dtype=np.float16)
+            grown[:row_id] = self._buffer[:row_id]
+            self._buffer = grown
+        self._buffer[row_id] = vector
+        self._entries.append(entry)
+        self.index.add([row_id], self.index.signatures(vector[None, :]))
+
+    # ----- 영속화: 스냅샷(vectors.npy + entries.jsonl) + 추가 저널(journal.jsonl) -----
+
+    def _paths(self) -> Tuple[Path, Path, Path]:
+        return (self.index_dir / "vectors.npy",
+                self.index_dir / "entries.jsonl",
+                self.index_dir / "journal.jsonl")
+
+    def _load(self):
+        """스냅샷과 저널을 읽어 인덱스를 복원합니다."""
+        if not self.index_dir:
+            return
+        vectors_file, entries_file, journal_file = self._paths()
+
+        entries, vectors = [], None
+        try:
+            if vectors_file.exists() and entries_file.exists():
+                vectors = np.load(vectors_file)
+                with open(entries_file, 'r', encoding='utf-8') as f:
+                    entries = [json.loads(line) for line in f if line.strip()]
+                if len(entries) != len(vectors) or vectors.shape[1] != self.vectorizer.dim:
+                    entries, vectors = [], None
+        except (OSError, ValueError):
+            entries, vectors = [], None
+
+        if entries:
+            keep = [i for i, entry in enumerate(entries) if not self._is_expired(entry)]
+            self._entries = [entries[i] for i in keep]
+            self._buffer = np.zeros((max(1024, len(keep) * 2), vectors.shape[1]), dtype=np.float16)
+            self._buffer[:len(keep)] = vectors[keep]
+            self.index.add(list(range(len(self._entries))), self.index.signatures(self._vectors))
+
+        if journal_file.exists():
+            try:
+                with open(journal_file, 'r', encoding='utf-8') as f:
+                    journal = [json.loads(line) for line in f if line.strip()]
+            except (OSError, ValueError):
+                journal = []
+            for entry in journal:
+                if not self._is_expired(entry):
+                    self._append(entry, self.vectorizer.transform(entry["request"]))
+            self._journal_size = len(journal)
+
+    def _append_journal(self, entry: Dict[str, Any]):
+        """저널에 항목을 추가하고, 필요하면 스냅샷으로 압축합니다. (호출자가 lock을 보유해야 함)"""
+        if not self.index_dir:
+            return
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            _, _, journal_file = self._paths()
+            with open(journal_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._journal_size += 1
+            if self._journal_size >= self.COMPACT_THRESHOLD:
+                self._write_snapshot()
+        except OSError:
+            pass
+
+    def _write_snapshot(self):
+        """현재 인덱스 전체를 스냅샷으로 저장하고 저널을 비웁니다."""
+        vectors_file, entries_file, journal_file = self._paths()
+        keep = [i for i, entry in enumerate(self._entries) if not self._is_expired(entry)]
+
+        tmp_vectors = vectors_file.with_suffix(".tmp.npy")
+        np.save(tmp_vectors, self._vectors[keep])
+        tmp_entries = entries_file.with_suffix(".tmp")
+        with open(tmp_entries, 'w', encoding='utf-8') as f:
+            for i in keep:
+                f.write(json.dumps(self._entries[i], ensure_ascii=False) + "\n")
+        os.replace(tmp_vectors, vectors_file)
+        os.replace(tmp_entries, entries_file)
+        journal_file.unlink(missing_ok=True)
+        self._journal_size = 0
+
+    def flush(self):
+        """저널을 스냅샷으로 압축합니다."""
+        if not self.index_dir:
+            return
+        with self._lock:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            self._write_snapshot()
@@ -0,0 +1,93 @@
+"""
+지역별 순위 뷰 테스트
+요청 매칭, 변경 시에만 재계산, 오래된 정보 처리를 테스트합니다.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.area_rankings import AreaRankingStore
+from src.curator_scoring import CuratorScoringEngine
+from src.request_intent import parse_request_intent
+from src.restaurant_catalog import RestaurantCatalog
+from src.restaurant_models import Restaurant
+
+
+def _restaurants():
+    return [
+        Restaurant(1, "깡장집 본점", category="한식", menu="된장찌개", rating="4.5", price="9,000원"),
+        Restaurant(2, "한우마을", category="한식", menu="한우", rating="4.8", price="45,000원"),
+        Restaurant(3, "청계 국밥", category="한식", menu="국밥", rating="4.1", price="10,000원"),
+        Restaurant(4, "광화문 스시", category="일식", menu="초밥", rating="4.6", price="25,000원"),
+        Restaurant(5, "백반집", category="한식", menu="백반", rating="3.9", price="8,000원"),
+    ]
+
+
+def _store(**kwargs):
+    catalog = RestaurantCatalog(**kwargs)
+    catalog.record(_restaurants(), "광화문")
+    return catalog, AreaRankingStore(catalog, CuratorScoringEngine(), min_results=2)
+
+
+def test_view_matches_preset_requests():
+    """지역/음식 종류/예산 구간으로 표현되는 요청만 뷰와 매칭되는지 테스트"""
+    _, store = _store()
+    assert store.view_key(parse_request_intent("광화문 근처 3만원 이하의 한식 맛집을 찾아줘")) == ("광화문", "한식", 30000)
+    assert store.view_key(parse_request_intent("홍대 근처 1만원 이하의 치킨집을 찾아줘")) == ("홍대", "치킨", 10000)
+    assert store.view_key(parse_request_intent("광화문 맛집")) == ("광화문", "", 0)
+    # 특정 메뉴, 구간에 없는 예산, 대상이 아닌 지역
+    assert store.view_key(parse_request_intent("광화문 된장찌개 맛집")) is None
+    assert store.view_key(parse_request_intent("광화문 2만5천원 이하 한식")) is None
+    assert store.view_key(parse_request_intent("여의도 한식 맛집")) is None
+
+
+def test_lookup_returns_budget_filtered_ranking():
+    """뷰 순위가 음식 종류와 예산 조건을 반영하는지 테스트"""
+    _, store = _store()
+    store.refresh_all()
+
+    ranking = store.lookup(parse_request_intent("광화문 근처 3만원 이하의 한식 맛집을 찾아줘"))
+    names = [item["name"] for item in ranking]
+    assert "광화문 스시" not in names
+    assert "한우마을" not in names
+    assert names[0] == "깡장집 본점"
+    assert [item["rank"] for item in ranking] == list(range(1, len(ranking) + 1))
+
+    text = AreaRankingStore.format_ranking(ranking)
+    assert "[1위] 깡장집 본점" in text
+    assert "된장찌개" in text
+
+
+def test_refresh_only_when_records_change():
+    """내용이 바뀐 경우에만 지역 뷰를 다시 계산하는지 테스트"""
+    catalog, store = _store()
+    assert store.refresh("광화문")
+    assert not store.refresh("광화문")
+
+    # 같은 내용을 다시 저장하면 재계산 없음
+    catalog.record(_restaurants(), "광화문")
+    assert not store.refresh("광화문")
+
+    # 정보가 바뀌면 재계산 전까지 뷰를 사용하지 않음
+    catalog.record([Restaurant(1, "백반집", rating="4.9")], "광화문")
+    intent = parse_request_intent("광화문 근처 3만원 이하의 한식 맛집을 찾아줘")
+    assert store.lookup(intent) is None
+    assert store.refresh("광화문")
+    assert store.lookup(intent)[0]["name"] == "백반집"
+
+
+def test_stale_views_are_not_served():
+    """오래된 맛집 정보는 뷰에서 제외되는지 테스트"""
+    catalog, store = _store(stale_after_seconds=60)
+    store.refresh("광화문")
+    catalog.execute("UPDATE restaurants SET last_seen = ?", (time.time() - 3600,))
+    catalog.execute("UPDATE area_rankings SET oldest_seen = ?", (time.time() - 3600,))
+
+    intent = parse_request_intent("광화문 한식 맛집")
+    assert store.lookup(intent) is None
+    assert store.refresh("광화문")
+    assert store.lookup(intent) is None
@@ -0,0 +1,91 @@
+"""
+일괄 추천 실행 테스트
+JSONL 요청 읽기, 동시 실행 수 제한, 실패 격리, 결과 기록을 테스트합니다.
+"""
+
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.batch_runner import BatchRunner, load_batch_requests
+from src.restaurant_models import Restaurant
+
+
+class FakeWorker:
+    """요청마다 잠시 대기한 뒤 결과를 반환하는 가짜 추천 시스템 (동시 실행 수 측정)"""
+
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.recommended_restaurants = []
+
+    def run_restaurant_recommendation(self, request):
+        with FakeWorker.lock:
+            FakeWorker.running += 1
+            FakeWorker.peak = max(FakeWorker.peak, FakeWorker.running)
+        try:
+            time.sleep(0.05)
+            if "실패" in request:
+                raise RuntimeError("검색 실패")
+            self.recommended_restaurants = [Restaurant(1, f"{request} 1위")]
+            return f"🍽️ 추천 맛집 리스트\n\n**[1위] {request} 1위**"
+        finally:
+            with FakeWorker.lock:
+                FakeWorker.running -= 1
+
+
+def test_load_batch_requests(tmp_path):
+    """JSONL의 객체/문자열 줄을 읽고, 해석할 수 없는 줄은 오류 항목으로 남기는지 테스트"""
+    path = tmp_path / "requests.jsonl"
+    path.write_text(
+        '{"id": "team-a", "request": "광화문 한식 맛집"}\n'
+        '"강남역 일식 맛집"\n'
+        '\n'
+        '{"id": "team-c"\n'
+        '{"id": "team-d"}\n',
+        encoding="utf-8"
+    )
+    requests = load_batch_requests(str(path))
+    assert [r["id"] for r in requests] == ["team-a", "line-2", "line-4", "line-5"]
+    assert requests[1]["request"] == "강남역 일식 맛집"
+    assert "error" in requests[2] and "error" in requests[3]
+
+
+def test_batch_runs_concurrently_and_isolates_failures(tmp_path):
+    """동시 실행 수를 지키고, 실패한 요청이 있어도 나머지 결과가 모두 기록되는지 테스트"""
+    FakeWorker.running = FakeWorker.peak = 0
+    requests = [{"id": f"team-{i}", "request": f"요청 {i}"} for i in range(8)]
+    requests[3]["request"] = "실패할 요청"
+    requests.append({"id": "line-9", "request": "", "error": "request 항목이 없습니다"})
+    output_file = tmp_path / "results.jsonl"
+    workers = []
+
+    def make_worker():
+        workers.append(FakeWorker())
+        return workers[-1]
+
+    start = time.perf_counter()
+    summary = BatchRunner(make_worker, max_concurrency=3).run(requests, str(output_file))
+    elapsed = time.perf_counter() - start
+
+    assert FakeWorker.peak <= 3
+    assert len(workers) <= 3
+    assert elapsed < 8 * 0.05
+    assert summary["total"] == 9
+    assert summary["succeeded"] == 7
+    assert set(summary["failures"]) == {"team-3", "line-9"}
+    assert "검색 실패" in summary["failures"]["team-3"]
+    assert summary["latency_p95_seconds"] >= 0.05
+
+    records = [json.loads(line) for line in output_file.read_text(encoding="utf-8").splitlines()]
+    assert sorted(r["id"] for r in records) == sorted(r["id"] for r in requests)
+    ok = next(r for r in records if r["id"] == "team-0")
+    assert ok["status"] == "ok"
+    assert ok["restaurants"][0]["name"] == "요청 0 1위"
@@ -0,0 +1,112 @@
+"""
+크루 레지스트리 테스트
+단계 크루를 한 번만 생성해 재사용하는지, 재사용 시 호출별 입력이 섞이지 않는지 테스트합니다.
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# 크루 실행 텔레메트리 전송 끔 (오프라인 테스트 종료 지연 방지)
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from crewai import Agent, Task
+from crewai.llms.base_llm import BaseLLM
+
+from src.crew_registry import CrewRegistry, process_stats
+
+
+class EchoLLM(BaseLLM):
+    """받은 프롬프트의 요청 줄을 최종 답변으로 돌려주는 가짜 LLM"""
+
+    def __init__(self):
+        super().__init__(model="echo")
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            prompt = str(messages)
+            self.prompts.append(prompt)
+            request = prompt.split("요청: ", 1)[1].split("\\n", 1)[0].split("'", 1)[0]
+            return f"Thought: 완료\nFinal Answer: {request}"
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def supports_function_calling(self):
+        return False
+
+    def supports_stop_words(self):
+        return False
+
+    def get_context_window_size(self):
+        return 8192
+
+
+def _stage():
+    llm = EchoLLM()
+    agent = Agent(role="테스트", goal="테스트", backstory="테스트", llm=llm, verbose=False)
+    task = Task(description="요청: {user_request}\n이 요청을 그대로 답하세요.", expected_output="요청", agent=agent)
+    return llm, agent, task
+
+
+def test_stage_crew_is_built_once_and_reused():
+    """같은 단계/작업 구성은 크루를 한 번만 만들고, 작업 구성이 다르면 따로 만드는지 테스트"""
+    _, agent, task = _stage()
+    _, other_agent, other_task = _stage()
+    registry = CrewRegistry(verbose=False)
+    before = process_stats()
+
+    first = registry.get("recommendation", [agent], [task])
+    assert registry.get("recommendation", [agent], [task]) is first
+    assert registry.get("recommendation", [other_agent], [other_task]) is not first
+    assert registry.last_build_seconds > 0
+
+    stats = registry.get_stats()
+    assert stats["crews"] == 2 and stats["builds"] == 2 and stats["reuses"] == 1
+    assert stats["saved_seconds"] > 0
+    assert process_stats()["builds"] == before["builds"] + 2
+
+
+def test_reused_crew_keeps_inputs_isolated():
+    """재사용한 크루에서도 호출마다 그 호출의 입력으로 작업 설명이 채워지는지 테스트"""
+    llm, agent, task = _stage()
+    registry = CrewRegistry(verbose=False)
+    inputs = {"user_request": "광화문 한식"}
+
+    assert registry.kickoff("stage", [agent], [task], inputs).raw == "광화문 한식"
+    assert registry.kickoff("stage", [agent], [task], {"user_request": "강남 일식"}).raw == "강남 일식"
+    assert "광화문 한식" not in llm.prompts[-1]
+    assert inputs == {"user_request": "광화문 한식"}
+    assert registry.get_stats()["builds"] == 1
+
+
+def test_concurrent_kickoffs_of_same_crew_are_serialized():
+    """같은 크루를 여러 스레드에서 실행해도 한 번에 하나씩 실행되고 각자 자기 결과를 받는지 테스트"""
+    llm, agent, task = _stage()
+    registry = CrewRegistry(verbose=False)
+    results = {}
+
+    def run(area):
+        results[area] = registry.kickoff("stage", [agent], [task], {"user_request": area}).raw
+
+    threads = [threading.Thread(target=run, args=(area,)) for area in ("종로", "홍대", "성수")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {"종로": "종로", "홍대": "홍대", "성수": "성수"}
+    assert llm.peak == 1
@@ -0,0 +1,102 @@
+"""
+큐레이션 묶음 처리 테스트
+묶음 프롬프트 생성/응답 분리, 동시 요청 묶음 호출, 분리 실패 시 개별 처리 대체를 테스트합니다.
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.curation_packer import CurationPacker, build_packed_prompt, split_packed_response
+
+
+def _submit_all(packer, count):
+    results = [None] * count
+    barrier = threading.Barrier(count)
+
+    def submit(index):
+        with packer.request():
+            # 모든 요청이 진행 중으로 등록된 뒤 제출 (동시에 리서치를 마친 요청들)
+            barrier.wait()
+            results[index] = packer.submit(f"요청 {index}", f"리서치 {index}")
+
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_prompt_and_split():
+    """공통 지시문은 한 번만 들어가고, 응답은 요청 번호별로 분리되는지 테스트"""
+    jobs = [SimpleNamespace(user_request="종로 한식", research_text="[맛집] A"),
+            SimpleNamespace(user_request="강남 일식", research_text="[맛집] B")]
+    prompt = build_packed_prompt("평가 기준 설명", jobs)
+    assert prompt.count("평가 기준 설명") == 1
+    assert "=== 요청 1 ===" in prompt and "=== 요청 2 ===" in prompt and "강남 일식" in prompt
+
+    response = "서론\n=== 결과 2 ===\n**[1위] B**\n\n=== 결과 1 ===\n**[1위] A**\n=== 결과 3 ===\n범위 밖"
+    assert split_packed_response(response, 2) == {1: "**[1위] A**", 2: "**[1위] B**"}
+    assert split_packed_response("구분 표시 없음", 2) == {}
+
+
+def test_concurrent_jobs_share_one_call():
+    """동시에 제출된 작업들이 LLM 한 번으로 처리되고 각자 자기 결과를 받는지 테스트"""
+    prompts = []
+
+    def call_fn(prompt):
+        prompts.append(prompt)
+        return "\n".join(f"=== 결과 {n} ===\n**[1위] 식당 {n}**" for n in range(1, 4))
+
+    packer = CurationPacker(call_fn, "지시문", max_batch=3, window_seconds=5)
+    results = _submit_all(packer, 3)
+
+    assert len(prompts) == 1
+    assert sorted(results) == ["**[1위] 식당 1**", "**[1위] 식당 2**", "**[1위] 식당 3**"]
+    assert packer.get_stats()["packed_jobs"] == 3
+
+
+def test_fallback_on_missing_section_or_error():
+    """결과가 없거나 검증에 실패한 요청, 호출 오류 시에는 None(개별 처리)을 반환하는지 테스트"""
+    packer = CurationPacker(lambda prompt: "=== 결과 1 ===\n**[1위] 식당**\n=== 결과 2 ===\n형식 오류",
+                            "지시문", max_batch=3, window_seconds=0.05,
+                            validate=lambda text: "[1위]" in text)
+    results = _submit_all(packer, 3)
+    assert sorted(results, key=str) == ["**[1위] 식당**", None, None]
+    assert packer.get_stats()["fallbacks"] == 2
+
+    def failing(prompt):
+        raise RuntimeError("LLM 오류")
+
+    packer = CurationPacker(failing, "지시문", max_batch=2, window_seconds=5)
+    assert _submit_all(packer, 2) == [None, None]
+
+
+def test_single_job_is_not_packed():
+    """함께 묶을 요청이 없으면 기다리지 않고, LLM을 호출하지 않고 None을 반환하는지 테스트"""
+    calls = []
+    packer = CurationPacker(calls.append, "지시문", max_batch=4, window_seconds=5)
+    start = time.perf_counter()
+    with packer.request():
+        assert packer.submit("요청", "리서치") is None
+    assert time.perf_counter() - start < 1
+    assert calls == []
+    assert packer.get_stats()["single_jobs"] == 1
+
+
+def test_waits_for_running_packed_call():
+    """묶음 호출이 오래 걸려도 개별 처리로 넘어가지 않고 묶음 결과를 기다리는지 테스트"""
+
+    def slow_call(prompt):
+        time.sleep(0.3)
+        return "=== 결과 1 ===\n**[1위] 식당 1**\n=== 결과 2 ===\n**[1위] 식당 2**"
+
+    packer = CurationPacker(slow_call, "지시문", max_batch=2, window_seconds=0.01)
+    assert sorted(_submit_all(packer, 2)) == ["**[1위] 식당 1**", "**[1위] 식당 2**"]
+    assert packer.get_stats()["fallbacks"] == 0
@@ -0,0 +1,108 @@
+"""
+큐레이터 점수화 엔진 테스트
+속성 파싱, 예산 필터, 결정적 순위, 대량 후보 처리 속도를 테스트합니다.
+"""
+
+import sys
+import math
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.curator_scoring import (
+    CandidateArrays, CuratorScoringEngine, extract_attributes, parse_price, parse_distance,
+    parse_rating
+)
+from src.research_pipeline import CandidateEnricher
+
+
+def test_parse_attributes():
+    """검색 결과 텍스트에서 평점/가격/거리/리뷰 수를 추출하는지 테스트"""
+    attrs = extract_attributes("깡장집 본점 평점 4.6 (리뷰 1,234개) 1인 1만5천원 광화문역 도보 5분")
+    assert attrs["rating"] == 4.6
+    assert attrs["price"] == 15000
+    assert attrs["distance"] == 400
+    assert attrs["review_count"] == 1234
+
+    assert parse_price("2만~3만원") == 25000
+    assert parse_distance("1.2km") == 1200
+    assert math.isnan(parse_price("가격 정보 없음"))
+
+
+def test_parse_rating_ignores_other_numbers():
+    """리뷰 수나 가격 같은 다른 숫자가 앞에 있어도 평점 숫자를 읽는지 테스트"""
+    assert parse_rating("리뷰 1,234개 평점 4.5") == 4.5
+    assert parse_rating("1인 12,000원 / ★4.3") == 4.3
+    assert parse_rating("방문자리뷰 320 4.1/5") == 4.1
+    assert parse_rating("평점 4점") == 4.0
+    assert parse_rating("4") == 4.0
+    assert math.isnan(parse_rating("리뷰 1,234개"))
+
+
+def test_budget_filter_and_ranking():
+    """예산을 넘는 후보는 제외되고 가중치 순서대로 정렬되는지 테스트"""
+    engine = CuratorScoringEngine(max_recommendations=3)
+    candidates = [
+        {"name": "보통집", "rating": 4.0, "price": 20000, "distance": 500, "review_count": 100},
+        {"name": "비싼집", "rating": 4.9, "price": 80000, "distance": 100, "review_count": 900},
+        {"name": "좋은집", "rating": 4.7, "price": 15000, "distance": 300, "review_count": 500},
+        {"name": "정보없는집"},
+    ]
+
+    ranked = engine.score(candidates, budget=30000)
+    names = [r["name"] for r in ranked]
+    assert "비싼집" not in names
+    assert names[0] == "좋은집"
+    assert [r["rank"] for r in ranked] == [1, 2, 3]
+    assert "[1위] 좋은집" in engine.format_ranking(ranked)
+
+
+def test_ranking_is_deterministic():
+    """동점 후보는 입력 순서를 유지하여 항상 같은 결과를 내는지 테스트"""
+    engine = CuratorScoringEngine(max_recommendations=3)
+    candidates = [{"name": f"식당{i}", "rating": 4.5, "price": 10000} for i in range(6)]
+
+    first = [r["name"] for r in engine.score(candidates)]
+    second = [r["name"] for r in engine.score(candidates)]
+    assert first == second == ["식당0", "식당1", "식당2"]
+
+
+def test_to_candidates_from_enrichment():
+    """후보별 수집 결과가 점수화 입력으로 변환되는지 테스트"""
+    enriched = [
+        {"name": "깡장집", "status": "ok", "snippets": [
+            {"purpose": "reviews", "title": "깡장집", "snippet": "평점 4.5 가격 12,000원", "link": "http://a"}
+        ]},
+        {"name": "느린식당", "status": "timeout", "snippets": []},
+    ]
+    candidates = CandidateEnricher.to_candidates(enriched)
+    assert len(candidates) == 1
+    assert candidates[0]["rating"] == 4.5
+    assert candidates[0]["price"] == 12000
+    assert candidates[0]["link"] == "http://a"
+
+
+def test_rank_large_candidate_set_fast():
+    """1,000개 후보 순위 결정이 충분히 빠른지 테스트"""
+    rng = np.random.default_rng(0)
+    n = 1000
+    arrays = CandidateArrays(
+        rating=rng.uniform(3.0, 5.0, n),
+        price=rng.uniform(5000, 60000, n),
+        distance=rng.uniform(0, 3000, n),
+        review_count=rng.integers(0, 2000, n).astype(np.float64),
+    )
+    engine = CuratorScoringEngine()
+
+    start = time.time()
+    for _ in range(100):
+        selected, _, totals = engine.rank(arrays, budget=30000, top_k=5)
+    elapsed = (time.time() - start) / 100
+
+    assert len(selected) == 5
+    assert np.all(np.diff(totals[selected]) <= 0)
+    assert elapsed < 0.01
@@ -0,0 +1,115 @@
+"""
+맛집 개체 식별 테스트
+변형 표기 이름, 전화번호/주소 일치 병합, 추천 목록 재순위, 처리 시간을 테스트합니다.
+"""
+
+import sys
+import random
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.entity_resolution import EntityResolver, canonical_name, normalize_phone
+from src.research_compactor import ResearchCompactor
+from src.research_pipeline import CandidateEnricher
+from src.restaurant_catalog import RestaurantCatalog
+from src.restaurant_models import Restaurant
+
+
+def test_canonical_name():
+    """공백/기호/지점 표기가 달라도 같은 비교용 이름이 되는지 테스트"""
+    assert canonical_name("오빠닭 광화문점") == canonical_name("오빠닭(광화문)")
+    assert canonical_name("깡장집 본점") == "깡장집"
+    # 이름 자체가 '점'으로 끝나는 짧은 이름은 유지
+    assert canonical_name("본점") == "본점"
+    assert normalize_phone("전화 02-123-4567") == "021234567"
+    assert normalize_phone("대표번호 1588-1234") is None
+
+
+def test_dedupe_variant_names():
+    """같은 맛집의 변형 표기만 합치고 다른 지점은 유지하는지 테스트"""
+    resolver = EntityResolver()
+    names = ["오빠닭 광화문점", "깡장집", "오빠닭(광화문)", "오빠닭 광화문", "깡장집 본점", "오빠닭 강남점", "청계 국밥"]
+    assert resolver.dedupe_names(names) == ["오빠닭 광화문점", "깡장집", "오빠닭 강남점", "청계 국밥"]
+
+
+def test_phone_and_address_matches():
+    """이름이 달라도 전화번호가 같거나, 주소가 같고 이름이 비슷하면 합치는지 테스트"""
+    resolver = EntityResolver()
+    records = [
+        {"name": "광화문 한우마을", "phone": "02-737-1234"},
+        {"name": "한우마을 본관", "details": "전화 02.737.1234 영업중"},
+        {"name": "깡장집", "address": "서울특별시 종로구 새문안로5길 13 2층"},
+        {"name": "깡장집 새문안로", "address": "서울 종로구 새문안로5길 13"},
+        {"name": "스타벅스", "address": "서울 종로구 새문안로5길 13"},
+    ]
+    assert resolver.clusters(records) == [[0, 1], [2, 3], [4]]
+
+
+def test_merge_duplicate_enrichment():
+    """다른 이름으로 수집된 같은 맛집의 검색 결과가 하나로 합쳐지는지 테스트"""
+    enriched = [
+        {"name": "오빠닭 광화문점", "status": "ok", "elapsed": 0.1, "snippets": [
+            {"purpose": "rating", "title": "오빠닭 광화문점 리뷰", "snippet": "평점 4.3 02-733-0000", "link": "a"}]},
+        {"name": "광화문 오빠닭", "status": "ok", "elapsed": 0.2, "snippets": [
+            {"purpose": "menu", "title": "광화문 오빠닭 메뉴", "snippet": "순살 18,000원 02-733-0000", "link": "b"}]},
+        # 목록 페이지에 다른 맛집 전화번호가 있어도 합치지 않음
+        {"name": "청계 국밥", "status": "ok", "elapsed": 0.1, "snippets": [
+            {"purpose": "rating", "title": "광화문 맛집 모음", "snippet": "오빠닭 02-733-0000", "link": "c"}]},
+    ]
+    merged = CandidateEnricher.merge_duplicates(enriched, EntityResolver())
+
+    assert [c["name"] for c in merged] == ["오빠닭 광화문점", "청계 국밥"]
+    assert merged[0]["aliases"] == ["광화문 오빠닭"]
+    assert [s["link"] for s in merged[0]["snippets"]] == ["a", "b"]
+
+
+def test_compactor_merges_variant_candidates():
+    """압축 단계에서 변형 표기 후보의 사실이 하나로 합쳐지는지 테스트"""
+    text = """### 1. **오빠닭 광화문점**
+- 평점: 4.3
+
+### 2. **오빠닭(광화문)**
+- 가격대: 18,000원
+"""
+    compacted, stats = ResearchCompactor(resolver=EntityResolver()).compact(text)
+    assert stats["candidates"] == 1
+    assert "## 오빠닭 광화문점" in compacted
+    assert "18,000원" in compacted
+
+
+def test_dedupe_restaurants_reranks():
+    """추천 목록의 중복을 합치고 빈 정보를 보완한 뒤 순위를 다시 매기는지 테스트"""
+    restaurants = [
+        Restaurant(2, "오빠닭(광화문)", phone="02-733-0000"),
+        Restaurant(1, "오빠닭 광화문점", rating="4.3"),
+        Restaurant(3, "청계 국밥", rating="4.1"),
+    ]
+    deduped = EntityResolver().dedupe_restaurants(restaurants)
+    assert [(r.rank, r.name) for r in deduped] == [(1, "오빠닭 광화문점"), (2, "청계 국밥")]
+    assert deduped[0].phone == "02-733-0000"
+
+
+def test_catalog_keys_variant_names_together():
+    """카탈로그가 변형 표기를 같은 맛집으로 저장하는지 테스트"""
+    catalog = RestaurantCatalog()
+    catalog.record([Restaurant(1, "오빠닭 광화문점", rating="4.3")], "광화문")
+    catalog.record([Restaurant(1, "오빠닭(광화문)", phone="02-733-0000")], "광화문")
+    assert catalog.get_stats()["entries"] == 1
+    assert catalog.find("오빠닭 광화문", "광화문")["phone"] == "02-733-0000"
+
+
+def test_clusters_scale_linearly():
+    """후보 수가 늘어도 전체 쌍 비교 없이 처리되는지 테스트"""
+    rng = random.Random(3)
+
+    def records(n):
+        return [{"name": "".join(chr(0xAC00 + rng.randrange(400)) for _ in range(5))} for _ in range(n)]
+
+    start = time.perf_counter()
+    groups = EntityResolver().clusters(records(5000))
+    # 전체 쌍 비교(약 1,250만 쌍)라면 수십 초가 걸리는 규모
+    assert time.perf_counter() - start < 3.0
+    assert len(groups) > 4900
@@ -0,0 +1,86 @@
+"""
+필드별 메모 테스트
+필드마다 다른 유효 기간, 만료된 필드만 다시 검색하는 동작을 테스트합니다.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.field_memo import FieldMemo
+from src.research_pipeline import CandidateEnricher
+
+
+class RecordingSearch:
+    """검색어를 기록하는 가짜 검색 함수"""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, query):
+        self.queries.append(query)
+        return {"organic": [{"title": f"{query} 결과", "snippet": "평점 4.5 가격 9,000원", "link": "http://x"}]}
+
+
+def test_memo_ttls_per_field(tmp_path):
+    """필드마다 다른 유효 기간이 적용되고 파일에 유지되는지 테스트"""
+    db_file = str(tmp_path / "memo.db")
+    memo = FieldMemo(ttls={"rating": 60}, db_file=db_file)
+    memo.store("깡장집 본점", "광화문", ["address", "rating"], [{"snippet": "주소"}])
+
+    assert set(memo.lookup("깡장집", "광화문")) == {"address", "rating"}
+    memo._execute("UPDATE field_memo SET fetched_at = ?", (time.time() - 3600,))
+    reopened = FieldMemo(ttls={"rating": 60}, db_file=db_file)
+    assert set(reopened.lookup("깡장집 본점", "광화문")) == {"address"}
+    assert reopened.lookup("깡장집 본점", "강남역") == {}
+
+
+def test_enricher_refetches_only_expired_fields():
+    """알고 있는 맛집은 만료된 필드만 검색하는지 테스트"""
+    memo = FieldMemo(ttls={"rating": 60, "reviews": 60})
+    search = RecordingSearch()
+    enricher = CandidateEnricher(memo=memo)
+
+    first = enricher.enrich(["깡장집"], search, area="광화문")[0]
+    assert search.queries == ["광화문 깡장집 주소 전화번호 영업시간", "깡장집 광화문 메뉴 가격 평점 리뷰"]
+    assert first["memo_fields"] == [] and first["searches_saved"] == 0
+
+    # 모든 필드가 유효하면 검색 없이 같은 결과
+    second = enricher.enrich(["깡장집"], search, area="광화문")[0]
+    assert len(search.queries) == 2
+    assert second["searches_saved"] == 2
+    assert second["snippets"] == first["snippets"]
+
+    # 평점/리뷰만 만료되면 해당 필드만 다시 검색
+    memo._execute("UPDATE field_memo SET fetched_at = ? WHERE field IN ('rating', 'reviews')",
+                  (time.time() - 3600,))
+    third = enricher.enrich(["깡장집"], search, area="광화문")[0]
+    assert search.queries[2:] == ["깡장집 광화문 평점 리뷰"]
+    assert third["searches_saved"] == 1
+    assert set(third["memo_fields"]) == {"address", "phone", "hours", "menu", "price"}
+    assert len(third["snippets"]) == 3
+
+
+def test_empty_results_are_not_memoized():
+    """검색 결과가 없으면 메모하지 않아 다음 실행에서 다시 검색하는지 테스트"""
+    memo = FieldMemo()
+    enricher = CandidateEnricher(memo=memo)
+    enricher.enrich(["없는집"], lambda query: {"organic": []}, area="광화문")
+    assert memo.lookup("없는집", "광화문") == {}
+
+
+def test_memo_is_shared_across_search_topics():
+    """검색 주제(음식 종류/키워드)가 달라도 같은 지역의 맛집 메모를 재사용하는지 테스트"""
+    memo = FieldMemo()
+    search = RecordingSearch()
+    enricher = CandidateEnricher(memo=memo)
+
+    enricher.enrich(["깡장집"], search, area="시청역 한식", memo_area="시청")
+    reused = enricher.enrich(["깡장집"], search, area="시청 한식 파스타", memo_area="시청")[0]
+    assert len(search.queries) == 2
+    assert search.queries[0].startswith("시청역 한식 깡장집")
+    assert reused["searches_saved"] == 2
+    assert memo.lookup("깡장집", "시청역 한식") == {}
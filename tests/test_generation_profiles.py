@@ -0,0 +1,55 @@
+"""
+에이전트별 생성 프로필 테스트
+system_settings 기본값과 프로필 설정 병합, 프로필 선택, LLM 생성을 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.generation_profiles import GenerationProfiles, DEFAULT_PROFILES, AGENT_NAMES
+
+
+def test_profile_overrides_system_defaults():
+    """프로필 값이 system_settings보다 우선하고, 없는 값은 system_settings를 사용하는지 테스트"""
+    profiles = GenerationProfiles.from_config(
+        {"profile": "short", "profiles": {
+            "short": {"email_sender": {"max_tokens": 300, "stop": ["\n\n\n"]}},
+            "long": {"email_sender": {"max_tokens": 2000, "temperature": 0.9}},
+        }},
+        {"temperature": 0.7, "max_tokens": 2000, "timeout": 30, "llm_model": "gemini-2.0-flash"}
+    )
+    assert profiles.settings_for("email_sender") == {"temperature": 0.7, "max_tokens": 300, "timeout": 30,
+                                                     "stop": ["\n\n\n"]}
+    assert profiles.settings_for("email_sender", "long")["temperature"] == 0.9
+    # 프로필에 없는 에이전트는 system_settings 값
+    assert profiles.settings_for("curator") == {"temperature": 0.7, "max_tokens": 2000, "timeout": 30}
+
+
+def test_default_profiles_and_unknown_profile():
+    """기본 프로필은 system_settings를 그대로 사용하고, 없는 프로필 이름은 오류를 내는지 테스트"""
+    system_settings = {"temperature": 0.7, "max_tokens": 2000, "timeout": 30}
+    profiles = GenerationProfiles.from_config({}, system_settings)
+    assert profiles.active_profile == "balanced"
+    for agent_name in AGENT_NAMES:
+        assert profiles.settings_for(agent_name) == system_settings
+    assert profiles.settings_for("email_sender", "short")["max_tokens"] == DEFAULT_PROFILES["short"]["email_sender"]["max_tokens"]
+
+    # 설정에 short만 있어도 balanced(기준)는 사용 가능
+    profiles = GenerationProfiles.from_config({"profile": "short", "profiles": {"short": {}}}, system_settings)
+    assert profiles.settings_for("curator", "balanced") == system_settings
+
+    with pytest.raises(ValueError):
+        GenerationProfiles.from_config({"profile": "없는 프로필"})
+
+
+def test_build_llm_applies_settings():
+    """에이전트별 LLM 객체에 최대 출력 토큰, temperature, stop이 적용되는지 테스트"""
+    llm = GenerationProfiles().build_llm("gemini/gemini-2.0-flash", "email_sender", "short")
+    assert llm.max_tokens == 300
+    assert llm.temperature == 0.5
+    assert llm.stop == ["\n\n\n"]
@@ -0,0 +1,154 @@
+"""
+위치 인덱스 테스트
+geohash, 지오코딩 캐시, 반경 질의, 거리 조건 파싱을 테스트합니다.
+"""
+
+import sys
+import math
+import random
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.geo_index import (
+    GeoIndex, GeocodeCache, StaticGeocoder, DistanceResolver, LANDMARKS,
+    geohash_encode, haversine_m, normalize_address
+)
+from src.request_intent import parse_request_intent
+from src.restaurant_catalog import RestaurantCatalog
+from src.restaurant_models import Restaurant
+
+GWANGHWAMUN = LANDMARKS["광화문역"]
+ADDRESSES = {
+    "서울 종로구 세종대로 175": (37.5720, 126.9769),   # 약 110m
+    "서울 종로구 종로 33": (37.5703, 126.9810),        # 약 380m
+    "서울 중구 세종대로 110": (37.5663, 126.9779),     # 약 530m
+    "서울 마포구 양화로 160": (37.5572, 126.9245),     # 약 4.9km
+}
+
+
+def test_geohash_known_value():
+    """알려진 좌표의 geohash 값 테스트"""
+    assert geohash_encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+
+def test_normalize_address():
+    """시/도 표기, 층수, 괄호 설명이 달라도 같은 키가 되는지 테스트"""
+    assert normalize_address("서울특별시 종로구 세종대로 175 (세종로) 2층") == "서울 종로구 세종대로 175"
+    assert normalize_address("서울 종로구  세종대로 175") == "서울 종로구 세종대로 175"
+
+
+class CountingGeocoder:
+    """등록한 주소만 변환하고 호출 수를 세는 네트워크 지오코더 대용"""
+
+    def __init__(self, name, coordinates):
+        self.name = name
+        self.coordinates = coordinates
+        self.calls = 0
+
+    def geocode(self, address):
+        self.calls += 1
+        return self.coordinates.get(address)
+
+
+def test_geocode_cache_persists_and_caches_failures(tmp_path):
+    """지오코딩 결과와 실패가 저장되어 백엔드를 다시 호출하지 않는지 테스트"""
+    db_file = str(tmp_path / "geocode.db")
+    backend = CountingGeocoder("kakao", ADDRESSES)
+    cache = GeocodeCache(backend=backend, db_file=db_file)
+
+    assert cache.geocode("서울특별시 종로구 세종대로 175 2층") == ADDRESSES["서울 종로구 세종대로 175"]
+    assert cache.geocode("서울 어딘가 없는길 1") is None
+    assert backend.calls == 2
+
+    reopened = GeocodeCache(backend=backend, db_file=db_file)
+    assert reopened.geocode("서울 종로구 세종대로 175") == ADDRESSES["서울 종로구 세종대로 175"]
+    assert reopened.geocode("서울 어딘가 없는길 1") is None
+    assert backend.calls == 2
+
+
+def test_geocode_failures_are_per_backend(tmp_path):
+    """정적 지오코더의 실패는 저장하지 않고, 다른 백엔드의 실패 기록은 사용하지 않는지 테스트"""
+    db_file = str(tmp_path / "geocode.db")
+    static = GeocodeCache(backend=StaticGeocoder(), db_file=db_file)
+    assert static.geocode("서울 중구 명동길 14") is None
+    other = CountingGeocoder("other", {})
+    assert GeocodeCache(backend=other, db_file=db_file).geocode("서울 중구 명동길 14") is None
+
+    kakao = CountingGeocoder("kakao", {"서울 중구 명동길 14": (37.56, 126.98)})
+    cache = GeocodeCache(backend=kakao, db_file=db_file)
+    assert cache.geocode("서울 중구 명동길 14") == (37.56, 126.98)
+    assert kakao.calls == 1
+    # 찾은 좌표는 백엔드와 관계없이 공유
+    assert GeocodeCache(backend=StaticGeocoder(), db_file=db_file).geocode("서울 중구 명동길 14") == (37.56, 126.98)
+
+
+def test_radius_query_matches_brute_force():
+    """geohash 반경 질의가 전체 거리 계산 결과와 같은지 테스트"""
+    rng = random.Random(7)
+    index = GeoIndex()
+    points = {}
+    for i in range(2000):
+        lat = GWANGHWAMUN[0] + rng.uniform(-0.03, 0.03)
+        lng = GWANGHWAMUN[1] + rng.uniform(-0.03, 0.03)
+        points[str(i)] = (lat, lng)
+        index.add(str(i), lat, lng)
+
+    for radius in (100, 500, 1500):
+        expected = sorted(key for key, (lat, lng) in points.items()
+                          if haversine_m(*GWANGHWAMUN, lat, lng) <= radius)
+        found = index.within(*GWANGHWAMUN, radius)
+        assert sorted(key for key, _ in found) == expected
+        assert [d for _, d in found] == sorted(d for _, d in found)
+
+    start = time.perf_counter()
+    for _ in range(100):
+        index.within(*GWANGHWAMUN, 500)
+    assert (time.perf_counter() - start) / 100 < 0.01
+
+
+def test_parse_radius_condition():
+    """요청의 거리 조건이 파싱되고 키워드로 남지 않는지 테스트"""
+    intent = parse_request_intent("광화문역 500m 이내 한식 맛집")
+    assert intent.radius_m == 500
+    assert intent.keywords == ()
+    assert parse_request_intent("강남역 1.5km 안 일식").radius_m == 1500
+    assert parse_request_intent("광화문역 도보 5분 거리 한식").radius_m == 400
+    assert parse_request_intent("광화문 한식").radius_m is None
+    assert intent.guard_key() != parse_request_intent("광화문역 한식 맛집").guard_key()
+
+
+def test_annotate_distances_and_radius():
+    """후보 주소로 거리를 계산하고 반경 밖 후보를 제외하는지 테스트"""
+    resolver = DistanceResolver(GeocodeCache(backend=StaticGeocoder(ADDRESSES)))
+    candidates = [
+        {"name": "가까운 집", "details": "주소 서울 종로구 세종대로 175 / 평점 4.5"},
+        {"name": "먼 집", "address": "서울 마포구 양화로 160"},
+        {"name": "주소 없는 집", "details": "평점 4.0", "distance": math.nan},
+    ]
+    origin = resolver.origin("광화문역")
+
+    annotated, rejected = resolver.annotate(candidates, origin)
+    assert rejected == []
+    assert 80 < annotated[0]["distance"] < 150
+    assert annotated[1]["distance"] > 4000
+    assert math.isnan(annotated[2]["distance"])
+
+    kept, rejected = resolver.annotate(candidates, origin, radius_m=500)
+    assert [c["name"] for c in kept] == ["가까운 집", "주소 없는 집"]
+    assert rejected == ["먼 집"]
+
+
+def test_catalog_radius_filter():
+    """카탈로그 좌표 인덱스로 반경 안 맛집만 남기는지 테스트"""
+    catalog = RestaurantCatalog()
+    catalog.record([Restaurant(i, name, address=address)
+                    for i, (name, address) in enumerate(zip(("A", "B", "C", "D"), ADDRESSES), 1)], "광화문")
+    resolver = DistanceResolver(GeocodeCache(backend=StaticGeocoder(ADDRESSES)))
+
+    entries = catalog.area_entries("광화문")
+    nearby = resolver.filter_entries(catalog, "광화문", entries, GWANGHWAMUN, 500)
+    assert sorted(e["name"] for e in nearby) == ["A", "B"]
+    assert "거리" in RestaurantCatalog.format_entries(nearby)
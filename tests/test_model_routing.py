@@ -0,0 +1,66 @@
+"""
+에이전트별 모델 라우팅 테스트
+모델 이름 변환, 계획별 에이전트 모델 선택, 잘못된 계획 처리를 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.generation_profiles import AGENT_NAMES, GenerationProfiles
+from src.model_routing import ModelRouter, model_string
+
+TIERED = {
+    "communicator": "gemini-2.0-flash-lite",
+    "form_creator": "gemini-2.0-flash-lite",
+    "email_sender": "gemini/gemini-1.5-flash-8b",
+}
+
+
+def test_model_string():
+    """gemini 모델에만 접두사를 붙이고, 이미 접두사가 있으면 그대로 두는지 테스트"""
+    assert model_string("gemini", "gemini-2.0-flash") == "gemini/gemini-2.0-flash"
+    assert model_string("gemini", "gemini/gemini-2.0-flash") == "gemini/gemini-2.0-flash"
+    assert model_string("openai", "gpt-4o-mini") == "gpt-4o-mini"
+    # 기본 제공자가 gemini여도 다른 제공자의 모델에는 접두사를 붙이지 않음
+    assert model_string("gemini", "gpt-4o-mini") == "gpt-4o-mini"
+    assert model_string("gemini", "openai/gpt-4o-mini") == "openai/gpt-4o-mini"
+
+
+def test_tiered_plan_routes_simple_agents():
+    """계획에 지정된 에이전트만 가벼운 모델을 사용하고, 나머지는 기본 모델을 사용하는지 테스트"""
+    router = ModelRouter.from_config({"plan": "tiered", "plans": {"tiered": TIERED}},
+                                     {"llm_provider": "gemini", "llm_model": "gemini-2.0-flash"})
+    assert router.model_for("communicator") == "gemini/gemini-2.0-flash-lite"
+    assert router.model_for("email_sender") == "gemini/gemini-1.5-flash-8b"
+    assert router.model_for("researcher") == "gemini/gemini-2.0-flash"
+    # 다른 계획 지정 (single은 항상 있음)
+    assert router.model_for("communicator", "single") == "gemini/gemini-2.0-flash"
+    assert set(router.describe()) == set(AGENT_NAMES)
+
+    router.select("single")
+    assert set(router.describe().values()) == {"gemini/gemini-2.0-flash"}
+
+
+def test_default_and_invalid_plans():
+    """설정이 없으면 모든 에이전트가 기본 모델을 쓰고, 잘못된 계획은 오류를 내는지 테스트"""
+    router = ModelRouter.from_config({}, {"llm_provider": "openai", "llm_model": "gpt-4o"})
+    assert router.active_plan == "single"
+    assert router.model_for("curator") == "gpt-4o"
+
+    with pytest.raises(ValueError):
+        router.select("없는 계획")
+    with pytest.raises(ValueError):
+        ModelRouter("gpt-4o", plans={"typo": {"comunicator": "gpt-4o-mini"}}, active_plan="typo")
+
+
+def test_routed_model_with_generation_profile():
+    """라우팅된 모델에도 에이전트 생성 프로필이 함께 적용되는지 테스트"""
+    router = ModelRouter("gemini/gemini-2.0-flash", plans={"tiered": TIERED}, active_plan="tiered")
+    llm = GenerationProfiles().build_llm(router.model_for("email_sender"), "email_sender", "short")
+    assert llm.model == "gemini/gemini-1.5-flash-8b"
+    assert llm.max_tokens == 300
@@ -0,0 +1,66 @@
+"""
+맛집 추천 결과 캐시 테스트
+요청 정규화, LRU 제거, TTL 만료, 디스크 저장을 테스트합니다.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.recommendation_cache import RecommendationCache, normalize_request
+
+
+def test_normalize_request_folds_variants():
+    """공백, 조사, 금액 표기 차이가 같은 키로 정규화되는지 테스트"""
+    a = normalize_request("광화문 근처 3만원 이하의 한식 맛집을 찾아줘")
+    b = normalize_request("광화문  근처 30,000원 이하 한식 맛집 추천해줘")
+    c = normalize_request("광화문 근처 3만 원 이하의 한식 맛집을 찾아줘!")
+    assert a == b == c
+    assert "30000원" in a
+
+
+def test_cache_hit_and_miss():
+    """캐시 적중/미적중 통계 테스트"""
+    cache = RecommendationCache(max_entries=10, ttl_seconds=60)
+    assert cache.get("광화문 한식") is None
+    cache.put("광화문 한식", "추천 결과")
+    assert cache.get("광화문 한식을") == "추천 결과"
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_lru_eviction():
+    """최대 항목 수 초과 시 가장 오래 사용되지 않은 항목이 제거되는지 테스트"""
+    cache = RecommendationCache(max_entries=2, ttl_seconds=60)
+    cache.put("광화문 한식", "A")
+    cache.put("강남역 일식", "B")
+    cache.get("광화문 한식")
+    cache.put("홍대 치킨", "C")
+
+    assert cache.get("강남역 일식") is None
+    assert cache.get("광화문 한식") == "A"
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_ttl_expiration():
+    """TTL이 지난 항목이 만료되는지 테스트"""
+    cache = RecommendationCache(max_entries=10, ttl_seconds=0.01)
+    cache.put("광화문 한식", "A")
+    time.sleep(0.02)
+    assert cache.get("광화문 한식") is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+def test_disk_persistence(tmp_path):
+    """디스크에 저장된 캐시가 다시 로딩되는지 테스트"""
+    cache_file = tmp_path / "recommendation_cache.json"
+    cache = RecommendationCache(max_entries=10, ttl_seconds=60, cache_file=str(cache_file))
+    cache.put("광화문 한식", "A")
+
+    reloaded = RecommendationCache(max_entries=10, ttl_seconds=60, cache_file=str(cache_file))
+    assert reloaded.get("광화문 한식") == "A"
@@ -0,0 +1,67 @@
+"""
+추천 결과 스트리밍 테스트
+이벤트 버스 청크 중 지정한 작업의 최종 답변만 전달되는지, 반복자/콜백 동작을 테스트합니다.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from crewai import Agent, Task
+from crewai.events import crewai_event_bus, LLMCallStartedEvent, LLMStreamChunkEvent
+
+from src.recommendation_stream import StreamRelay, TokenStream
+
+
+def _task(description: str) -> Task:
+    agent = Agent(role="테스트", goal="테스트", backstory="테스트", llm="gpt-4o-mini")
+    return Task(description=description, expected_output="결과", agent=agent)
+
+
+def _emit(task: Task, *chunks: str):
+    crewai_event_bus.emit(None, LLMCallStartedEvent(messages="", from_task=task))
+    for chunk in chunks:
+        crewai_event_bus.emit(None, LLMStreamChunkEvent(chunk=chunk, from_task=task))
+
+
+def test_relay_forwards_final_answer_of_watched_task():
+    """지정한 작업의 최종 답변 부분만, 재호출 시 처음부터 다시 전달되는지 테스트"""
+    final_task, other_task = _task("최종 단계"), _task("이전 단계")
+    received = []
+
+    with StreamRelay(received.append) as relay:
+        relay.watch([final_task])
+        _emit(other_task, "Thought: 조사\nFinal Answer: 무시")
+        _emit(final_task, "Thought: 정리합니다\nFinal ", "Answer: **[1위] ", "깡장집**", "\n⭐ 평점: 4.2")
+        _emit(final_task, "Thought: 다시\nFinal Answer:", " 두 번째")
+    _emit(final_task, "Final Answer: 종료 후")
+
+    assert received == ["**[1위] ", "깡장집**", "\n⭐ 평점: 4.2", "두 번째"]
+
+
+def test_token_stream_iterator_and_callback():
+    """콜백과 반복자로 같은 토큰이 전달되고 최종 결과/오류가 기록되는지 테스트"""
+    printed = []
+    stream = TokenStream(printed.append)
+
+    def produce():
+        for token in ("깡장집", " 본점"):
+            stream.push(token)
+        stream.close(result="보고서")
+
+    threading.Thread(target=produce).start()
+    assert list(stream) == ["깡장집", " 본점"]
+    assert printed == ["깡장집", " 본점"]
+    assert stream.result == "보고서"
+    assert stream.time_to_first_token is not None
+
+    failed = TokenStream()
+    failed.close(error=RuntimeError("실패"))
+    try:
+        list(failed)
+        assert False, "오류가 다시 발생해야 합니다"
+    except RuntimeError:
+        pass
@@ -0,0 +1,134 @@
+"""
+추천 보고서 템플릿 렌더러 테스트
+큐레이션 결과의 보고서 변환과 추천 이유가 없을 때의 LLM 대체를 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.report_renderer import ReportRenderer, build_summary
+from src.request_intent import parse_request_intent
+from src.restaurant_models import parse_recommendation_markdown, render_recommendations, restaurants_from_output
+
+CURATION_OUTPUT = """평가 결과 상위 2개 맛집을 선별했습니다.
+
+### 1. **깡장집 본점** - 한식
+- 점수: 92점
+- 주소: 서울 종로구 새문안로5길 13
+- 평점: 4.2
+- 가격대: 9,000원
+- 추천 이유: 합리적인 가격에 반찬이 푸짐하고 광화문역에서 가깝습니다.
+- 약점: 점심시간 대기
+
+### 2. **한우마을**
+- 평점: 4.8
+- 가격대: 45,000원
+- 추천 이유: 평점이 가장 높아 특별한 날 방문하기 좋습니다.
+"""
+
+
+def test_render_curation_output():
+    """큐레이션 결과가 순위와 항목이 채워진 보고서로 변환되는지 테스트"""
+    intent = parse_request_intent("광화문 근처 5만원 이하 한식 맛집")
+    output = ReportRenderer().to_output(CURATION_OUTPUT, intent)
+
+    restaurants = restaurants_from_output(output)
+    assert [(r.rank, r.name) for r in restaurants] == [(1, "깡장집 본점"), (2, "한우마을")]
+    assert restaurants[0].address == "서울 종로구 새문안로5길 13"
+    assert restaurants[0].price == "9,000원"
+    assert restaurants[1].reason.startswith("평점이 가장 높아")
+    assert output.summary == "광화문 한식 1인 50,000원 이하 맛집 2곳을 추천 순위대로 정리했습니다."
+
+    # 기존 보고서 형식으로 출력되고 다시 읽을 수 있어야 함
+    report = render_recommendations(restaurants, output.summary)
+    assert report.startswith("🍽️ 추천 맛집 리스트")
+    assert "**[1위] 깡장집 본점**" in report
+    assert "📍 주소: 서울 종로구 새문안로5길 13" in report
+    assert [r.name for r in parse_recommendation_markdown(report)] == ["깡장집 본점", "한우마을"]
+
+
+def test_scoring_engine_ranking_headers():
+    """점수화 엔진 순위 줄의 총점 표기가 이름에서 제거되는지 테스트"""
+    text = """[1위] 깡장집 본점 (총점 0.812 / 평점 0.90, 가격 0.80, 거리 0.50, 리뷰 0.60)
+- 평점: 4.2
+- 추천 이유: 가격 대비 만족도가 높습니다."""
+    output = ReportRenderer().to_output(text)
+    assert output.restaurants[0].name == "깡장집 본점"
+    assert output.summary == build_summary(None, 1)
+
+
+def test_missing_reason_falls_back():
+    """추천 이유가 없는 맛집이 있거나 맛집을 찾지 못하면 None을 반환하는지 테스트"""
+    renderer = ReportRenderer()
+    without_reason = CURATION_OUTPUT.replace("- 추천 이유: 평점이 가장 높아 특별한 날 방문하기 좋습니다.\n", "")
+    assert renderer.to_output(without_reason) is None
+    assert renderer.to_output("추천할 맛집이 없습니다.") is None
+    assert renderer.get_stats() == {"rendered": 0, "fallbacks": 2}
+
+
+def test_limits_to_max_recommendations():
+    """최대 추천 개수까지만 렌더링하는지 테스트"""
+    output = ReportRenderer(max_recommendations=1).to_output(CURATION_OUTPUT)
+    assert [item.name for item in output.restaurants] == ["깡장집 본점"]
+
+
+def test_render_numbered_llm_output():
+    """번호가 붙은 제목, 굵은 라벨, 붙여 쓴 '추천이유' 등 실제 LLM 출력 형식을 렌더링하는지 테스트"""
+    text = """## 최종 추천 맛집
+
+**1. 토속촌 (총점 88점)**
+- **평점**: 4.5
+- **가격**: 1인 20,000원
+- **추천이유**: 진한 국물의 삼계탕으로 평점이 가장 높습니다.
+
+### 2. 청진옥
+* 평점: 4.3
+* **추천 이유:** 해장국이 유명하고 가격이 합리적입니다.
+"""
+    output = ReportRenderer().to_output(text)
+    assert output is not None
+    assert [(r.rank, r.name) for r in output.restaurants] == [(1, "토속촌"), (2, "청진옥")]
+    assert output.restaurants[0].reason.startswith("진한 국물")
+    assert output.restaurants[1].reason == "해장국이 유명하고 가격이 합리적입니다."
+    assert "[1위] 토속촌" in render_recommendations(restaurants_from_output(output), output.summary)
+
+
+def test_curation_output_format_is_renderable():
+    """큐레이션 작업에 지시한 출력 형식 그대로 작성한 결과가 렌더링되는지 테스트"""
+    from src.report_renderer import CURATION_OUTPUT_FORMAT
+
+    example = "\n".join(line.strip() for line in CURATION_OUTPUT_FORMAT.splitlines())
+    example = example.replace("## 맛집 이름", "## 깡장집 본점")
+    output = ReportRenderer().to_output(example)
+    assert [r.name for r in output.restaurants] == ["깡장집 본점"]
+
+
+def test_ranking_hit_does_not_render_previous_curation():
+    """지역별 순위 뷰 적중 시 이전 요청의 큐레이션 결과가 아닌 이번 순위로 보고서를 만드는지 테스트"""
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    from src.advanced_restaurant_system import AdvancedRestaurantSystem
+
+    system = AdvancedRestaurantSystem.__new__(AdvancedRestaurantSystem)
+    system.research_settings = {"mode": "agent"}
+    system.curation_settings = {"mode": "llm"}
+    system.area_rankings = SimpleNamespace(lookup=lambda intent: [{"name": "깡장집 본점"}],
+                                           format_ranking=lambda ranking: CURATION_OUTPUT)
+    system.report_renderer = ReportRenderer()
+    system.logger = MagicMock()
+    system.communicator = object()
+    system.communication_task = object()
+    system.communication_with_curation_task = object()
+    system._stream_relay = None
+    # 앞선 LLM 큐레이션 요청(강남역 일식)의 큐레이션 작업 콜백이 남긴 결과
+    system._last_curation_output = CURATION_OUTPUT.replace("깡장집 본점", "강남 스시집")
+
+    inputs = {}
+    request = "광화문 근처 5만원 이하 한식 맛집"
+    agents, tasks = system._prepare_recommendation_pipeline(request, inputs)
+    output = system._kickoff_recommendation(agents, tasks, inputs, parse_request_intent(request))
+    assert [r.name for r in output.restaurants] == ["깡장집 본점", "한우마을"]
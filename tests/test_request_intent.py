@@ -0,0 +1,94 @@
+"""
+요청 의도 파서 테스트
+금액/지역 별칭/음식 종류 추출과 캐시 키, 후보 사전 필터링을 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.request_intent import parse_request_intent, intent_cache_key
+from src.recommendation_cache import RecommendationCache
+
+
+def test_parse_area_budget_cuisine():
+    """지역, 예산, 음식 종류를 추출하는지 테스트"""
+    intent = parse_request_intent("강남역 주변 2만원 이하의 일식 맛집")
+    assert intent.area == "강남역"
+    assert intent.cuisines == ("일식",)
+    assert intent.budget_max == 20000
+    assert intent.budget_min is None
+
+    assert parse_request_intent("9,000원 이하 점심").budget == 9000
+    assert parse_request_intent("1만원 이하 분식").budget == 10000
+
+    ranged = parse_request_intent("을지로 2만~3만원 파스타")
+    assert ranged.area == "을지로"
+    assert (ranged.budget_min, ranged.budget_max) == (20000, 30000)
+    assert ranged.cuisines == ("양식",)
+    assert ranged.keywords == ("파스타",)
+
+
+def test_area_aliases_share_cache_key():
+    """광화문/시청/종각 별칭과 금액 표기 차이가 같은 키가 되는지 테스트"""
+    keys = {
+        parse_request_intent(request).cache_key()
+        for request in [
+            "광화문 근처 3만원 이하의 한식 맛집을 찾아줘",
+            "시청역 근처 30,000원 이하 한식 맛집 추천해줘",
+            "종각 3만 원 이내 한식당",
+        ]
+    }
+    assert len(keys) == 1
+    assert parse_request_intent("광화문 한식 2만원 이하").cache_key() not in keys
+    assert parse_request_intent("광화문 3만원 이하 일식").cache_key() not in keys
+
+    # 검색어용 주제는 사용자가 쓴 지역 표기를 유지
+    assert parse_request_intent("시청역 한식").topic() == "시청역 한식"
+
+
+def test_recommendation_cache_with_intent_key():
+    """추천 캐시가 의도 기반 키로 별칭 요청을 공유하는지 테스트"""
+    cache = RecommendationCache(max_entries=10, ttl_seconds=60, key_fn=intent_cache_key)
+    cache.put("광화문 근처 3만원 이하 한식", "추천 결과")
+    assert cache.get("시청 한식 3만원 이하 맛집") == "추천 결과"
+    assert cache.get("시청 일식 3만원 이하 맛집") is None
+
+
+def test_admits_prefilters_candidates():
+    """예산과 음식 종류에 맞지 않는 후보를 제외하는지 테스트"""
+    intent = parse_request_intent("광화문 3만원 이하 한식")
+    assert intent.admits({"name": "국밥집", "price": 12000, "category": "한식 국밥"})
+    assert not intent.admits({"name": "비싼집", "price": 50000})
+    assert not intent.admits({"name": "초밥집", "price": 20000, "category": "일식 초밥"})
+    # 정보가 없으면 제외하지 않음
+    assert intent.admits({"name": "모르는집", "price": float("nan")})
+
+
+def test_distance_condition_with_suffix():
+    """'500m이내', '1km이내'처럼 붙여 쓴 거리 조건이 반경으로 해석되고 키워드에 남지 않는지 테스트"""
+    intent = parse_request_intent("강남역 500m이내 고기집")
+    assert intent.radius_m == 500
+    assert intent.keywords == ("고기집",)
+
+    intent = parse_request_intent("광화문 1km이내 한식")
+    assert intent.radius_m == 1000
+    assert intent.keywords == ()
+    assert intent_cache_key("광화문 1km이내 한식") == intent_cache_key("광화문 1km 이내 한식")
+
+
+def test_attached_budget_and_particle_like_endings():
+    """붙여 쓴 예산 조건, '1인당', 조사와 같은 글자로 끝나는 음식 이름이 키워드를 나누지 않는지 테스트"""
+    spaced = intent_cache_key("광화문 3만원 이하 한식")
+    assert intent_cache_key("광화문 3만원이하 한식") == spaced
+    assert intent_cache_key("광화문 1인당 3만원 이하 한식") == spaced
+    assert parse_request_intent("시청 2만원정도 국밥").keywords == ("국밥",)
+    assert parse_request_intent("광화문 1인당 3만원").keywords == ()
+
+    intent = parse_request_intent("광화문 떡볶이 맛집")
+    assert intent.cuisines == ("분식",)
+    assert intent.keywords == ("떡볶이",)
+    assert intent.topic() == "광화문 분식 떡볶이"
+    assert parse_request_intent("광화문 떡볶이가 맛있는 곳").keywords[0] == "떡볶이"
@@ -0,0 +1,81 @@
+"""
+리서치 결과 압축 테스트
+맛집별 사실 중복 제거, 평가에 쓰이지 않는 내용 제거, 토큰 예산 적용을 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.research_compactor import ResearchCompactor, estimate_tokens
+
+RESEARCH_OUTPUT = """검색 결과를 바탕으로 광화문 근처 한식 맛집을 정리했습니다.
+
+### 1. **깡장집 본점** - 한식
+- 주소: 서울 종로구 새문안로5길 13
+- 주소: 서울 종로구 새문안로5길 13 (광화문역 도보 5분)
+- 전화번호: 02-123-4567
+- 평점: 4.2 (네이버 리뷰 1,234개)
+- 가격대: 1인 9,000원
+- 리뷰 요약: 정말 맛있어요! 반찬도 많이 나오고 직원분들이 친절해요. 점심시간엔 줄이 길어요.
+
+### 2. **오빠닭 광화문점**
+오빠닭은 치킨집으로 평점 3.8, 가격 18,000원 정도이며 리뷰 320개가 있습니다.
+
+## 결론
+모두 좋은 곳입니다.
+"""
+
+
+def test_compact_dedupes_and_drops_chatter():
+    """중복 주소, 리뷰 원문, 검색 과정 설명이 제거되는지 테스트"""
+    compacted, stats = ResearchCompactor().compact(RESEARCH_OUTPUT)
+
+    assert compacted.count("새문안로5길 13") == 1
+    assert "리뷰 요약" not in compacted
+    assert "검색 결과를 바탕으로" not in compacted
+    assert "결론" not in compacted
+    assert "## 오빠닭 광화문점" in compacted
+    assert "- 가격: 18,000원" in compacted
+
+    assert stats["compacted"] is True
+    assert stats["candidates"] == 2
+    assert stats["output_tokens"] < stats["input_tokens"]
+
+
+def test_token_budget_per_candidate():
+    """맛집별 토큰 예산을 넘는 항목은 우선순위가 낮은 것부터 제외되는지 테스트"""
+    compactor = ResearchCompactor(token_budget_per_candidate=25)
+    compacted, _ = compactor.compact(RESEARCH_OUTPUT)
+
+    for block in compacted.split("\n\n"):
+        assert estimate_tokens(block) <= 25
+    # 평가 기준 항목(평점)이 전화번호보다 먼저 유지됨
+    assert "- 평점: 4.2" in compacted
+    assert "02-123-4567" not in compacted
+
+
+def test_unstructured_text_is_left_unchanged():
+    """맛집 단위를 찾을 수 없는 텍스트는 원문을 유지하는지 테스트"""
+    text = "검색 결과가 충분하지 않아 추천할 맛집을 찾지 못했습니다."
+    compacted, stats = ResearchCompactor().compact(text)
+    assert compacted == text
+    assert stats["compacted"] is False
+
+
+def test_numbered_headings_and_review_prose():
+    """'### 1. 이름', '**1. 이름**' 제목의 순번을 떼고, 리뷰 원문은 리뷰 수로 쓰지 않는지 테스트"""
+    text = """### 1. 깡장집 본점
+- 평점: 4.2
+- 리뷰: 최근 리뷰에서 반찬이 좋다는 평
+
+**2. 토속촌**
+- 평점: 4.5
+- 리뷰: 1,234개
+"""
+    candidates = ResearchCompactor().extract_candidates(text)
+    assert set(candidates) == {"깡장집 본점", "토속촌"}
+    assert "review_count" not in candidates["깡장집 본점"]
+    assert candidates["토속촌"]["review_count"] == "1,234개"
@@ -0,0 +1,100 @@
+"""
+리서치 완성도 모니터 테스트
+도구 결과 누적, 필요한 항목을 갖춘 후보 수 계산, 목표 도달 시 검색 도구의 최종 답변 안내를 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.research_compactor import ResearchCompactor
+from src.research_monitor import ResearchCompletenessMonitor, search_result_text
+from src.search_tools import CachedSerperDevTool
+
+
+def _result(*items):
+    return {"organic": [{"title": title, "link": "http://x", "snippet": snippet} for title, snippet in items]}
+
+
+def _monitor(target=2):
+    return ResearchCompletenessMonitor(ResearchCompactor(), target_candidates=target)
+
+
+def test_search_result_text_uses_restaurant_part_of_title():
+    """검색 결과 제목의 사이트명을 떼고 맛집별 구간으로 변환하는지 테스트"""
+    text = search_result_text(_result(("깡장집 본점 - 네이버 플레이스", "평점 4.2")))
+    assert text.startswith("## 깡장집 본점\n평점 4.2")
+    assert search_result_text("카탈로그 결과") == "카탈로그 결과"
+
+
+def test_candidates_complete_across_tool_results():
+    """여러 도구 결과에 나뉜 항목을 후보별로 합쳐 목표 수에 도달하면 멈추는지 테스트"""
+    monitor = _monitor(target=2)
+    monitor.start(max_iterations=3)
+
+    assert not monitor.observe(_result(
+        ("깡장집 본점 | 블로그", "평점 4.2 가격 9,000원"),
+        ("토속촌", "평점 4.5 가격 20,000원 서울 종로구 자하문로5길 5"),
+    ))
+    assert list(monitor.complete_candidates()) == ["토속촌"]
+
+    assert monitor.observe(_result(("깡장집본점", "서울 종로구 새문안로 35 위치")))
+    assert set(monitor.complete_candidates()) == {"깡장집 본점", "토속촌"}
+    assert "새문안로 35" in monitor.complete_candidates()["깡장집 본점"]["address"]
+
+    summary = monitor.finish()
+    assert summary["stopped_early"] and summary["iterations_used"] == 2 and summary["iterations_skipped"] == 1
+    assert monitor.finish() is None
+
+
+def test_inactive_monitor_ignores_results():
+    """start하지 않은 실행(시스템이 직접 검색하는 단계)의 결과는 세지 않는지 테스트"""
+    monitor = _monitor(target=1)
+    assert not monitor.observe(_result(("토속촌", "평점 4.5 가격 20,000원 서울 종로구 자하문로5길 5")))
+    assert monitor.iterations == 0
+
+
+def test_listing_titles_and_mixed_labels_are_not_candidates():
+    """목록/블로그 글 제목은 후보로 세지 않고, 한 줄에 이어 쓴 라벨 값이 섞이지 않는지 테스트"""
+    listing = _result(
+        ("광화문 맛집 BEST 10 - 네이버 블로그", "주소: 서울 종로구 세종대로 172 평점: 4.5 가격: 12,000원"),
+        ("종로 점심 추천 5곳", "주소: 서울 종로구 종로 1 평점: 4.3 가격: 9,000원"),
+        ("TOP 7 을지로 노포 | 블로그", "주소: 서울 중구 을지로 3 평점: 4.1 가격: 10,000원"),
+    )
+    assert search_result_text(listing) == ""
+
+    monitor = _monitor(target=1)
+    monitor.start(max_iterations=3)
+    assert not monitor.observe(listing)
+    assert not monitor.complete_candidates()
+
+    assert monitor.observe(_result(("토속촌", "주소: 서울 종로구 자하문로5길 5 평점: 4.5 가격: 20,000원")))
+    facts = monitor.complete_candidates()["토속촌"]
+    assert "평점" not in facts["address"] and "가격" not in facts["address"]
+
+
+def test_search_tool_asks_researcher_to_answer_when_complete():
+    """목표 도달 시 검색 결과와 함께 최종 답변 작성을 안내하고, 이후 검색은 실행하지 않는지 테스트"""
+    class FakeSearch:
+        calls = 0
+
+        def run(self, search_query=None, **kwargs):
+            FakeSearch.calls += 1
+            return _result(("토속촌", "평점 4.5 가격 20,000원 서울 종로구 자하문로5길 5"))
+
+    monitor = _monitor(target=1)
+    tool = CachedSerperDevTool(search_tool=FakeSearch(), monitor=monitor)
+    assert tool.run(search_query="종로 맛집") == _result(("토속촌", "평점 4.5 가격 20,000원 서울 종로구 자하문로5길 5"))
+
+    monitor.start(max_iterations=3)
+    answer = tool.run(search_query="종로 맛집")
+    # 검색 결과는 그대로 전달하고 최종 답변은 리서처가 작성
+    assert answer.startswith(str(_result(("토속촌", "평점 4.5 가격 20,000원 서울 종로구 자하문로5길 5"))))
+    assert "Final Answer" in answer and "토속촌" in answer.split("[리서치 완료]")[1]
+
+    assert tool.run(search_query="종로 맛집 더") == monitor.notice()
+    assert FakeSearch.calls == 2
+    summary = monitor.finish()
+    assert summary["iterations_used"] == 1 and summary["searches_skipped"] == 1
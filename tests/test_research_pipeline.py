@@ -0,0 +1,48 @@
+"""
+2단계 리서치 파이프라인 테스트
+후보 이름 파싱과 후보별 동시 상세 정보 수집, 후보별 제한 시간을 테스트합니다.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.research_pipeline import CandidateEnricher, parse_candidate_names
+
+
+def test_parse_candidate_names_json():
+    """JSON 배열 응답에서 후보 이름을 추출하는지 테스트"""
+    text = '후보 목록입니다:\n["깡장집 본점", {"name": "오빠닭 광화문점"}, "깡장집 본점"]'
+    assert parse_candidate_names(text) == ["깡장집 본점", "오빠닭 광화문점"]
+
+
+def test_parse_candidate_names_list_fallback():
+    """JSON이 아닌 목록 형식 응답도 처리하는지 테스트"""
+    text = "1. **깡장집 본점** - 한식\n2. 오빠닭 광화문점 (치킨)\n- 한우마을: 소고기"
+    assert parse_candidate_names(text, max_candidates=2) == ["깡장집 본점", "오빠닭 광화문점"]
+
+
+def test_enrich_per_candidate_timeout():
+    """느린 후보 하나가 다른 후보의 결과를 지연시키지 않는지 테스트"""
+    enricher = CandidateEnricher(max_workers=3, timeout_seconds=0.2)
+
+    def search(query):
+        if "느린식당" in query:
+            time.sleep(1.0)
+        return {"organic": [{"title": query, "snippet": "평점 4.5", "link": "http://example.com"}]}
+
+    start = time.time()
+    enriched = enricher.enrich(["깡장집 본점", "느린식당", "오빠닭 광화문점"], search, area="광화문")
+    elapsed = time.time() - start
+
+    statuses = {c["name"]: c["status"] for c in enriched}
+    assert statuses == {"깡장집 본점": "ok", "느린식당": "timeout", "오빠닭 광화문점": "ok"}
+    assert elapsed < 0.6
+    assert len(enriched[0]["snippets"]) == 2
+
+    merged = enricher.format_results(enriched)
+    assert "## 후보 1: 깡장집 본점" in merged
+    assert "수집 실패: timeout" in merged
@@ -0,0 +1,62 @@
+"""
+리서치 검색 계획 테스트
+검색 쿼리 생성과 동시 실행, 제한 시간 처리를 테스트합니다.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.research_planner import ParallelSearchPlanner
+
+
+def test_plan_covers_all_purposes():
+    """요청이 목록/리뷰/메뉴/가격/영업시간 검색어로 나뉘는지 테스트"""
+    planner = ParallelSearchPlanner()
+    queries = planner.plan("광화문 근처 3만원 이하의 한식 맛집을 찾아줘")
+
+    purposes = [q["purpose"] for q in queries]
+    assert purposes == ["listing", "reviews", "menus", "prices", "hours"]
+    assert all("광화문 한식" in q["query"] for q in queries)
+    assert "3만원 이하" in queries[3]["query"]
+
+
+def test_execute_runs_concurrently():
+    """검색이 동시에 실행되어 순차 실행보다 빠른지 테스트"""
+    planner = ParallelSearchPlanner(max_workers=5)
+    queries = planner.plan("강남역 일식")
+
+    def slow_search(query):
+        time.sleep(0.1)
+        return {"organic": [{"title": query, "snippet": "정보", "link": "http://example.com"}]}
+
+    start = time.time()
+    results = planner.execute(queries, slow_search)
+    elapsed = time.time() - start
+
+    assert all(r["status"] == "ok" for r in results)
+    assert elapsed < 0.1 * len(queries) * 0.6
+    assert "### [listing]" in planner.format_results(results)
+
+
+def test_execute_timeout_and_error():
+    """제한 시간 초과와 오류가 전체 결과를 막지 않는지 테스트"""
+    planner = ParallelSearchPlanner(max_workers=5, timeout_seconds=0.1)
+    queries = [
+        {"purpose": "fast", "query": "빠른 검색"},
+        {"purpose": "slow", "query": "느린 검색"},
+        {"purpose": "broken", "query": "오류 검색"},
+    ]
+
+    def search(query):
+        if query == "느린 검색":
+            time.sleep(0.5)
+        if query == "오류 검색":
+            raise RuntimeError("검색 실패")
+        return {"organic": []}
+
+    statuses = {r["purpose"]: r["status"] for r in planner.execute(queries, search)}
+    assert statuses == {"fast": "ok", "slow": "timeout", "broken": "error"}
@@ -0,0 +1,83 @@
+"""
+리서치 웜 스타트 테스트
+지역별 후보 집합 저장, 유효 기간, 새 후보/변경 정보 병합을 테스트합니다.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.request_intent import parse_request_intent
+from src.research_snapshots import ResearchSnapshotStore
+from src.restaurant_catalog import RestaurantCatalog
+
+RESEARCH_OUTPUT = """광화문 한식 맛집 조사 결과입니다.
+
+### 1. **깡장집 본점**
+- 주소: 서울 종로구 새문안로5길 13
+- 평점: 4.2
+- 가격대: 9,000원
+
+### 2. **청계 국밥**
+- 평점: 4.1
+- 가격대: 10,000원
+
+### 3. **한우마을**
+- 평점: 4.8
+- 가격대: 45,000원
+"""
+
+DELTA_OUTPUT = """### 깡장집
+- 평점: 4.4
+
+### 광화문 백반
+- 평점: 4.0
+- 가격대: 8,000원
+"""
+
+INTENT = parse_request_intent("광화문 근처 한식 맛집")
+
+
+def test_snapshot_roundtrip_and_expiry():
+    """리서치 결과로 만든 스냅샷이 같은 지역/음식 종류에만 제공되고 오래되면 제외되는지 테스트"""
+    store = ResearchSnapshotStore(RestaurantCatalog(), max_age_seconds=60)
+    assert store.load(INTENT) is None
+    assert store.record_research(INTENT, RESEARCH_OUTPUT) == 3
+
+    known = store.load(parse_request_intent("광화문역 한식 추천해줘"))
+    assert list(known) == ["깡장집 본점", "청계 국밥", "한우마을"]
+    assert store.load(parse_request_intent("광화문 일식 맛집")) is None
+    assert "## 깡장집 본점" in store.format_known(known)
+
+    store.catalog.execute("UPDATE research_snapshots SET updated_at = ?", (time.time() - 3600,))
+    assert store.load(INTENT) is None
+
+
+def test_merge_delta_into_snapshot():
+    """새 후보는 추가하고 바뀐 항목만 갱신하여 저장하는지 테스트"""
+    store = ResearchSnapshotStore(RestaurantCatalog())
+    store.record_research(INTENT, RESEARCH_OUTPUT)
+    known = store.load(INTENT)
+
+    merged, delta = store.merge(INTENT, known, DELTA_OUTPUT)
+    assert delta == {"new": ["광화문 백반"], "changed": {"깡장집 본점": ["rating"]}}
+    assert merged["깡장집 본점"]["rating"] == "4.4"
+    assert merged["깡장집 본점"]["address"] == "서울 종로구 새문안로5길 13"
+    assert store.load(INTENT) == merged
+
+    # 변경이 없으면 알려진 후보 그대로
+    unchanged, delta = store.merge(INTENT, merged, "변경 없음")
+    assert unchanged == merged
+    assert delta == {"new": [], "changed": {}}
+
+
+def test_snapshot_keeps_recent_candidates():
+    """스냅샷이 최근 후보 max_candidates개만 유지하는지 테스트"""
+    store = ResearchSnapshotStore(RestaurantCatalog(), max_candidates=2)
+    store.record_research(INTENT, RESEARCH_OUTPUT)
+    assert store.load(INTENT) is None
+    store.min_candidates = 2
+    assert list(store.load(INTENT)) == ["청계 국밥", "한우마을"]
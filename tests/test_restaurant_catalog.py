@@ -0,0 +1,131 @@
+"""
+로컬 맛집 카탈로그 테스트
+저장/병합, FTS5 전문 검색, 오래된 항목 판단, 카탈로그 검색 도구를 테스트합니다.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.restaurant_catalog import RestaurantCatalog
+from src.restaurant_models import Restaurant
+from src.research_pipeline import CandidateEnricher
+from src.search_tools import CachedSerperDevTool, LocalCatalogSearchTool
+
+
+def _full(rank, name, **overrides):
+    data = dict(address="서울 종로구 세종대로 1", phone="02-123-4567", rating="4.5", price="9,000원",
+                menu="된장찌개", hours="11:00-21:00", url="http://example.com", category="한식")
+    data.update(overrides)
+    return Restaurant(rank=rank, name=name, **data)
+
+
+def test_record_merges_fields(tmp_path):
+    """같은 맛집을 다시 저장하면 빈 항목은 기존 값을 유지하고 새 항목만 갱신되는지 테스트"""
+    db_file = str(tmp_path / "catalog.db")
+    RestaurantCatalog(db_file=db_file).record([Restaurant(1, "깡장집 본점", menu="된장찌개", rating="4.2")], "광화문")
+    catalog = RestaurantCatalog(db_file=db_file)
+    catalog.record([Restaurant(1, "깡장집  본점", phone="02-123-4567", rating="4.5")], "광화문")
+
+    entry = catalog.find("깡장집 본점", "광화문")
+    assert entry["menu"] == "된장찌개"
+    assert entry["phone"] == "02-123-4567"
+    assert entry["rating"] == "4.5"
+    assert catalog.get_stats()["entries"] == 1
+
+
+def test_fulltext_search_by_name_menu_area():
+    """이름, 메뉴, 지역으로 검색되는지 테스트 (단어 접두 일치)"""
+    catalog = RestaurantCatalog()
+    catalog.record([_full(1, "깡장집 본점"), _full(2, "오빠닭 광화문점", menu="치킨, 닭강정")], "광화문")
+    catalog.record([_full(1, "스시 강남", menu="초밥")], "강남역")
+
+    assert [e["name"] for e in catalog.search("닭강정")] == ["오빠닭 광화문점"]
+    assert [e["name"] for e in catalog.search("깡장집")] == ["깡장집 본점"]
+    assert {e["name"] for e in catalog.search("광화문")} == {"깡장집 본점", "오빠닭 광화문점"}
+    assert catalog.search("초밥", area="광화문") == []
+    assert catalog.search("") == []
+
+
+def test_stale_and_missing_fields():
+    """오래된 항목과 비어 있는 필수 항목이 표시되는지 테스트"""
+    catalog = RestaurantCatalog(stale_after_seconds=60)
+    catalog.record([_full(1, "깡장집 본점"), Restaurant(2, "한우마을", menu="한우")], "광화문")
+
+    complete = catalog.find("깡장집 본점", "광화문")
+    partial = catalog.find("한우마을", "광화문")
+    assert RestaurantCatalog.is_complete(complete)
+    assert not RestaurantCatalog.is_complete(partial)
+    assert "hours" in partial["missing"]
+    assert "정보 없음" in RestaurantCatalog.format_entries([partial])
+
+    stale = RestaurantCatalog(stale_after_seconds=60)
+    stale.record([_full(1, "깡장집 본점")], "광화문")
+    stale.execute("UPDATE restaurants SET last_seen = ?", (time.time() - 3600,))
+    assert stale.find("깡장집 본점")["stale"]
+    assert not RestaurantCatalog.is_complete(stale.find("깡장집 본점"))
+
+
+def test_unverified_results_do_not_refresh_last_seen():
+    """웹 검색으로 다시 확인하지 않은 맛집(카탈로그/순위 뷰 결과)은 마지막 확인 시각이 갱신되지 않는지 테스트"""
+    catalog = RestaurantCatalog(stale_after_seconds=60)
+    catalog.record([_full(1, "깡장집 본점"), _full(2, "한우마을")], "광화문")
+    catalog.execute("UPDATE restaurants SET last_seen = ?", (time.time() - 3600,))
+
+    catalog.record([_full(1, "깡장집 본점"), _full(2, "한우마을")], "광화문", verified=["깡장집본점"])
+    assert not catalog.find("깡장집 본점")["stale"]
+    assert catalog.find("한우마을")["stale"]
+
+    # 확인되지 않은 새 맛집은 오래된 항목으로 저장
+    catalog.record([_full(3, "청계 국밥")], "광화문", verified=[])
+    assert catalog.find("청계 국밥")["stale"]
+    assert "마지막 확인: 없음" in RestaurantCatalog.format_entries([catalog.find("청계 국밥")])
+
+
+def test_search_tool_verified_names():
+    """이번 실행의 웹 검색 결과 제목/스니펫에 나온 맛집만 확인된 것으로 보는지 테스트"""
+    class FakeSearch:
+        def run(self, search_query=None, **kwargs):
+            return {"searchParameters": {"q": search_query},
+                    "organic": [{"title": "깡장집 본점 - 네이버 플레이스", "snippet": "평점 4.2", "link": "http://x"}]}
+
+    tool = CachedSerperDevTool(search_tool=FakeSearch())
+    tool.begin_run()
+    tool.run(search_query="한우마을 광화문")
+    assert tool.verified_names(["깡장집 본점", "한우마을"]) == {"깡장집 본점"}
+    tool.begin_run()
+    assert tool.verified_names(["깡장집 본점"]) == set()
+
+
+def test_has_fresh_area():
+    """지역별 최신 항목 수로 목록 검색 생략 여부를 판단하는지 테스트"""
+    catalog = RestaurantCatalog(min_area_entries=2)
+    catalog.record([_full(1, "깡장집 본점")], "광화문")
+    assert not catalog.has_fresh_area("광화문")
+    catalog.record([_full(2, "한우마을")], "광화문")
+    assert catalog.has_fresh_area("광화문")
+    assert not catalog.has_fresh_area(None)
+
+
+def test_to_enriched_feeds_scoring():
+    """카탈로그 항목이 점수화 엔진 입력으로 변환되는지 테스트"""
+    catalog = RestaurantCatalog()
+    catalog.record([_full(1, "깡장집 본점")], "광화문")
+    candidates = CandidateEnricher.to_candidates([RestaurantCatalog.to_enriched(catalog.find("깡장집 본점"))])
+
+    assert candidates[0]["rating"] == 4.5
+    assert candidates[0]["price"] == 9000
+    assert candidates[0]["link"] == "http://example.com"
+
+
+def test_catalog_tool():
+    """카탈로그 검색 도구가 결과 또는 웹 검색 안내를 반환하는지 테스트"""
+    catalog = RestaurantCatalog()
+    catalog.record([_full(1, "깡장집 본점")], "광화문")
+    tool = LocalCatalogSearchTool(catalog)
+
+    assert "깡장집 본점" in tool.run(search_query="광화문 된장찌개")
+    assert "웹 검색" in tool.run(search_query="부산 돼지국밥")
@@ -0,0 +1,72 @@
+"""
+맛집 추천 결과 모델 테스트
+구조화된 출력 변환과 마크다운 대체 파싱, 보고서 되읽기를 테스트합니다.
+"""
+
+import sys
+import json
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.restaurant_models import (
+    Restaurant, RecommendationOutput, restaurants_from_output,
+    parse_recommendation_markdown, render_recommendations
+)
+
+
+def test_restaurant_is_slotted():
+    """Restaurant 레코드가 __slots__를 사용하는지 테스트"""
+    restaurant = Restaurant(rank=1, name="깡장집 본점")
+    assert not hasattr(restaurant, "__dict__")
+    assert restaurant.label == "[1위] 깡장집 본점"
+
+
+def test_structured_output_to_restaurants():
+    """스키마 검증된 출력과 JSON 본문이 순위대로 변환되는지 테스트"""
+    output = RecommendationOutput.model_validate({
+        "summary": "요약",
+        "restaurants": [
+            {"rank": 2, "name": "오빠닭 광화문점", "price": "9,000원"},
+            {"rank": 1, "name": "깡장집 본점", "rating": "4.2"},
+        ]
+    })
+    restaurants = restaurants_from_output(output)
+    assert [r.name for r in restaurants] == ["깡장집 본점", "오빠닭 광화문점"]
+    assert restaurants[1].price == "9,000원"
+
+    raw = "Final Answer: " + json.dumps(output.model_dump(), ensure_ascii=False)
+    assert restaurants_from_output(raw) == restaurants
+
+
+def test_markdown_fallback_handles_format_drift():
+    """제목/라벨 표기가 달라도 맛집 목록을 추출하는지 테스트"""
+    text = """🍽️ 추천 맛집 리스트
+
+**[1위] 깡장집 본점**
+📍 주소: 서울 종로구 새문안로 1
+⭐ 평점: 4.2
+🔗 URL: [네이버](https://example.com/a)
+
+### 2위: 오빠닭 광화문점
+- **주소**: 서울 종로구 2
+- 가격: 9,000원
+
+[3위] 한우마을
+📞 전화번호: 02-123-4567
+"""
+    restaurants = parse_recommendation_markdown(text)
+    assert [(r.rank, r.name) for r in restaurants] == [(1, "깡장집 본점"), (2, "오빠닭 광화문점"), (3, "한우마을")]
+    assert restaurants[0].url == "https://example.com/a"
+    assert restaurants[1].price == "9,000원"
+    assert restaurants[2].phone == "02-123-4567"
+
+
+def test_render_round_trip():
+    """렌더링한 보고서를 다시 읽으면 같은 목록이 되는지 테스트 (캐시된 결과 재사용)"""
+    restaurants = [
+        Restaurant(rank=1, name="깡장집 본점", address="서울 종로구", rating="4.2", reason="가성비: 좋음"),
+        Restaurant(rank=2, name="오빠닭 광화문점", price="9,000원", category="치킨"),
+    ]
+    assert parse_recommendation_markdown(render_recommendations(restaurants, "요약")) == restaurants
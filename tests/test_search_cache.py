@@ -0,0 +1,93 @@
+"""
+검색 결과 캐시 저장소 테스트
+SQLite 저장, TTL, 빈 결과 캐싱, 실행 단위 중복 제거를 테스트합니다.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.search_cache import SearchResultStore
+
+
+class FakeSearch:
+    """호출 횟수를 기록하는 가짜 검색 함수"""
+
+    def __init__(self, result=None, delay: float = 0.0):
+        self.calls = 0
+        self.result = result
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, query):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.result is not None:
+            return self.result
+        return {"organic": [{"title": query, "snippet": "맛집 정보" * 20}]}
+
+
+def test_persistent_hit(tmp_path):
+    """저장된 검색 결과가 새 저장소 인스턴스에서도 재사용되는지 테스트"""
+    db_file = str(tmp_path / "search_cache.db")
+    search = FakeSearch()
+
+    SearchResultStore(db_file=db_file).fetch("깡장집 본점 리뷰", search)
+    store = SearchResultStore(db_file=db_file)
+    result = store.fetch("깡장집 본점 리뷰", search)
+
+    assert search.calls == 1
+    assert result["organic"][0]["title"] == "깡장집 본점 리뷰"
+    assert store.get_stats()["bytes_saved"] > 0
+
+
+def test_ttl_rules():
+    """쿼리 키워드에 따라 TTL이 달라지는지 테스트"""
+    store = SearchResultStore(default_ttl_seconds=100, ttl_rules={"리뷰": 10, "메뉴": 50})
+    assert store.ttl_for("광화문 한식 맛집") == 100
+    assert store.ttl_for("깡장집 메뉴 리뷰") == 10
+
+
+def test_keys_follow_query_text():
+    """표기 차이만 있는 쿼리는 같은 키, 지역이 다른 쿼리는 다른 키를 사용하는지 테스트"""
+    store = SearchResultStore()
+    assert store.make_key("강남역 맛집 추천") == store.make_key("강남역  맛집")
+    assert store.make_key("역삼역 맛집") != store.make_key("강남역 맛집")
+    assert store.make_key("광화문 국밥 맛집") != store.make_key("광화문 국밥 맛집 리뷰")
+
+
+def test_negative_caching():
+    """빈 결과가 짧은 TTL로 캐싱되는지 테스트"""
+    store = SearchResultStore(negative_ttl_seconds=0.01)
+    search = FakeSearch(result={"organic": []})
+
+    store.fetch("존재하지 않는 식당", search)
+    store.begin_run()
+    store.fetch("존재하지 않는 식당", search)
+    assert search.calls == 1
+    assert store.get_stats()["negative_hits"] == 1
+
+    time.sleep(0.02)
+    store.begin_run()
+    store.fetch("존재하지 않는 식당", search)
+    assert search.calls == 2
+
+
+def test_concurrent_dedup():
+    """같은 실행 안에서 동시에 들어온 동일 쿼리가 한 번만 검색되는지 테스트"""
+    store = SearchResultStore()
+    search = FakeSearch(delay=0.05)
+
+    threads = [threading.Thread(target=store.fetch, args=("광화문 한식 맛집", search)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert search.calls == 1
+    assert store.get_stats()["dedup_hits"] == 4
@@ -0,0 +1,77 @@
+"""
+검색 결과 후처리 테스트
+불필요한 필드 제거와 BM25 관련도 기반 상위 문단 선택을 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.search_filter import BM25Scorer, SearchResultFilter, tokenize
+from src.search_tools import CachedSerperDevTool
+
+SERPER_RESULT = {
+    "searchParameters": {"q": "광화문 한식 맛집", "type": "search"},
+    "knowledgeGraph": {
+        "title": "광화문", "type": "지역",
+        "description": "서울 종로구 세종로에 있는 경복궁의 정문",
+        "attributes": {"건축": "1395년"}
+    },
+    "organic": [
+        {"title": "광화문 역사", "link": "http://a", "snippet": "광화문은 조선 시대 경복궁의 정문으로 역사가 깊다",
+         "position": 1, "sitelinks": [{"title": "연혁", "link": "http://a/1"}]},
+        {"title": "광화문 한식 맛집 깡장집", "link": "http://b",
+         "snippet": "광화문 한식 맛집 깡장집 본점 된장찌개 9,000원 평점 4.5 " + "반찬이 맛있어요 " * 3, "position": 2},
+        {"title": "서울 날씨", "link": "http://c", "snippet": "오늘 서울은 맑음", "position": 3},
+        {"title": "종로 한식당 추천", "link": "http://d", "snippet": "광화문역 근처 한식당 백반 맛집 모음", "position": 4},
+    ],
+    "peopleAlsoAsk": [{"question": "광화문은 언제 지어졌나요?", "snippet": "1395년", "title": "q", "link": "http://e"}],
+    "relatedSearches": [{"query": "광화문 카페"}],
+    "credits": 1,
+}
+
+
+class FakeSearch:
+    def __init__(self):
+        self.calls = 0
+
+    def run(self, search_query=None, **kwargs):
+        self.calls += 1
+        return SERPER_RESULT
+
+
+def test_bm25_prefers_matching_documents():
+    """질의 단어가 많이 등장하는 문서의 점수가 높은지 테스트"""
+    docs = [tokenize("광화문 한식 맛집 된장찌개"), tokenize("서울 날씨 맑음")]
+    scores = BM25Scorer().score(tokenize("광화문 한식"), docs)
+    assert scores[0] > scores[1] == 0.0
+
+
+def test_filter_keeps_top_k_relevant_passages():
+    """불필요한 필드가 제거되고 관련 문단만 남는지 테스트"""
+    result_filter = SearchResultFilter(top_k=2, max_snippet_chars=60)
+    trimmed, stats = result_filter.process(SERPER_RESULT, "광화문 한식 맛집", context="광화문 한식")
+
+    assert set(trimmed) == {"organic"}
+    titles = [p["title"] for p in trimmed["organic"]]
+    assert titles == ["광화문 한식 맛집 깡장집", "종로 한식당 추천"]
+    assert all(set(p) == {"title", "link", "snippet"} for p in trimmed["organic"])
+    assert len(trimmed["organic"][0]["snippet"]) <= 61
+
+    assert stats["kept"] == 2
+    assert stats["total"] == 5
+    assert stats["output_tokens"] < stats["input_tokens"] / 2
+
+
+def test_tool_filters_after_cache():
+    """도구가 캐시 없이도 후처리를 적용하는지 테스트"""
+    search = FakeSearch()
+    tool = CachedSerperDevTool(search_tool=search, result_filter=SearchResultFilter(top_k=1))
+    tool.begin_run("광화문 근처 3만원 이하 한식 맛집")
+
+    result = tool.run(search_query="광화문 맛집")
+    assert search.calls == 1
+    assert [p["link"] for p in result["organic"]] == ["http://b"]
+    assert tool.get_stats() == {}
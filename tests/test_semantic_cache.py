@@ -0,0 +1,64 @@
+"""
+의미 기반 추천 캐시 테스트
+유사 요청 적중, 다른 요청 구분, 디스크 영속화, 대규모 인덱스 조회를 테스트합니다.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.semantic_cache import SemanticRecommendationCache
+
+
+def test_paraphrase_hit():
+    """표현만 다른 요청이 캐시에 적중하는지 테스트"""
+    cache = SemanticRecommendationCache(similarity_threshold=0.9)
+    cache.put("광화문 한식 3만원 이하 추천해줘", "추천 결과")
+
+    match = cache.lookup("광화문 근처 3만원 이하의 한식 맛집을 찾아줘")
+    assert match is not None
+    assert match["result"] == "추천 결과"
+
+
+def test_different_request_miss():
+    """지역, 음식 종류, 예산이 다른 요청은 적중하지 않는지 테스트"""
+    cache = SemanticRecommendationCache(similarity_threshold=0.9)
+    cache.put("광화문 근처 3만원 이하의 한식 맛집을 찾아줘", "추천 결과")
+
+    assert cache.lookup("광화문 근처 3만원 이하의 일식 맛집을 찾아줘") is None
+    assert cache.lookup("강남역 근처 3만원 이하의 한식 맛집을 찾아줘") is None
+    assert cache.lookup("광화문 근처 2만원 이하의 한식 맛집을 찾아줘") is None
+
+
+def test_persistence(tmp_path):
+    """저널과 스냅샷이 재시작 후에도 복원되는지 테스트"""
+    cache = SemanticRecommendationCache(index_dir=str(tmp_path))
+    cache.put("광화문 한식 3만원 이하", "A")
+    cache.flush()
+    cache.put("강남역 일식 2만원 이하", "B")
+
+    reloaded = SemanticRecommendationCache(index_dir=str(tmp_path))
+    assert len(reloaded) == 2
+    assert reloaded.lookup("강남역 근처 2만원 이하의 일식 맛집")["result"] == "B"
+
+
+def test_large_index_lookup():
+    """대규모 인덱스에서도 LSH 조회가 빠르게 동작하는지 테스트"""
+    cache = SemanticRecommendationCache()
+    areas = [f"지역{i}" for i in range(500)]
+    cuisines = ["한식", "일식", "중식", "양식", "분식", "치킨", "피자", "카레"]
+    for area in areas:
+        for cuisine in cuisines:
+            cache.put(f"{area} 근처 {cuisine} 맛집", f"{area}-{cuisine}")
+    assert len(cache) > cache.EXACT_SEARCH_LIMIT
+
+    start = time.perf_counter()
+    match = cache.lookup("지역123 주변 중식 맛집 찾아줘")
+    elapsed = time.perf_counter() - start
+
+    assert match is not None
+    assert match["result"] == "지역123-중식"
+    assert elapsed < 0.5